@@ -58,8 +58,12 @@ class AudioEngine:
             maxlen=2048
         )  # Buffer to hold recent audio samples for oscilloscope
 
-    def load_track(self, file_path: str):
-        """Loads a track using librosa into a NumPy array."""
+    def load_track(self, file_path: str, load_metadata=True):
+        """Loads a track using librosa into a NumPy array.
+
+        With load_metadata=False the tags are left for the caller to read with
+        read_metadata(), and the metadata is empty until apply_metadata() is called.
+        """
         try:
             # Stop any existing playback before loading a new track
             self._ensure_stopped()
@@ -97,7 +101,10 @@ class AudioEngine:
             )
 
             # Load metadata
-            self._load_metadata(file_path)
+            if load_metadata:
+                self._load_metadata(file_path)
+            else:
+                self.metadata = {}
 
             return True
         except Exception as e:
@@ -110,6 +117,21 @@ class AudioEngine:
 
     def _load_metadata(self, file_path):
         """Load metadata from audio file using mutagen."""
+        self.apply_metadata(self.read_metadata(file_path, self.duration))
+
+    def apply_metadata(self, result):
+        """Install a result returned by read_metadata() as the current track's metadata."""
+        self.metadata, self.bitrate, self.is_vbr = result
+
+    def read_metadata(self, file_path, duration):
+        """Read a track's tags, album art and bitrate using mutagen.
+
+        Touches no engine state, so it can run on a worker thread. Returns a
+        (metadata, bitrate, is_vbr) tuple for apply_metadata().
+        """
+        metadata = {}
+        bitrate = 0
+        is_vbr = False
         try:
             audio_file = MutagenFile(file_path)
             if audio_file is not None:
@@ -161,60 +183,59 @@ class AudioEngine:
 
                 # Title - try multiple possible keys for different formats
                 title_keys = ["TIT2", "title", "\xa9nam", "TITLE", "©nam"]
-                self.metadata["title"] = safe_extract_metadata(audio_file, title_keys)
+                metadata["title"] = safe_extract_metadata(audio_file, title_keys)
 
                 # Artist - try multiple possible keys for different formats
                 artist_keys = ["TPE1", "artist", "\xa9ART", "ARTIST", "©ART"]
-                self.metadata["artist"] = safe_extract_metadata(audio_file, artist_keys)
+                metadata["artist"] = safe_extract_metadata(audio_file, artist_keys)
 
                 # Album - try multiple possible keys for different formats
                 album_keys = ["TALB", "album", "\xa9alb", "ALBUM", "©alb"]
-                self.metadata["album"] = safe_extract_metadata(audio_file, album_keys)
+                metadata["album"] = safe_extract_metadata(audio_file, album_keys)
 
                 # Album artist - try multiple possible keys for different formats
                 album_artist_keys = ["TPE2", "albumartist", "aART", "©aAR"]
-                self.metadata["album_artist"] = safe_extract_metadata(
+                metadata["album_artist"] = safe_extract_metadata(
                     audio_file, album_artist_keys
                 )
 
                 # Extract embedded album art
-                self.metadata["album_art"] = self._extract_album_art(audio_file)
+                metadata["album_art"] = self._extract_album_art(audio_file)
 
                 # Duration is already calculated from the audio data
-                self.metadata["duration"] = self.duration
+                metadata["duration"] = duration
 
                 # Bitrate and other technical info
                 if hasattr(audio_file, "info"):
                     info = audio_file.info
-                    self.bitrate = (
+                    bitrate = (
                         int(getattr(info, "bitrate", 0) / 1000)
                         if hasattr(info, "bitrate")
                         else 0
                     )
                     # Check if VBR (some formats might not have this info)
-                    self.is_vbr = (
-                        getattr(info, "bitrate_mode", 0) != 0
-                    )  # Placeholder logic
+                    is_vbr = getattr(info, "bitrate_mode", 0) != 0  # Placeholder logic
             else:
                 # Fallback for formats not supported by mutagen
-                self.metadata = {
+                metadata = {
                     "title": "Unknown",
                     "artist": "Unknown",
                     "album": "Unknown",
                     "album_artist": "Unknown",
                     "album_art": None,
-                    "duration": self.duration,
+                    "duration": duration,
                 }
         except Exception:
             # If metadata loading fails completely, use defaults
-            self.metadata = {
+            metadata = {
                 "title": "Unknown",
                 "artist": "Unknown",
                 "album": "Unknown",
                 "album_artist": "Unknown",
                 "album_art": None,
-                "duration": self.duration,
+                "duration": duration,
             }
+        return metadata, bitrate, is_vbr
 
     def play(self):
         """Starts playback in a separate thread."""
@@ -10,6 +10,7 @@ class SkinData:
     extracted_skin_dir: Optional[str] = None
     original_skin_path: Optional[str] = None
     main_bmp_path: Optional[str] = None
+    main_bmp_size: tuple[int, int] | None = None
     spec_json: Dict[str, Any] = field(default_factory=dict)
     eq_spec_json: Dict[str, Any] = field(default_factory=dict)
     playlist_spec_json: Dict[str, Any] = field(default_factory=dict)
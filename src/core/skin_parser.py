@@ -24,6 +24,10 @@ class SkinParser:
         main_bmp_full_path = self.skin_data.get_path("main.bmp")
         if main_bmp_full_path and os.path.exists(main_bmp_full_path):
             self.skin_data.main_bmp_path = main_bmp_full_path
+            # Record the main window size once so it doesn't have to be re-read
+            # from the bitmap on every skin change
+            if self.skin_data.main_bmp_size is None:
+                self._load_main_bmp_size(main_bmp_full_path)
         else:
             print(f"WARNING: main.bmp not found in {self.skin_data.extracted_skin_dir}")
 
@@ -133,6 +137,7 @@ class SkinParser:
             # Reopen after verify since verify() closes the file
             with Image.open(main_bmp_path) as img:
                 img.load()  # Read the file to be sure
+                self.skin_data.main_bmp_size = img.size
         except Exception as e:
             print(f"INFO: main.bmp is not a valid image file: {e}")
             return False
@@ -140,6 +145,16 @@ class SkinParser:
         # If main.bmp exists and is a valid image file, we consider it a valid skin
         return True
 
+    def _load_main_bmp_size(self, main_bmp_path: str):
+        """Read the (width, height) of main.bmp from its header."""
+        try:
+            from PIL import Image
+
+            with Image.open(main_bmp_path) as img:
+                self.skin_data.main_bmp_size = img.size
+        except (OSError, ValueError) as e:
+            print(f"WARNING: Could not read main.bmp size: {e}")
+
     def _load_spec_files(self):
 
         # Determine path to specs based on whether running from source or PyInstaller bundle
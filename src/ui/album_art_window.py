@@ -51,6 +51,13 @@ class AlbumArtWindow(QWidget):
         self._resize_start_pos = None
         self._resize_start_size = None
 
+        # Coalesce drag moves so snapping runs once per event-loop pass
+        self._pending_drag_pos = None
+        self._drag_snap_timer = QTimer(self)
+        self._drag_snap_timer.setSingleShot(True)
+        self._drag_snap_timer.setInterval(0)
+        self._drag_snap_timer.timeout.connect(self._apply_pending_drag)
+
         # Timer to handle resize detection
         self._resize_timer = QTimer()
         self._resize_timer.timeout.connect(self._check_resize_cursor)
@@ -638,34 +645,43 @@ class AlbumArtWindow(QWidget):
             event.accept()
             return
         elif hasattr(self, "_dragging_window") and self._dragging_window:
-            # Handle window dragging
-            new_pos = event.globalPos() - self._drag_start_position
-            self.move(new_pos)
+            # Handle window dragging; snapping is applied from a zero-interval timer so a
+            # burst of move events results in a single snap computation
+            self._pending_drag_pos = event.globalPos() - self._drag_start_position
+            if not self._drag_snap_timer.isActive():
+                self._drag_snap_timer.start()
+            event.accept()
+            return
 
-            # Check docking status and apply snapping if main window is available
-            if self.main_window:
-                window_rect = QRect(self.x(), self.y(), self.width(), self.height())
+        super().mouseMoveEvent(event)
 
-                # Get snap alignment from main window (using the window-to-window snapping logic)
-                snapped_x, snapped_y, is_snapped = (
-                    self.main_window.get_window_snap_alignment(
-                        window_rect, exclude_window=self
-                    )
-                )
+    def _apply_pending_drag(self):
+        """Move the window to the latest pending drag position, snapping to other windows."""
+        new_pos = self._pending_drag_pos
+        if new_pos is None:
+            return
+        self._pending_drag_pos = None
+        self.move(new_pos)
 
-                if is_snapped:
-                    self.move(snapped_x, snapped_y)
+        # Check docking status and apply snapping if main window is available
+        if self.main_window:
+            window_rect = QRect(self.x(), self.y(), self.width(), self.height())
 
-                # Update docked status based on proximity to main window or other docked windows
-                is_near_any = self.main_window.is_window_near_any_docked_window(
+            # Get snap alignment from main window (using the window-to-window snapping logic)
+            snapped_x, snapped_y, is_snapped = (
+                self.main_window.get_window_snap_alignment(
                     window_rect, exclude_window=self
                 )
-                self.is_docked = is_near_any
+            )
 
-            event.accept()
-            return
+            if is_snapped:
+                self.move(snapped_x, snapped_y)
 
-        super().mouseMoveEvent(event)
+            # Update docked status based on proximity to main window or other docked windows
+            is_near_any = self.main_window.is_window_near_any_docked_window(
+                window_rect, exclude_window=self
+            )
+            self.is_docked = is_near_any
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release events."""
@@ -678,6 +694,9 @@ class AlbumArtWindow(QWidget):
                 return
             elif hasattr(self, "_dragging_window") and self._dragging_window:
                 self._dragging_window = False
+                # Apply the final drag position without waiting for the timer
+                self._drag_snap_timer.stop()
+                self._apply_pending_drag()
                 event.accept()
                 return
 
@@ -5,7 +5,7 @@ import os
 
 from PySide6.QtWidgets import QApplication, QWidget
 from PySide6.QtGui import QPainter, QColor, QPainterPath, QPen
-from PySide6.QtCore import Qt, QPoint, QRect, QPointF
+from PySide6.QtCore import Qt, QPoint, QRect, QPointF, QTimer
 
 from ..core.skin_parser import SkinParser
 from ..core.sprite_manager import SpriteManager
@@ -51,6 +51,11 @@ class EqualizerWindow(QWidget):
         # Window dragging state
         self._dragging_window = False
         self._drag_start_position = QPoint()
+        self._pending_drag_pos = None
+        self._drag_snap_timer = QTimer(self)
+        self._drag_snap_timer.setSingleShot(True)
+        self._drag_snap_timer.setInterval(0)
+        self._drag_snap_timer.timeout.connect(self._apply_pending_drag)
 
         self.dragging_slider_index = -1  # -1 if no slider is being dragged
         self.slider_names = [
@@ -224,48 +229,56 @@ class EqualizerWindow(QWidget):
             self.main_window.bring_all_windows_to_foreground()
         super().focusInEvent(event)
 
-    def mouseMoveEvent(self, event):
-        if self._dragging_window:
-            # Calculate the new position
-            new_pos = event.globalPos() - self._drag_start_position
-
-            # Check for snapping with main window and other windows if main window exists
-            if self.main_window:
-                # Get the potential new rectangle for this window
-                new_rect = QRect(new_pos, self.size())
-
-                # Use the main window's window-to-window snapping algorithm
-                snap_x, snap_y, should_snap = (
-                    self.main_window.get_window_snap_alignment(
-                        new_rect, exclude_window=self
-                    )
-                )
+    def _apply_pending_drag(self):
+        """Move the window to the latest pending drag position, snapping to other windows."""
+        new_pos = self._pending_drag_pos
+        if new_pos is None:
+            return
+        self._pending_drag_pos = None
 
-                if should_snap:
-                    # Snap to the calculated position
-                    self.is_docked = True
-                    self.move(snap_x, snap_y)
-                    # Store the offset from the snapped position in case the window is un-snapped later
-                    self.docking_offset = new_pos - QPoint(snap_x, snap_y)
-                else:
-                    # Check if we're significantly far from any snapped position to un-snap
-                    # If we were previously snapped and now we're moving away from snapped position
-                    if self.is_docked:
-                        # Determine if we've moved far enough to un-snap (more than 25 pixels)
-                        current_pos = QPoint(self.x(), self.y())
-                        distance_moved = (
-                            (new_pos.x() - current_pos.x()) ** 2
-                            + (new_pos.y() - current_pos.y()) ** 2
-                        ) ** 0.5
-                        # If moved more than 25 pixels from snapped position, un-snap
-                        if distance_moved > 25:
-                            self.is_docked = False
-
-                    # If not snapping, move to the calculated position
-                    self.move(new_pos)
+        # Check for snapping with main window and other windows if main window exists
+        if self.main_window:
+            # Get the potential new rectangle for this window
+            new_rect = QRect(new_pos, self.size())
+
+            # Use the main window's window-to-window snapping algorithm
+            snap_x, snap_y, should_snap = self.main_window.get_window_snap_alignment(
+                new_rect, exclude_window=self
+            )
+
+            if should_snap:
+                # Snap to the calculated position
+                self.is_docked = True
+                self.move(snap_x, snap_y)
+                # Store the offset from the snapped position in case the window is un-snapped later
+                self.docking_offset = new_pos - QPoint(snap_x, snap_y)
             else:
-                # No main window reference, move normally
-                self.move(event.globalPos() - self._drag_start_position)
+                # Check if we're significantly far from any snapped position to un-snap
+                # If we were previously snapped and now we're moving away from snapped position
+                if self.is_docked:
+                    # Determine if we've moved far enough to un-snap (more than 25 pixels)
+                    current_pos = QPoint(self.x(), self.y())
+                    distance_moved = (
+                        (new_pos.x() - current_pos.x()) ** 2
+                        + (new_pos.y() - current_pos.y()) ** 2
+                    ) ** 0.5
+                    # If moved more than 25 pixels from snapped position, un-snap
+                    if distance_moved > 25:
+                        self.is_docked = False
+
+                # If not snapping, move to the calculated position
+                self.move(new_pos)
+        else:
+            # No main window reference, move normally
+            self.move(new_pos)
+
+    def mouseMoveEvent(self, event):
+        if self._dragging_window:
+            # Snapping is applied from a zero-interval timer so a burst of move events
+            # results in a single snap computation for the latest position
+            self._pending_drag_pos = event.globalPos() - self._drag_start_position
+            if not self._drag_snap_timer.isActive():
+                self._drag_snap_timer.start()
             return
         if self.dragging_slider_index != -1:
             self._update_slider_value_from_mouse(event.pos().y())
@@ -277,6 +290,9 @@ class EqualizerWindow(QWidget):
         if event.button() == Qt.LeftButton:
             if self._dragging_window:
                 self._dragging_window = False
+                # Apply the final drag position without waiting for the timer
+                self._drag_snap_timer.stop()
+                self._apply_pending_drag()
                 return
             # Release slider
             if self.dragging_slider_index != -1:
@@ -1,4 +1,8 @@
 import sys
+import time
+import threading
+from functools import partial
+from operator import itemgetter
 from PySide6.QtWidgets import (
     QApplication,
     QWidget,
@@ -6,8 +10,19 @@ from PySide6.QtWidgets import (
     QMenuBar,
 )
 from PySide6.QtGui import QPainter, QKeySequence, QShortcut, QAction, QFileOpenEvent
-from PySide6.QtCore import Qt, QPoint, QRect, QTimer, QDir
+from PySide6.QtCore import (
+    Qt,
+    QPoint,
+    QRect,
+    QTimer,
+    QDir,
+    QEvent,
+    QThreadPool,
+    Signal,
+)
 import os
+import re
+import stat
 
 from ..core.skin_parser import SkinParser
 from ..core.renderer import Renderer
@@ -35,6 +50,89 @@ from PySide6.QtWidgets import (
     QLineEdit,
 )
 
+# File dialog filters for audio files and skins
+_AUDIO_FILE_FILTER = "Audio Files (*.mp3 *.wav *.ogg *.flac *.m4a *.aac *.opus *.aiff *.au);;All Files (*)"
+_SKIN_FILE_FILTER = "Winamp Skins (*.wsz *.zip);;All Files (*)"
+# Extensions (without the dot) of files picked up when loading a directory
+_MEDIA_EXTENSIONS = frozenset(
+    {
+        "mp3",
+        "wav",
+        "ogg",
+        "flac",
+        "m4a",
+        "aac",
+        "wma",
+        "mp4",
+        "m3u",
+        "pls",
+        "opus",
+        "aiff",
+        "au",
+    }
+)
+# Prefixes of M3U header and metadata lines, which don't name a file
+_M3U_SKIP_PREFIXES = (b"#EXTM3U", b"#EXTINF")
+# A FileN=path entry of a PLS playlist
+_PLS_FILE_ENTRY = re.compile(r"file(\d+)=(.*)", re.IGNORECASE | re.DOTALL)
+# Clutterbar buttons from top to bottom
+_CLUTTERBAR_BUTTONS = (
+    "options",
+    "always_on_top",
+    "file_info",
+    "double_size",
+    "visualization",
+)
+# Skip per-file icon lookups and symlink resolution, which stat every entry of the
+# starting directory and can make the dialog slow to open on large or network folders
+_FILE_DIALOG_OPTIONS = (
+    QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+)
+
+
+def _read_app_version():
+    """Read the application version from the VERSION file.
+
+    Use embedded VERSION file when running frozen (PyInstaller bundles).
+    During development, read VERSION from the project root.
+    """
+    version = "0.0.0"
+    try:
+        if getattr(sys, "frozen", False):
+            # When frozen by PyInstaller, VERSION can be included in sys._MEIPASS
+            base_dir = getattr(sys, "_MEIPASS", None)
+        else:
+            # Development: read VERSION from project root
+            base_dir = os.path.dirname(
+                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            )
+        if base_dir:
+            with open(os.path.join(base_dir, "VERSION"), "r") as vf:
+                version = vf.read().strip() or version
+    except Exception:
+        pass
+    return version
+
+
+# Read once at import rather than every time the About dialog is opened
+_APP_VERSION = _read_app_version()
+
+
+def _path_kind(path):
+    """Return "file" or "dir" for an existing path, or None.
+
+    Equivalent to os.path.isfile() followed by os.path.isdir(), with a single stat.
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+    if stat.S_ISREG(mode):
+        return "file"
+    if stat.S_ISDIR(mode):
+        return "dir"
+    return None
+
 
 class PreferencesDialog(QDialog):
     def __init__(self, parent=None, preferences=None):
@@ -147,8 +245,28 @@ class SkinSelectionDialog(QDialog):
 
 
 class MainWindow(QWidget):
+    # Maps line breaks and tabs in track metadata to spaces for the Winamp font renderer
+    _METADATA_TRANSLATE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+    # Emitted from the audio thread with (position, duration); delivered on the GUI thread
+    position_changed = Signal(float, float)
+
+    # Emitted from a metadata worker with (file_path, metadata); delivered on the GUI thread
+    track_metadata_loaded = Signal(str, object)
+
+    # Emitted from a metadata worker with (file_path, read_metadata() result,
+    # read_track_metadata() result) for the track just loaded into the audio engine;
+    # delivered on the GUI thread
+    playing_track_metadata_loaded = Signal(str, object, object)
+
+    # Set once the file dialog start directories have been pre-read in the background
+    _dialog_dirs_warmed = False
+
     def __init__(self):
         super().__init__()
+        # Set once the window states have been restored from preferences. Until then,
+        # moves don't drag docked child windows along, since their positions aren't set
+        self._initialization_complete = False
         self.setWindowTitle("WimPyAmp Music Player")
 
         # Set window flags for completely borderless window
@@ -162,6 +280,56 @@ class MainWindow(QWidget):
 
         # Get user preferences
         self.preferences = get_preferences()
+        self._warm_dialog_directories()
+
+        # Main window geometry used by the docking checks; reset on move/resize
+        self._cached_main_rect = None
+        # Bounding rects of the docking targets, keyed by the excluded window
+        self._docked_union_rects = {}
+        # Docking state re-checks and position saving while the main window moves are
+        # throttled to one per _dock_recheck_timer interval
+        self._dock_recheck_timer = QTimer(self)
+        self._dock_recheck_timer.setSingleShot(True)
+        self._dock_recheck_timer.setInterval(50)
+        self._dock_recheck_timer.timeout.connect(self._recheck_dock_proximity)
+
+        # Clickable areas of the main window, built once per skin by _build_hit_rects,
+        # and a per-pixel lookup table mapping each pixel to the area that owns it
+        self._hit_rects = {}
+        self._hit_mask = bytearray()
+        self._hit_mask_width = 0
+        self._hit_mask_height = 0
+        self._hit_area_names = (None,)
+        # Names of the playback control and clutterbar buttons among the hit areas
+        self._control_names = frozenset()
+        # Click handlers for the playback control and clutterbar buttons, keyed by name
+        self._control_handlers = {
+            "previous": self._on_previous,
+            "play": self._on_play,
+            "pause": self._on_pause,
+            "stop": self._on_stop,
+            "next": self._on_next,
+            "options": self._on_options,
+            "always_on_top": self._on_always_on_top,
+            "file_info": self._on_file_info,
+            "double_size": self._on_double_size,
+            "visualization": self._on_visualization,
+        }
+
+        # Created further down; declared up front so event handlers that can run during
+        # construction only need an "is not None" check
+        self.audio_engine = None
+        self.playlist_window = None
+        self.equalizer_window = None
+        self.album_art_window = None
+        self.mac_media_integration = None
+        self.playback_timer = None
+        self.track_completion_timer = None
+        self.visualization_timer = None
+        # Child windows closed on shutdown, filled in once they have been created
+        self._tracked_windows = []
+        self._shutdown_in_progress = False
+        self._is_shutting_down = False
 
         # Load window position from preferences
         main_window_pos = self.preferences.get_main_window_position()
@@ -191,8 +359,9 @@ class MainWindow(QWidget):
         preferred_skin = self.preferences.get_current_skin()
         self.skin_path = preferred_skin if preferred_skin else self.default_skin_path
 
-        self.skin_parser = SkinParser(self.skin_path)
-        self.skin_data = self.skin_parser.parse()
+        # Parsed skins keyed by skin path, with the skin file's mtime when parsed
+        self._skin_cache = {}
+        self.skin_parser, self.skin_data = self._parse_skin(self.skin_path)
 
         # If the preferred skin failed to load, fall back to default
         if not self.skin_data.extracted_skin_dir and preferred_skin:
@@ -200,8 +369,7 @@ class MainWindow(QWidget):
                 f"WARNING: Preferred skin {preferred_skin} failed to load, falling back to default"
             )
             self.skin_path = self.default_skin_path
-            self.skin_parser = SkinParser(self.skin_path)
-            self.skin_data = self.skin_parser.parse()
+            self.skin_parser, self.skin_data = self._parse_skin(self.skin_path)
             # Remove the invalid skin from preferences
             self.preferences.set_current_skin(self.default_skin_path)
 
@@ -211,17 +379,44 @@ class MainWindow(QWidget):
         self.scrolling_text_renderer = ScrollingTextRenderer(
             self.text_renderer, self.skin_data
         )
+        self._build_hit_rects()
 
         # Initialize audio engine without visualization
         self.audio_engine = AudioEngine()
-        # Set up callback for position updates
-        self.audio_engine.playback_callback = self.update_playback_position
+        # Set up callback for position updates. The audio engine invokes the callback
+        # from its audio thread, so route it through a queued signal to the GUI thread
+        self.position_changed.connect(
+            self.update_playback_position, Qt.QueuedConnection
+        )
+        self.audio_engine.playback_callback = self.position_changed.emit
+
+        # Reads tags of loaded and appended tracks without blocking the UI
+        self._metadata_pool = QThreadPool(self)
+        # Files whose metadata arrived since the playlist rows were last refreshed;
+        # flushed once per event loop iteration by _flush_track_metadata_refresh
+        self._refreshed_metadata_paths = set()
+        self.track_metadata_loaded.connect(
+            self._on_track_metadata_loaded, Qt.QueuedConnection
+        )
+        self.playing_track_metadata_loaded.connect(
+            self._on_playing_track_metadata_loaded, Qt.QueuedConnection
+        )
 
         # Initialize UI state
         self.ui_state = UIState()
+        # Set while a repaint requested via _request_update is waiting to be flushed
+        self._update_pending = False
+        # Set when the engine-derived fields of ui_state (duration, bitrate, playing
+        # state, ...) need to be re-read from the audio engine on the next paint
+        self._engine_dirty = True
+        # Latest slider values from mouse drags, applied to the audio engine at most
+        # once per event loop iteration by _flush_slider_updates
+        self._pending_volume = None
+        self._pending_balance = None
+        self._pending_position = None
+        self._slider_flush_scheduled = False
 
         # Initialize macOS media integration if on macOS
-        self.mac_media_integration = None
         try:
             from ..utils.mac_media_integration import create_mac_media_integration
 
@@ -241,12 +436,17 @@ class MainWindow(QWidget):
         # Set up keyboard shortcuts for media controls
         self.setup_media_shortcuts()
 
+        # Floating windows (playlist, equalizer, album art); populated once they are created
+        self._floating_windows = ()
+        # Time of the last bring_all_windows_to_foreground call, used to drop repeats
+        self._last_foreground_time = 0.0
+
         # Window dragging state
         self._dragging_window = False
         self._drag_start_position = QPoint()
 
         # Set the initial visualization mode in the audio engine to start the processing thread
-        if hasattr(self, "audio_engine"):
+        if self.audio_engine is not None:
             self.audio_engine.set_visualization_mode(
                 self.renderer.get_visualization_mode()
             )
@@ -259,7 +459,9 @@ class MainWindow(QWidget):
         # Timer for checking track completion
         self.track_completion_timer = QTimer()
         self.track_completion_timer.timeout.connect(self.check_track_completion)
-        self.track_completion_timer.start(500)  # Check every 500ms
+        # Check every 500ms; the timer stops itself once playback is no longer active
+        # and is restarted by the engine's position updates
+        self.track_completion_timer.start(500)
 
         # Timer for updating visualization (~30 FPS)
         self.visualization_timer = QTimer()
@@ -271,6 +473,9 @@ class MainWindow(QWidget):
 
         # Playlist functionality
         self.playlist = []  # List of file paths
+        # Set while load_and_play_files adds several files, so the playlist display is
+        # refreshed once at the end instead of after every file
+        self._suppress_playlist_display = False
         self.current_track_index = -1  # Index of currently playing track
         self.current_track_path = None  # Path of currently playing track (to handle playlist changes during playback)
 
@@ -306,16 +511,19 @@ class MainWindow(QWidget):
         )  # Set main window reference for docking
         self.album_art_window.hide()
 
-        # Track windows for coordinated shutdown
-        self._tracked_windows = [
+        # Floating windows used for snapping, docking and bringing to foreground
+        self._floating_windows = (
             self.playlist_window,
             self.equalizer_window,
             self.album_art_window,
-        ]
+        )
 
-        # Add flag to indicate initialization is not complete yet
-        # This prevents moving docked child windows during initial preference loading
-        self._initialization_complete = False
+        # Watch floating window geometry/visibility to invalidate cached docking bounds
+        for window in self._floating_windows:
+            window.installEventFilter(self)
+
+        # Track windows for coordinated shutdown
+        self._tracked_windows = list(self._floating_windows)
 
         # Initialize UI states from preferences (will be implemented later)
         # For now, ensure initial states are properly tracked
@@ -374,7 +582,7 @@ class MainWindow(QWidget):
         self.ui_state.is_file_info_pressed = True
         # Show the album art window and refresh its content
         self.album_art_window.show()
-        if hasattr(self, "audio_engine") and self.audio_engine:
+        if self.audio_engine is not None:
             self.album_art_window.refresh_album_art(self.audio_engine)
         self._update_window_visibility_preferences()  # Update preferences when manually shown/hidden
         self.update()  # Repaint main window to update button sprite
@@ -393,6 +601,10 @@ class MainWindow(QWidget):
         This method prepares the codebase for future implementation of loading visibility
         states from user preferences by establishing the pattern for tracking these states.
         """
+        # Track whether any window was placed at a saved position; windows placed at
+        # their default position are already marked as docked
+        any_position_loaded = False
+
         # Load EQ window visibility from preferences
         eq_visibility = self.preferences.get_eq_window_visibility()
         if eq_visibility is not None:
@@ -405,6 +617,7 @@ class MainWindow(QWidget):
                 if eq_position:
                     # Use saved position
                     self.equalizer_window.move(eq_position["x"], eq_position["y"])
+                    any_position_loaded = True
                     # Check if the window is docked based on proximity to main window
                     eq_rect = QRect(
                         eq_position["x"],
@@ -449,6 +662,7 @@ class MainWindow(QWidget):
                     self.playlist_window.move(
                         playlist_position["x"], playlist_position["y"]
                     )
+                    any_position_loaded = True
                     # Check if the window is docked based on proximity to main window
                     playlist_rect = QRect(
                         playlist_position["x"],
@@ -496,6 +710,7 @@ class MainWindow(QWidget):
                     self.album_art_window.move(
                         album_art_position["x"], album_art_position["y"]
                     )
+                    any_position_loaded = True
                     # Check if the window is docked based on proximity to main window
                     album_art_rect = QRect(
                         album_art_position["x"],
@@ -508,7 +723,7 @@ class MainWindow(QWidget):
                     )
 
                 # Show/refresh the album art window after positioning
-                if hasattr(self, "audio_engine") and self.audio_engine:
+                if self.audio_engine is not None:
                     self.album_art_window.refresh_album_art(self.audio_engine)
             # Show/hide the album art window based on saved state (after positioning)
             self.album_art_window.setVisible(album_art_visibility)
@@ -519,7 +734,8 @@ class MainWindow(QWidget):
 
         # After loading positions from preferences, recalculate docking states
         # to ensure proper docked state based on window proximity
-        self._recalculate_docking_states()
+        if any_position_loaded:
+            self._recalculate_docking_states()
 
     def _update_window_visibility_preferences(self):
         """Update window visibility preferences (implementation for EQ, Playlist and Album Art windows).
@@ -546,11 +762,11 @@ class MainWindow(QWidget):
         """
         # Create a list of all floating windows to check for docking
         floating_windows = []
-        if hasattr(self, "playlist_window") and self.playlist_window:
+        if self.playlist_window is not None:
             floating_windows.append(self.playlist_window)
-        if hasattr(self, "equalizer_window") and self.equalizer_window:
+        if self.equalizer_window is not None:
             floating_windows.append(self.equalizer_window)
-        if hasattr(self, "album_art_window") and self.album_art_window:
+        if self.album_art_window is not None:
             floating_windows.append(self.album_art_window)
 
         # For each floating window, check if it should be considered docked
@@ -626,6 +842,124 @@ class MainWindow(QWidget):
 
         return zones
 
+    def _warm_dialog_directories(self):
+        """List the file dialogs' start directories once in a background thread.
+
+        The first QFileDialog opened on a directory reads and stats all of its entries;
+        doing it ahead of time on a daemon thread leaves the listing in the OS cache so
+        the eject and load-skin dialogs open faster.
+        """
+        if MainWindow._dialog_dirs_warmed:
+            return
+        MainWindow._dialog_dirs_warmed = True
+
+        # The eject dialog starts in the default music path; the skin dialog starts in
+        # the current working directory
+        directories = [os.getcwd()]
+        default_music_path = self.preferences.get_default_music_path()
+        if default_music_path:
+            directories.append(default_music_path)
+
+        def warm():
+            for directory in directories:
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            entry.is_dir()
+                except OSError:
+                    pass
+
+        threading.Thread(target=warm, daemon=True).start()
+
+    def _build_hit_rects(self):
+        """Build the clickable area rectangles used by mousePressEvent for the current skin."""
+        main_window_areas = self.skin_data.spec_json["destinations"]["main_window"][
+            "areas"
+        ]
+        # Slider areas read on every mouse move while dragging
+        self._volume_area_spec = main_window_areas["volume_slider"]
+        self._balance_area_spec = main_window_areas["balance_slider"]
+        self._position_area_spec = main_window_areas["position_track"]
+
+        def area_rect(area_name):
+            area_spec = main_window_areas[area_name]
+            return QRect(area_spec["x"], area_spec["y"], area_spec["w"], area_spec["h"])
+
+        self._hit_rects = {
+            # Close button is at (264, 3) with size (9, 9) in the titlebar area
+            "close": QRect(264, 3, 9, 9),
+            # Titlebar is at the top of the window, typically 14 pixels high
+            "titlebar": QRect(0, 0, self.width(), 14),
+            "volume": area_rect("volume_slider"),
+            "balance": area_rect("balance_slider"),  # Use balance_slider area per spec
+            "position": area_rect("position_track"),
+            "playlist_button": area_rect("playlist_button"),
+            "eq_button": area_rect("eq_button"),
+            "shuffle": area_rect("shuffle_dest"),
+            "repeat": area_rect("repeat_dest"),
+        }
+        # Control buttons (previous, play, pause, stop, next) are keyed by their names
+        for control in main_window_areas["controls"]:
+            self._hit_rects[control["name"]] = QRect(
+                control["dest_x"], control["dest_y"], control["w"], control["h"]
+            )
+        self._hit_rects["eject"] = area_rect("eject")
+        # The clutterbar is a clickable 8x43 rectangle at position (10, 22); expand it
+        # from 8 to 12 pixels wide with a 2px buffer on each side to make it easier to
+        # click. Its 43 pixels are split into five buttons (O, A, I, D, V) of 43/5 = 8.6
+        # pixels each; band k starts at the first row y with y * 5 // 43 == k
+        band_tops = [22 + -(-43 * k // 5) for k in range(6)]
+        for k, name in enumerate(_CLUTTERBAR_BUTTONS):
+            self._hit_rects[name] = QRect(
+                8, band_tops[k], 12, band_tops[k + 1] - band_tops[k]
+            )
+        self._control_names = frozenset(
+            [control["name"] for control in main_window_areas["controls"]]
+            + list(_CLUTTERBAR_BUTTONS)
+        )
+        # Hot-about (Winamp info) clickable area, if the spec defines one
+        if "hot_about" in main_window_areas:
+            self._hit_rects["hot_about"] = area_rect("hot_about")
+        self._build_hit_mask()
+
+    def _build_hit_mask(self):
+        """Rasterize the hit rects into a byte-per-pixel area lookup table.
+
+        Areas earlier in _hit_rects take priority where they overlap (e.g. the close
+        button over the titlebar, shuffle over repeat), matching the order in which
+        mousePressEvent used to test them.
+        """
+        width = self.width()
+        height = self.height()
+        mask = bytearray(width * height)
+        # Index 0 means "no area"
+        area_names = (None,) + tuple(self._hit_rects)
+
+        # Paint lowest priority first so higher priority areas overwrite it
+        for area_id in range(len(area_names) - 1, 0, -1):
+            rect = self._hit_rects[area_names[area_id]]
+            left = max(rect.left(), 0)
+            right = min(rect.right(), width - 1)
+            if left > right:
+                continue
+            row_fill = bytes((area_id,)) * (right - left + 1)
+            for y in range(max(rect.top(), 0), min(rect.bottom(), height - 1) + 1):
+                row_start = y * width
+                mask[row_start + left : row_start + right + 1] = row_fill
+
+        self._hit_mask = mask
+        self._hit_mask_width = width
+        self._hit_mask_height = height
+        self._hit_area_names = area_names
+
+    def _hit_area_at(self, pos):
+        """Return the name of the clickable area at pos, or None if there is none."""
+        x = pos.x()
+        y = pos.y()
+        if 0 <= x < self._hit_mask_width and 0 <= y < self._hit_mask_height:
+            return self._hit_area_names[self._hit_mask[y * self._hit_mask_width + x]]
+        return None
+
     def apply_region_mask(self):
         """Apply the region mask to the window based on the region.txt data."""
         if self.skin_data.region_data:
@@ -684,49 +1018,109 @@ class MainWindow(QWidget):
         target_center_x = target_window.x() + target_window.width() // 2
         target_center_y = target_window.y() + target_window.height() // 2
 
-        # Variables to store the snap results
-        snap_x = dragging_window_rect.x()
-        snap_y = dragging_window_rect.y()
-        is_snapped = False
-
+        # Candidate alignments in priority order: (delta, threshold, snapped position)
         # 1. Horizontal edge alignment (top/bottom alignment)
-        # Check for alignment of dragging window's top with target window's edges
-        if abs(drag_top - target_bottom) <= edge_threshold:
-            snap_y = target_bottom  # Align drag top with target bottom
-            is_snapped = True
-        elif abs(drag_bottom - target_top) <= edge_threshold:
-            snap_y = target_top - drag_height  # Align drag bottom with target top
-            is_snapped = True
-        elif abs(drag_top - target_top) <= edge_threshold:
-            snap_y = target_top  # Align drag top with target top
-            is_snapped = True
-        elif abs(drag_bottom - target_bottom) <= edge_threshold:
-            snap_y = target_bottom - drag_height  # Align drag bottom with target bottom
-            is_snapped = True
-        elif abs(drag_center_y - target_center_y) <= center_threshold:
-            snap_y = target_center_y - drag_height // 2  # Align centers vertically
-            is_snapped = True
-
+        y_candidates = (
+            # Align drag top with target bottom
+            (drag_top - target_bottom, edge_threshold, target_bottom),
+            # Align drag bottom with target top
+            (drag_bottom - target_top, edge_threshold, target_top - drag_height),
+            # Align drag top with target top
+            (drag_top - target_top, edge_threshold, target_top),
+            # Align drag bottom with target bottom
+            (drag_bottom - target_bottom, edge_threshold, target_bottom - drag_height),
+            # Align centers vertically
+            (
+                drag_center_y - target_center_y,
+                center_threshold,
+                target_center_y - drag_height // 2,
+            ),
+        )
         # 2. Vertical edge alignment (left/right alignment)
-        # Check for alignment of dragging window's left with target window's edges
-        if abs(drag_left - target_right) <= edge_threshold:
-            snap_x = target_right  # Align drag left with target right
-            is_snapped = True
-        elif abs(drag_right - target_left) <= edge_threshold:
-            snap_x = target_left - drag_width  # Align drag right with target left
-            is_snapped = True
-        elif abs(drag_left - target_left) <= edge_threshold:
-            snap_x = target_left  # Align drag left with target left
-            is_snapped = True
-        elif abs(drag_right - target_right) <= edge_threshold:
-            snap_x = target_right - drag_width  # Align drag right with target right
-            is_snapped = True
-        elif abs(drag_center_x - target_center_x) <= center_threshold:
-            snap_x = target_center_x - drag_width // 2  # Align centers horizontally
-            is_snapped = True
+        x_candidates = (
+            # Align drag left with target right
+            (drag_left - target_right, edge_threshold, target_right),
+            # Align drag right with target left
+            (drag_right - target_left, edge_threshold, target_left - drag_width),
+            # Align drag left with target left
+            (drag_left - target_left, edge_threshold, target_left),
+            # Align drag right with target right
+            (drag_right - target_right, edge_threshold, target_right - drag_width),
+            # Align centers horizontally
+            (
+                drag_center_x - target_center_x,
+                center_threshold,
+                target_center_x - drag_width // 2,
+            ),
+        )
+
+        snap_y = self._first_snap(y_candidates)
+        snap_x = self._first_snap(x_candidates)
+        is_snapped = snap_x is not None or snap_y is not None
+        if snap_x is None:
+            snap_x = dragging_window_rect.x()
+        if snap_y is None:
+            snap_y = dragging_window_rect.y()
 
         return snap_x, snap_y, is_snapped
 
+    @staticmethod
+    def _first_snap(candidates):
+        """
+        Return the snapped position of the first candidate within its threshold.
+
+        Args:
+            candidates: (delta, threshold, snapped_position) tuples in priority order
+
+        Returns:
+            int or None: The snapped position, or None if no candidate matched
+        """
+        for delta, threshold, position in candidates:
+            if -threshold <= delta <= threshold:
+                return position
+        return None
+
+    def _collect_snap_targets(self, exclude_window=None):
+        """
+        Collect the edges and centers of the main window and visible floating windows.
+
+        Each window's geometry is read once so the snapping loops work on plain integers.
+
+        Args:
+            exclude_window: Optional window to leave out (e.g., the window being dragged)
+
+        Returns:
+            list: (left, top, right, bottom, center_x, center_y) tuples, where right and
+                bottom are exclusive (x + width, y + height)
+        """
+        # Create a list of potential target windows
+        target_windows = [self]  # Always check main window
+
+        # Add other floating windows if they are visible
+        target_windows.extend(
+            window
+            for window in self._floating_windows
+            if window is not exclude_window and window.isVisible()
+        )
+
+        targets = []
+        for target_window in target_windows:
+            if target_window is self:
+                left, top, width, height = self._get_main_rect().getRect()
+            else:
+                left, top, width, height = target_window.geometry().getRect()
+            targets.append(
+                (
+                    left,
+                    top,
+                    left + width,
+                    top + height,
+                    left + width // 2,
+                    top + height // 2,
+                )
+            )
+        return targets
+
     def get_window_snap_alignment(self, dragging_window_rect, exclude_window=None):
         """
         Calculate proper alignment based on the window snapping specification.
@@ -756,47 +1150,21 @@ class MainWindow(QWidget):
         # Variables to store the final snap results
         snap_x = dragging_window_rect.x()
         snap_y = dragging_window_rect.y()
-        is_snapped = False
-
-        # Store all potential snaps with their distances for prioritization
-        potential_snaps = []
-
-        # Check for snapping to other windows (main window and floating windows)
-        # Create a list of potential target windows
-        target_windows = [self]  # Always check main window
-
-        # Add other floating windows if they exist and are visible
-        if (
-            hasattr(self, "playlist_window")
-            and self.playlist_window
-            and self.playlist_window.isVisible()
-        ):
-            if self.playlist_window != exclude_window:
-                target_windows.append(self.playlist_window)
-        if (
-            hasattr(self, "equalizer_window")
-            and self.equalizer_window
-            and self.equalizer_window.isVisible()
-        ):
-            if self.equalizer_window != exclude_window:
-                target_windows.append(self.equalizer_window)
-        if (
-            hasattr(self, "album_art_window")
-            and self.album_art_window
-            and self.album_art_window.isVisible()
-        ):
-            if self.album_art_window != exclude_window:
-                target_windows.append(self.album_art_window)
-
-        # Check each target window for potential snapping
-        for target_window in target_windows:
-            target_left = target_window.x()
-            target_right = target_window.x() + target_window.width()
-            target_top = target_window.y()
-            target_bottom = target_window.y() + target_window.height()
-            target_center_x = target_window.x() + target_window.width() // 2
-            target_center_y = target_window.y() + target_window.height() // 2
 
+        # Closest snap distance found so far on each axis; only candidates within the
+        # threshold and strictly closer than the current best replace it, so the first
+        # of several equally close candidates wins
+        best_x_dist = best_y_dist = float("inf")
+
+        # Check each target window (main window and floating windows) for potential snapping
+        for (
+            target_left,
+            target_top,
+            target_right,
+            target_bottom,
+            target_center_x,
+            target_center_y,
+        ) in self._collect_snap_targets(exclude_window):
             # 1. Horizontal edge alignment (top/bottom alignment)
             # Calculate distances for each potential snap
             top_to_bottom_dist = abs(drag_top - target_bottom)
@@ -806,21 +1174,30 @@ class MainWindow(QWidget):
             center_y_dist = abs(drag_center_y - target_center_y)
 
             # Check for alignment of dragging window's top with target window's edges
-            if top_to_bottom_dist <= edge_threshold:
-                potential_snaps.append(("y", target_bottom, top_to_bottom_dist))
-            if bottom_to_top_dist <= edge_threshold:
-                potential_snaps.append(
-                    ("y", target_top - drag_height, bottom_to_top_dist)
-                )
-            if top_to_top_dist <= edge_threshold:
-                potential_snaps.append(("y", target_top, top_to_top_dist))
-            if bottom_to_bottom_dist <= edge_threshold:
-                potential_snaps.append(
-                    ("y", target_bottom - drag_height, bottom_to_bottom_dist)
+            if (
+                top_to_bottom_dist <= edge_threshold
+                and top_to_bottom_dist < best_y_dist
+            ):
+                best_y_dist, snap_y = top_to_bottom_dist, target_bottom
+            if (
+                bottom_to_top_dist <= edge_threshold
+                and bottom_to_top_dist < best_y_dist
+            ):
+                best_y_dist, snap_y = bottom_to_top_dist, target_top - drag_height
+            if top_to_top_dist <= edge_threshold and top_to_top_dist < best_y_dist:
+                best_y_dist, snap_y = top_to_top_dist, target_top
+            if (
+                bottom_to_bottom_dist <= edge_threshold
+                and bottom_to_bottom_dist < best_y_dist
+            ):
+                best_y_dist, snap_y = (
+                    bottom_to_bottom_dist,
+                    target_bottom - drag_height,
                 )
-            if center_y_dist <= center_threshold:
-                potential_snaps.append(
-                    ("y", target_center_y - drag_height // 2, center_y_dist)
+            if center_y_dist <= center_threshold and center_y_dist < best_y_dist:
+                best_y_dist, snap_y = (
+                    center_y_dist,
+                    target_center_y - drag_height // 2,
                 )
 
             # 2. Vertical edge alignment (left/right alignment)
@@ -831,48 +1208,44 @@ class MainWindow(QWidget):
             center_x_dist = abs(drag_center_x - target_center_x)
 
             # Check for alignment of dragging window's left with target window's edges
-            if left_to_right_dist <= edge_threshold:
-                potential_snaps.append(("x", target_right, left_to_right_dist))
-            if right_to_left_dist <= edge_threshold:
-                potential_snaps.append(
-                    ("x", target_left - drag_width, right_to_left_dist)
-                )
-            if left_to_left_dist <= edge_threshold:
-                potential_snaps.append(("x", target_left, left_to_left_dist))
-            if right_to_right_dist <= edge_threshold:
-                potential_snaps.append(
-                    ("x", target_right - drag_width, right_to_right_dist)
-                )
-            if center_x_dist <= center_threshold:
-                potential_snaps.append(
-                    ("x", target_center_x - drag_width // 2, center_x_dist)
+            if (
+                left_to_right_dist <= edge_threshold
+                and left_to_right_dist < best_x_dist
+            ):
+                best_x_dist, snap_x = left_to_right_dist, target_right
+            if (
+                right_to_left_dist <= edge_threshold
+                and right_to_left_dist < best_x_dist
+            ):
+                best_x_dist, snap_x = right_to_left_dist, target_left - drag_width
+            if left_to_left_dist <= edge_threshold and left_to_left_dist < best_x_dist:
+                best_x_dist, snap_x = left_to_left_dist, target_left
+            if (
+                right_to_right_dist <= edge_threshold
+                and right_to_right_dist < best_x_dist
+            ):
+                best_x_dist, snap_x = right_to_right_dist, target_right - drag_width
+            if center_x_dist <= center_threshold and center_x_dist < best_x_dist:
+                best_x_dist, snap_x = (
+                    center_x_dist,
+                    target_center_x - drag_width // 2,
                 )
 
-        # If we found potential snaps, choose the one with the smallest distance
-        if potential_snaps:
-            # Sort by distance (closest first)
-            sorted_snaps = sorted(potential_snaps, key=lambda x: x[2])
-
-            # Apply the closest snaps for x and y directions (if different directions)
-            applied_x = False
-            applied_y = False
-
-            for snap_type, snap_pos, dist in sorted_snaps:
-                if snap_type == "x" and not applied_x:
-                    snap_x = snap_pos
-                    applied_x = True
-                    is_snapped = True
-                elif snap_type == "y" and not applied_y:
-                    snap_y = snap_pos
-                    applied_y = True
-                    is_snapped = True
-
-                # If both x and y are applied, we can stop
-                if applied_x and applied_y:
-                    break
+            # Exact alignment on both axes cannot be improved by the remaining targets
+            if best_x_dist == 0 and best_y_dist == 0:
+                break
+
+        # Snapping occurred if a candidate was found on either axis
+        is_snapped = best_x_dist != float("inf") or best_y_dist != float("inf")
 
         return snap_x, snap_y, is_snapped
 
+    def _get_main_rect(self):
+        """Return the main window geometry, cached until the next move or resize."""
+        if self._cached_main_rect is None:
+            self._cached_main_rect = self.geometry()
+        return self._cached_main_rect
+
     def is_window_near_main(self, window_rect):
         """
         Check if a window is still close enough to the main window to be considered docked.
@@ -888,25 +1261,26 @@ class MainWindow(QWidget):
         unsnap_threshold = 25  # pixels
 
         # Get main window rect
-        main_rect = QRect(self.x(), self.y(), self.width(), self.height())
+        main_rect = self._get_main_rect()
 
         # Check if any edges are within the unsnap threshold
         # We calculate the minimum distance between any points of the two rectangles
         # If the rectangles overlap or are within the threshold, consider docked
 
-        # Horizontal distance: distance between rectangles horizontally
-        horiz_dist = 0
-        if window_rect.right() < main_rect.left():
-            horiz_dist = main_rect.left() - window_rect.right()
-        elif main_rect.right() < window_rect.left():
-            horiz_dist = window_rect.left() - main_rect.right()
+        # Horizontal distance: gap between rectangles horizontally (0 if they overlap).
+        # At most one of the two differences can be positive.
+        horiz_dist = max(
+            0,
+            main_rect.left() - window_rect.right(),
+            window_rect.left() - main_rect.right(),
+        )
 
-        # Vertical distance: distance between rectangles vertically
-        vert_dist = 0
-        if window_rect.bottom() < main_rect.top():
-            vert_dist = main_rect.top() - window_rect.bottom()
-        elif main_rect.bottom() < window_rect.top():
-            vert_dist = window_rect.top() - main_rect.bottom()
+        # Vertical distance: gap between rectangles vertically (0 if they overlap)
+        vert_dist = max(
+            0,
+            main_rect.top() - window_rect.bottom(),
+            window_rect.top() - main_rect.bottom(),
+        )
 
         # Calculate direct distance between closest points of the rectangles
         max_distance = max(horiz_dist, vert_dist)
@@ -930,148 +1304,199 @@ class MainWindow(QWidget):
         # of any part of another window, consider it still docked
         unsnap_threshold = 25  # pixels
 
-        # Create a list of potential target windows
-        target_windows = [self]  # Always check main window
+        # Skip the per-target checks when the window is far from all of them
+        if not self._get_docked_union_rect(exclude_window).intersects(window_rect):
+            return False
 
-        # Add other floating windows if they exist and are visible
-        if (
-            hasattr(self, "playlist_window")
-            and self.playlist_window
-            and self.playlist_window.isVisible()
-        ):
-            if self.playlist_window != exclude_window:
-                target_windows.append(self.playlist_window)
-        if (
-            hasattr(self, "equalizer_window")
-            and self.equalizer_window
-            and self.equalizer_window.isVisible()
-        ):
-            if self.equalizer_window != exclude_window:
-                target_windows.append(self.equalizer_window)
-        if (
-            hasattr(self, "album_art_window")
-            and self.album_art_window
-            and self.album_art_window.isVisible()
-        ):
-            if self.album_art_window != exclude_window:
-                target_windows.append(self.album_art_window)
+        window_left = window_rect.left()
+        window_right = window_rect.right()
+        window_top = window_rect.top()
+        window_bottom = window_rect.bottom()
 
         # Check each target window to see if the specified window rect is near it
-        for target_window in target_windows:
-            target_rect = QRect(
-                target_window.x(),
-                target_window.y(),
-                target_window.width(),
-                target_window.height(),
-            )
-
-            # Calculate distance between rectangles
-            horiz_dist = 0
-            if window_rect.right() < target_rect.left():
-                horiz_dist = target_rect.left() - window_rect.right()
-            elif target_rect.right() < window_rect.left():
-                horiz_dist = window_rect.left() - target_rect.right()
-
-            vert_dist = 0
-            if window_rect.bottom() < target_rect.top():
-                vert_dist = target_rect.top() - window_rect.bottom()
-            elif target_rect.bottom() < window_rect.top():
-                vert_dist = window_rect.top() - target_rect.bottom()
-
-            # The minimum distance between the rectangles
-            max_distance = max(horiz_dist, vert_dist)
+        for (
+            target_left,
+            target_top,
+            target_right,
+            target_bottom,
+            _,
+            _,
+        ) in self._collect_snap_targets(exclude_window):
+            # Snap targets use exclusive right/bottom edges; QRect edges are inclusive
+            target_right -= 1
+            target_bottom -= 1
+
+            # Calculate distance between rectangles (0 on an axis where they overlap),
+            # skipping targets that are already too far away horizontally
+            horiz_dist = max(0, target_left - window_right, window_left - target_right)
+            if horiz_dist > unsnap_threshold:
+                continue
+
+            vert_dist = max(0, target_top - window_bottom, window_top - target_bottom)
 
             # If this window is within the threshold of any target window, return True
-            if max_distance <= unsnap_threshold:
+            if vert_dist <= unsnap_threshold:
                 return True
 
         # If not near any target window, return False
         return False
 
+    def _get_docked_union_rect(self, exclude_window=None):
+        """
+        Get the bounding rect of all docking targets, expanded by the unsnap threshold.
+
+        The rect is cached per excluded window and invalidated when the main window or
+        a floating window moves, resizes, shows or hides.
+
+        Args:
+            exclude_window: Optional window to leave out (e.g., the window being checked)
+
+        Returns:
+            QRect: Rect that any window near a docking target must intersect
+        """
+        union_rect = self._docked_union_rects.get(exclude_window)
+        if union_rect is None:
+            unsnap_threshold = 25  # pixels, same as is_window_near_any_docked_window
+            targets = self._collect_snap_targets(exclude_window)
+            # Target right/bottom edges are exclusive; QRect edges are inclusive
+            union_rect = QRect(
+                QPoint(
+                    min(target[0] for target in targets) - unsnap_threshold,
+                    min(target[1] for target in targets) - unsnap_threshold,
+                ),
+                QPoint(
+                    max(target[2] for target in targets) - 1 + unsnap_threshold,
+                    max(target[3] for target in targets) - 1 + unsnap_threshold,
+                ),
+            )
+            self._docked_union_rects[exclude_window] = union_rect
+        return union_rect
+
+    def _invalidate_docked_union_rects(self, changed_window=None):
+        """
+        Drop cached docking bounds that depend on a window's geometry or visibility.
+
+        Args:
+            changed_window: Floating window that changed, or None to drop everything
+        """
+        # The bounds computed without changed_window are unaffected by it
+        kept_rect = self._docked_union_rects.get(changed_window)
+        self._docked_union_rects.clear()
+        if changed_window is not None and kept_rect is not None:
+            self._docked_union_rects[changed_window] = kept_rect
+
+    def eventFilter(self, watched, event):
+        """Invalidate cached docking bounds when a floating window changes."""
+        if (
+            event.type()
+            in (
+                QEvent.Move,
+                QEvent.Resize,
+                QEvent.Show,
+                QEvent.Hide,
+            )
+            and watched in self._floating_windows
+        ):
+            self._invalidate_docked_union_rects(watched)
+        return super().eventFilter(watched, event)
+
     def bring_all_windows_to_foreground(self):
         """Bring all related windows (main, playlist, equalizer, album art) to the foreground."""
+        # A click triggers both mousePressEvent and focusInEvent (in this and the child
+        # windows), so skip repeated calls within the same frame
+        now = time.monotonic()
+        if now - self._last_foreground_time < 0.016:
+            return
+        self._last_foreground_time = now
+
         # Activate the main window first
         self.raise_()
         self.activateWindow()
 
-        # Bring up other visible windows
-        if (
-            hasattr(self, "playlist_window")
-            and self.playlist_window
-            and self.playlist_window.isVisible()
-        ):
-            self.playlist_window.raise_()
-            self.playlist_window.activateWindow()
-        if (
-            hasattr(self, "equalizer_window")
-            and self.equalizer_window
-            and self.equalizer_window.isVisible()
-        ):
-            self.equalizer_window.raise_()
-            self.equalizer_window.activateWindow()
-        if (
-            hasattr(self, "album_art_window")
-            and self.album_art_window
-            and self.album_art_window.isVisible()
-        ):
-            self.album_art_window.raise_()
-            self.album_art_window.activateWindow()
+        # Bring up other visible windows; only the main window needs to be activated
+        for window in self._floating_windows:
+            if window.isVisible():
+                window.raise_()
 
     def update_playback_position(self, position, duration):
         """Callback from audio engine - updates internal state for UI timer."""
         # This callback receives position updates from the audio engine
         # We store this info so the UI timer can use it consistently
         # The actual UI update is still handled by the timer to avoid race conditions
+        self._engine_dirty = True
+
+        # Position updates mean a track is playing, so resume completion checks
+        if not self.track_completion_timer.isActive() and not self._is_shutting_down:
+            self.track_completion_timer.start()
 
         # Update macOS media integration if available
-        if hasattr(self, "mac_media_integration") and self.mac_media_integration:
+        if self.mac_media_integration:
             self.mac_media_integration.update_playback_state()
 
     def update_ui_from_engine(self):
         """Update UI based on audio engine state."""
-        state = self.audio_engine.get_playback_state()
+        # Read the engine's state attributes directly rather than through the
+        # get_playback_state() dict; each is a single atomic attribute read
+        engine = self.audio_engine
+        is_playing = engine.is_playing
+        is_paused = engine.is_paused
+        self._engine_dirty = True
 
         # Update play/pause/stop state indicators based on actual playback state
         # Play button is pressed if playing
-        self.ui_state.is_play_pressed = state["is_playing"] and not state["is_paused"]
+        self.ui_state.is_play_pressed = is_playing and not is_paused
         # Pause button is pressed if paused
-        self.ui_state.is_pause_pressed = state["is_paused"]
+        self.ui_state.is_pause_pressed = is_paused
         # Stop button is pressed when playback is stopped (neither playing nor paused), but only after a track has been loaded
         # When no track is loaded, stop button is not pressed (neutral state)
         self.ui_state.is_stop_pressed = (
-            not state["is_playing"]
-            and not state["is_paused"]
-            and self.audio_engine.has_track_loaded()
+            not is_playing and not is_paused and engine.has_track_loaded()
         )
 
         # Update volume - only when it's different to avoid flickering
-        if abs(self.ui_state.volume - state["volume"]) > 0.001:
-            self.ui_state.volume = state["volume"]
+        volume = engine.volume
+        if abs(self.ui_state.volume - volume) > 0.001:
+            self.ui_state.volume = volume
 
         # Update position from audio engine state to ensure consistency
         # This provides a single source of truth for the UI
         # Calculate position as fraction of total duration for UI components
-        position_seconds = state["position"]
-        duration = state["duration"]
+        position_seconds = engine.current_position
+        duration = engine.duration
         if duration > 0:
-            self.ui_state.position = max(
-                0.0, min(1.0, position_seconds / duration if duration > 0 else 0.0)
-            )
+            self.ui_state.position = max(0.0, min(1.0, position_seconds / duration))
         else:
             self.ui_state.position = 0.0
 
         # Trigger repaint if needed
         self.update()
 
+    @property
+    def playlist(self):
+        """List of file paths in the playlist."""
+        return self._playlist
+
+    @playlist.setter
+    def playlist(self, playlist):
+        self._playlist = playlist
+        # Map each path to its first position in the playlist for O(1) lookups;
+        # rebuilt whenever a new playlist list is assigned
+        path_to_index = {}
+        for index, path in enumerate(playlist):
+            path_to_index.setdefault(path, index)
+        self._path_to_index = path_to_index
+
     def set_playlist(self, playlist):
         """Set the playlist with list of file paths."""
+        self.playlist = playlist
+
         # If we're currently playing a track, try to maintain its position in the new playlist
         if self.current_track_path:
             # Find the new index of the currently playing track in the updated playlist
-            try:
-                new_index = playlist.index(self.current_track_path)
+            new_index = self._path_to_index.get(self.current_track_path, -1)
+            if new_index >= 0:
                 self.current_track_index = new_index
-            except ValueError:
+            else:
                 # Track is no longer in playlist, reset index and path
                 self.current_track_index = -1
                 self.current_track_path = None
@@ -1079,39 +1504,112 @@ class MainWindow(QWidget):
             # If playlist is being cleared and no track was playing, clear the path anyway
             self.current_track_path = None
 
-        self.playlist = playlist
         self.update_playlist_display()
 
     def update_playlist_display(self):
         """Update the playlist window display."""
+        if self._suppress_playlist_display:
+            return
         # Update the playlist file paths in the playlist window
-        if hasattr(self, "playlist_window"):
+        if self.playlist_window is not None:
             self.playlist_window.set_playlist_filepaths(self.playlist)
 
+    def _load_track_metadata(self, file_path):
+        """Read a track's metadata on a worker thread and hand it to the GUI thread."""
+        metadata = PlaylistWindow.read_track_metadata(file_path)
+        self.track_metadata_loaded.emit(file_path, metadata)
+
+    def _on_track_metadata_loaded(self, file_path, metadata):
+        """Cache metadata read by a worker and schedule a refresh of its playlist rows.
+
+        Results from several workers finishing together are applied in one refresh.
+        """
+        if self.playlist_window is None:
+            return
+        self.playlist_window.cache_track_metadata(file_path, metadata)
+        if not self._refreshed_metadata_paths:
+            QTimer.singleShot(0, self, self._flush_track_metadata_refresh)
+        self._refreshed_metadata_paths.add(file_path)
+
+    def _flush_track_metadata_refresh(self):
+        """Rebuild the playlist rows whose metadata arrived since the last refresh."""
+        refreshed_paths = self._refreshed_metadata_paths
+        self._refreshed_metadata_paths = set()
+        if self.playlist_window is not None:
+            self.playlist_window.refresh_track_rows(refreshed_paths)
+
+    def _load_engine_track(self, file_path):
+        """Load a track into the audio engine, reading its tags on a worker thread.
+
+        Until the tags arrive the title and playlist row show the file name; the
+        album art window and media integration are refreshed again once they do.
+        """
+        if not self.audio_engine.load_track(file_path, load_metadata=False):
+            return False
+        self.ui_state.current_track_title = self._fallback_track_title(file_path)
+        if self.playlist_window is not None:
+            self.playlist_window.expect_track_metadata(file_path)
+        self._metadata_pool.start(
+            partial(
+                self._load_playing_track_metadata,
+                file_path,
+                self.audio_engine.duration,
+            )
+        )
+        return True
+
+    def _load_playing_track_metadata(self, file_path, duration):
+        """Read the loaded track's metadata on a worker thread.
+
+        The playlist gets its own fields (e.g. the track number, but not the album
+        art) rather than the engine's metadata.
+        """
+        result = self.audio_engine.read_metadata(file_path, duration)
+        track_metadata = PlaylistWindow.read_track_metadata(file_path)
+        self.playing_track_metadata_loaded.emit(file_path, result, track_metadata)
+
+    def _on_playing_track_metadata_loaded(self, file_path, result, track_metadata):
+        """Install metadata read by a worker, unless another track was loaded meanwhile."""
+        # The playlist row shows the file name until the tags arrive, even if the
+        # track is no longer loaded
+        self._on_track_metadata_loaded(file_path, track_metadata)
+        if self.audio_engine.file_path != file_path:
+            return
+        self.audio_engine.apply_metadata(result)
+        metadata = self.audio_engine.get_metadata()
+        self.ui_state.current_track_title = self.format_track_title(metadata, file_path)
+
+        # Refresh album art if the window is visible
+        if self.album_art_window is not None and self.album_art_window.isVisible():
+            self.album_art_window.refresh_album_art(self.audio_engine)
+
+        # Update macOS media integration with the track's tags
+        if self.mac_media_integration:
+            self.mac_media_integration.update_now_playing_info()
+
+        self._request_update()
+
+    def format_track_title(self, metadata, filepath):
+        """Return the "artist - song title" display text for a track."""
+        if not metadata:
+            # Fallback to just the filename without extension
+            return self._fallback_track_title(filepath)
+        # For the scrolling text renderer, we just need the title and artist
+        # The playlist number and duration will be added by the renderer
+        title = metadata.get("title", "Unknown")
+        artist = metadata.get("artist", "Unknown")
+        # Sanitize the title and artist to remove potentially problematic characters
+        # for the Winamp font renderer
+        title = str(title).translate(self._METADATA_TRANSLATE).strip()
+        artist = str(artist).translate(self._METADATA_TRANSLATE).strip()
+        return f"{artist} - {title}"
+
     def play_track_at_index(self, index):
         """Play the track at the specified index in the playlist."""
+        self._engine_dirty = True
         if 0 <= index < len(self.playlist):
             filepath = self.playlist[index]
-            if self.audio_engine.load_track(filepath):
-                # Update display with track information - only artist and title
-                metadata = self.audio_engine.get_metadata()
-                if metadata:
-                    # For the scrolling text renderer, we just need the title and artist
-                    # The playlist number and duration will be added by the renderer
-                    title = metadata.get("title", "Unknown")
-                    artist = metadata.get("artist", "Unknown")
-                    # Sanitize the title and artist to remove potentially problematic characters
-                    # for the Winamp font renderer
-                    title = str(title).replace("\n", " ").replace("\r", " ").strip()
-                    artist = str(artist).replace("\n", " ").replace("\r", " ").strip()
-                    # Format as "artist - song title" for display
-                    self.ui_state.current_track_title = f"{artist} - {title}"
-                else:
-                    # Fallback to just the filename without extension
-                    self.ui_state.current_track_title = os.path.splitext(
-                        os.path.basename(filepath)
-                    )[0]
-
+            if self._load_engine_track(filepath):
                 self.audio_engine.play()
                 self.current_track_index = index
                 self.current_track_path = (
@@ -1126,17 +1624,18 @@ class MainWindow(QWidget):
                     self.album_art_window.refresh_album_art(self.audio_engine)
 
                 # Update macOS media integration with new track info
-                if (
-                    hasattr(self, "mac_media_integration")
-                    and self.mac_media_integration
-                ):
+                if self.mac_media_integration:
                     self.mac_media_integration.update_now_playing_info()
                     self.mac_media_integration.update_playback_state()
 
-                self.update()
+                self._request_update()
                 return True
         return False
 
+    def _fallback_track_title(self, filepath):
+        """Return the filename without extension, used when a track has no metadata."""
+        return os.path.splitext(os.path.basename(filepath))[0]
+
     def play_next_track(self):
         """Play the next track in the playlist."""
         if self.playlist and self.current_track_index < len(self.playlist) - 1:
@@ -1150,7 +1649,7 @@ class MainWindow(QWidget):
                 self.album_art_window.refresh_album_art(self.audio_engine)
 
             # Update macOS media integration
-            if hasattr(self, "mac_media_integration") and self.mac_media_integration:
+            if self.mac_media_integration:
                 self.mac_media_integration.update_now_playing_info()
                 self.mac_media_integration.update_playback_state()
 
@@ -1164,7 +1663,7 @@ class MainWindow(QWidget):
                 self.album_art_window.refresh_album_art(self.audio_engine)
 
             # Update macOS media integration
-            if hasattr(self, "mac_media_integration") and self.mac_media_integration:
+            if self.mac_media_integration:
                 self.mac_media_integration.update_now_playing_info()
                 self.mac_media_integration.update_playback_state()
 
@@ -1177,24 +1676,29 @@ class MainWindow(QWidget):
             self.album_art_window.refresh_album_art(self.audio_engine)
 
         # Update macOS media integration
-        if hasattr(self, "mac_media_integration") and self.mac_media_integration:
+        if self.mac_media_integration:
             self.mac_media_integration.update_now_playing_info()
             self.mac_media_integration.update_playback_state()
 
     def _handle_stop_action(self):
         """Handle the stop action from media key or stop button."""
         self.audio_engine.stop()
+        self._engine_dirty = True
         self.current_track_path = None
         # Make sure the playlist window knows which track was playing so it can be restarted
-        if hasattr(self, "playlist_window") and self.playlist_window:
+        if self.playlist_window is not None:
             self.playlist_window.set_current_track_index(self.current_track_index)
 
         # Update macOS media integration with new playback state
-        if hasattr(self, "mac_media_integration") and self.mac_media_integration:
+        if self.mac_media_integration:
             self.mac_media_integration.update_playback_state()
 
     def check_track_completion(self):
         """Check if the current track has finished playing and advance if needed."""
+        # A track can't have finished while the engine is still playing it
+        if self.audio_engine.is_playing:
+            return
+
         # Get current playback state from audio engine
         state = self.audio_engine.get_playback_state()
 
@@ -1234,15 +1738,36 @@ class MainWindow(QWidget):
 
                 # Refresh album art to show default placeholder when track stops
                 if (
-                    hasattr(self, "album_art_window")
+                    self.album_art_window is not None
                     and self.album_art_window.isVisible()
                 ):
                     self.album_art_window.refresh_album_art(self.audio_engine)
 
-                self.update()
+                self._request_update()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+        # Playback is stopped or paused; nothing can change until the engine reports
+        # positions again, which restarts the timer
+        if not self.audio_engine.is_playing:
+            self.track_completion_timer.stop()
+
+    def _request_update(self):
+        """Schedule a single repaint once the current event handler has finished.
+
+        Handlers that change several pieces of state (e.g. play a track, refresh album
+        art, reset button states) can call this repeatedly without each call going
+        through Qt's paint-event scheduling.
+        """
+        if not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(0, self, self._flush_update)
+
+    def _flush_update(self):
+        """Perform the repaint requested via _request_update."""
+        self._update_pending = False
+        self.update()
+
+    def _refresh_ui_state_from_engine(self):
+        """Copy track and playback details from the audio engine into the UI state."""
         # Get current track duration from audio engine
         self.ui_state.duration = (
             self.audio_engine.get_duration() if self.audio_engine else 0.0
@@ -1265,93 +1790,180 @@ class MainWindow(QWidget):
             self.audio_engine.is_vbr if hasattr(self.audio_engine, "is_vbr") else False
         )
 
-        # Get playback state from audio engine
-        playback_state = (
-            self.audio_engine.get_playback_state() if self.audio_engine else {}
-        )
-        self.ui_state.is_playing = playback_state.get("is_playing", False)
-        self.ui_state.is_paused = playback_state.get("is_paused", False)
+        # Get playback state from audio engine; read the attributes directly to avoid
+        # building a get_playback_state() dict on every refresh
+        if self.audio_engine:
+            self.ui_state.is_playing = self.audio_engine.is_playing
+            self.ui_state.is_paused = self.audio_engine.is_paused
+        else:
+            self.ui_state.is_playing = False
+            self.ui_state.is_paused = False
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        # Only re-read engine details when they may have changed; most repaints are
+        # driven by the visualization timer and don't need them
+        if self._engine_dirty:
+            self._engine_dirty = False
+            self._refresh_ui_state_from_engine()
 
         self.renderer.render(painter, self.ui_state)
         painter.end()
+        # Everything in the UI state is on screen now
+        self.ui_state.consume_dirty()
+
+    def _maybe_update(self):
+        """Repaint only if the UI state changed since it was last painted."""
+        if self.ui_state.consume_dirty():
+            self.update()
+
+    def _on_previous(self):
+        """Handle a click on the previous button."""
+        self.ui_state.is_previous_pressed = True
+        # Trigger previous track in playlist
+        self.play_previous_track()
+
+    def _on_play(self):
+        """Handle a click on the play button."""
+        self.ui_state.is_play_pressed = True
+        self.ui_state.is_pause_pressed = False  # Reset pause state
+
+        # If playlist is empty, just start playback if track is loaded
+        if not self.playlist:
+            if not self.audio_engine.is_playing or self.audio_engine.is_paused:
+                self.audio_engine.play()
+            return
+
+        # Get the selected track from the playlist window
+        selected_track_index = self.playlist_window.get_selected_track_index()
+
+        # If no track is selected, use the first track in the playlist
+        if selected_track_index == -1:
+            selected_track_index = 0
+
+        # Play the selected track (or first track if none selected)
+        self.play_track_at_index(selected_track_index)
+
+    def _on_pause(self):
+        """Handle a click on the pause button."""
+        self.ui_state.is_pause_pressed = True
+        # Toggle pause via audio engine
+
+        if self.audio_engine.is_playing:
+            self.audio_engine.pause()
+        elif self.audio_engine.is_paused:
+            self.audio_engine.play()
+            # Refresh album art if the window is visible and we're now playing
+            if self.album_art_window.isVisible():
+                self.album_art_window.refresh_album_art(self.audio_engine)
+
+    def _on_stop(self):
+        """Handle a click on the stop button."""
+        self.ui_state.is_stop_pressed = True
+        # Stop playback via audio engine
+        self.audio_engine.stop()
+        self.ui_state.position = 0.0  # Reset position visually
+        # Clear current track path but preserve the index so the same track can be restarted
+        self.current_track_path = None
+        # Update play/pause/stop states
+        self.ui_state.is_play_pressed = False
+        self.ui_state.is_pause_pressed = False
+        # Make sure the playlist window knows which track was playing so it can be restarted
+        if self.playlist_window is not None:
+            self.playlist_window.set_current_track_index(self.current_track_index)
+
+    def _on_next(self):
+        """Handle a click on the next button."""
+        self.ui_state.is_next_pressed = True
+        # Trigger next track in playlist
+        self.play_next_track()
+
+    def _on_options(self):
+        """Handle a click on the clutterbar 'O' (options menu) button."""
+        self.ui_state.is_options_pressed = True
+        self.show_skin_selection_dialog()
+
+    def _on_always_on_top(self):
+        """Handle a click on the clutterbar 'A' (always on top) button."""
+        self.ui_state.is_always_on_top_pressed = True
+
+    def _on_file_info(self):
+        """Handle a click on the clutterbar 'I' (file info / album art) button."""
+        # Toggle album art window using centralized method
+        if self.ui_state.album_art_visible:
+            self.hide_album_art_window()
+        else:
+            self.show_album_art_window()
+
+    def _on_double_size(self):
+        """Handle a click on the clutterbar 'D' (double size) button."""
+        self.ui_state.is_double_size_pressed = True
+
+    def _on_visualization(self):
+        """Handle a click on the clutterbar 'V' (visualization menu) button."""
+        self.ui_state.is_visualization_menu_pressed = True
+        # Cycle through visualization modes: SPECTRUM -> OSCILLOSCOPE -> OFF -> SPECTRUM
+        vis_mode = self.renderer.get_visualization_mode()
+        if vis_mode == "SPECTRUM":
+            new_vis_mode = "OSCILLOSCOPE"
+        elif vis_mode == "OSCILLOSCOPE":
+            new_vis_mode = "OFF"
+        else:  # OFF or any other state
+            new_vis_mode = "SPECTRUM"
+
+        # Update the renderer with the new visualization mode
+        self.renderer.set_visualization_mode(new_vis_mode)
+        # Also update the audio engine with the new visualization mode
+        self.audio_engine.set_visualization_mode(new_vis_mode)
 
     def mousePressEvent(self, event):
         # Bring all windows to foreground when any part of the main window is clicked
         self.bring_all_windows_to_foreground()
 
+        # Clicks may change playback, so re-read engine state on the next paint
+        self._engine_dirty = True
+
+        pos = event.pos()
+        # Look up which clickable area (if any) owns the clicked pixel
+        area = self._hit_area_at(pos)
+
         if event.button() == Qt.LeftButton:
+
             # Check for close button first (before titlebar dragging, since it's in the titlebar area)
-            # Close button is at (264, 3) with size (9, 9) in the titlebar area
-            close_button_rect = QRect(264, 3, 9, 9)
-            if close_button_rect.contains(event.pos()):
+            if area == "close":
                 # Quit the application when close button is clicked
                 # Use the proper close event handling to ensure audio engine cleanup
                 self.close()
                 return
 
             # Check if click is on titlebar for window dragging
-            # Titlebar is at the top of the window, typically 14 pixels high
-            titlebar_rect = QRect(0, 0, self.width(), 14)
-            if titlebar_rect.contains(event.pos()):
+            if area == "titlebar":
                 self._dragging_window = True
                 self._drag_start_position = (
                     event.globalPos() - self.frameGeometry().topLeft()
                 )
                 return
 
-            spec = self.skin_data.spec_json
-            main_window_areas = spec["destinations"]["main_window"]["areas"]
-
             # Check for Volume Slider interaction
-            volume_area_spec = main_window_areas["volume_slider"]
-            volume_rect = QRect(
-                volume_area_spec["x"],
-                volume_area_spec["y"],
-                volume_area_spec["w"],
-                volume_area_spec["h"],
-            )
-            if volume_rect.contains(event.pos()):
+            if area == "volume":
                 self.ui_state.is_volume_dragged = True
-                self._update_volume_from_mouse(event.pos())
+                self._update_volume_from_mouse(pos)
                 return
 
             # Check for Balance Slider interaction
-            balance_area_spec = main_window_areas[
-                "balance_slider"
-            ]  # Use balance_slider area per spec
-            balance_rect = QRect(
-                balance_area_spec["x"],
-                balance_area_spec["y"],
-                balance_area_spec["w"],
-                balance_area_spec["h"],
-            )
-            if balance_rect.contains(event.pos()):
+            if area == "balance":
                 self.ui_state.is_balance_dragged = True
-                self._update_balance_from_mouse(event.pos())
+                self._update_balance_from_mouse(pos)
                 return
 
             # Check for Position Bar interaction
-            position_area_spec = main_window_areas["position_track"]
-            position_rect = QRect(
-                position_area_spec["x"],
-                position_area_spec["y"],
-                position_area_spec["w"],
-                position_area_spec["h"],
-            )
-            if position_rect.contains(event.pos()):
+            if area == "position":
                 self.ui_state.dragging_position = True
-                self._update_position_from_mouse(event.pos())
+                self._update_position_from_mouse(pos)
                 return
 
             # Check for Playlist Button interaction
-            playlist_button_area_spec = main_window_areas["playlist_button"]
-            playlist_button_rect = QRect(
-                playlist_button_area_spec["x"],
-                playlist_button_area_spec["y"],
-                playlist_button_area_spec["w"],
-                playlist_button_area_spec["h"],
-            )
-            if playlist_button_rect.contains(event.pos()):
+            if area == "playlist_button":
                 # Toggle playlist window using centralized method
                 if self.ui_state.playlist_button_on:
                     self.hide_playlist_window()
@@ -1361,14 +1973,7 @@ class MainWindow(QWidget):
                 return
 
             # Check for EQ Button interaction
-            eq_button_area_spec = main_window_areas["eq_button"]
-            eq_button_rect = QRect(
-                eq_button_area_spec["x"],
-                eq_button_area_spec["y"],
-                eq_button_area_spec["w"],
-                eq_button_area_spec["h"],
-            )
-            if eq_button_rect.contains(event.pos()):
+            if area == "eq_button":
                 # Toggle equalizer window using centralized method
                 if self.ui_state.eq_button_on:
                     self.hide_equalizer_window()
@@ -1378,127 +1983,34 @@ class MainWindow(QWidget):
                 return
 
             # Check for Shuffle Button interaction
-            shuffle_area_spec = main_window_areas["shuffle_dest"]
-            shuffle_rect = QRect(
-                shuffle_area_spec["x"],
-                shuffle_area_spec["y"],
-                shuffle_area_spec["w"],
-                shuffle_area_spec["h"],
-            )
-            if shuffle_rect.contains(event.pos()):
+            if area == "shuffle":
                 self.ui_state.shuffle_on = not self.ui_state.shuffle_on
                 self.ui_state.is_shuffle_pressed = True
-                self.update()
+                self._maybe_update()
                 return
 
             # Check for Repeat Button interaction
-            repeat_area_spec = main_window_areas["repeat_dest"]
-            repeat_rect = QRect(
-                repeat_area_spec["x"],
-                repeat_area_spec["y"],
-                repeat_area_spec["w"],
-                repeat_area_spec["h"],
-            )
-            if repeat_rect.contains(event.pos()):
+            if area == "repeat":
                 self.ui_state.repeat_on = not self.ui_state.repeat_on
                 self.ui_state.is_repeat_pressed = True
-                self.update()
+                self._maybe_update()
                 return
 
-            # Check for control buttons interaction
-            controls = main_window_areas["controls"]
-            for control in controls:
-                control_rect = QRect(
-                    control["dest_x"], control["dest_y"], control["w"], control["h"]
-                )
-                if control_rect.contains(event.pos()):
-                    if control["name"] == "previous":
-                        self.ui_state.is_previous_pressed = True
-                        # Trigger previous track in playlist
-                        self.play_previous_track()
-                        self.update()
-                        return
-                    elif control["name"] == "play":
-                        self.ui_state.is_play_pressed = True
-                        self.ui_state.is_pause_pressed = False  # Reset pause state
-
-                        # If playlist is empty, just start playback if track is loaded
-                        if not self.playlist:
-                            if (
-                                not self.audio_engine.is_playing
-                                or self.audio_engine.is_paused
-                            ):
-                                self.audio_engine.play()
-                            self.update()
-                            return
-
-                        # Get the selected track from the playlist window
-                        selected_track_index = (
-                            self.playlist_window.get_selected_track_index()
-                        )
-
-                        # If no track is selected, use the first track in the playlist
-                        if selected_track_index == -1:
-                            selected_track_index = 0
-
-                        # Play the selected track (or first track if none selected)
-                        self.play_track_at_index(selected_track_index)
-                        self.update()
-                        return
-                    elif control["name"] == "pause":
-                        self.ui_state.is_pause_pressed = True
-                        # Toggle pause via audio engine
-
-                        if self.audio_engine.is_playing:
-                            self.audio_engine.pause()
-                        elif self.audio_engine.is_paused:
-                            self.audio_engine.play()
-                            # Refresh album art if the window is visible and we're now playing
-                            if self.album_art_window.isVisible():
-                                self.album_art_window.refresh_album_art(
-                                    self.audio_engine
-                                )
-                        self.update()
-                        return
-                    elif control["name"] == "stop":
-                        self.ui_state.is_stop_pressed = True
-                        # Stop playback via audio engine
-                        self.audio_engine.stop()
-                        self.ui_state.position = 0.0  # Reset position visually
-                        # Clear current track path but preserve the index so the same track can be restarted
-                        self.current_track_path = None
-                        # Update play/pause/stop states
-                        self.ui_state.is_play_pressed = False
-                        self.ui_state.is_pause_pressed = False
-                        # Make sure the playlist window knows which track was playing so it can be restarted
-                        if hasattr(self, "playlist_window") and self.playlist_window:
-                            self.playlist_window.set_current_track_index(
-                                self.current_track_index
-                            )
-                        self.update()
-                        return
-                    elif control["name"] == "next":
-                        self.ui_state.is_next_pressed = True
-                        # Trigger next track in playlist
-                        self.play_next_track()
-                        self.update()
-                        return
-                    self.update()
-                    return
+            # Check for control and clutterbar buttons interaction
+            if area in self._control_names:
+                handler = self._control_handlers.get(area)
+                if handler:
+                    handler()
+                self._request_update()
+                return
 
             # Check for Eject Button interaction
-            eject_area_spec = main_window_areas["eject"]
-            eject_rect = QRect(
-                eject_area_spec["x"],
-                eject_area_spec["y"],
-                eject_area_spec["w"],
-                eject_area_spec["h"],
-            )
-            if eject_rect.contains(event.pos()):
+            if area == "eject":
                 self.ui_state.is_eject_pressed = True
-                self.update()  # Force repaint to show pressed state immediately
-                # Process pending events to ensure UI updates before showing dialog
-                QApplication.processEvents()
+                # Paint the pressed state before the modal dialog opens. repaint() paints
+                # synchronously without running the event loop, so pending input such as
+                # a second click can't re-enter this handler
+                self.repaint()
                 # Open file dialog to load a track
                 # Use default music path from preferences if available, otherwise use empty string
                 default_music_path = self.preferences.get_default_music_path()
@@ -1508,7 +2020,8 @@ class MainWindow(QWidget):
                     self,
                     "Open Audio File",
                     initial_path,
-                    "Audio Files (*.mp3 *.wav *.ogg *.flac *.m4a *.aac *.opus *.aiff *.au);;All Files (*)",
+                    _AUDIO_FILE_FILTER,
+                    options=_FILE_DIALOG_OPTIONS,
                 )
 
                 # Always reset the eject button pressed state after dialog closes
@@ -1517,7 +2030,7 @@ class MainWindow(QWidget):
 
                 if file_path:
                     # Add to playlist and play immediately
-                    if self.audio_engine.load_track(file_path):
+                    if self._load_engine_track(file_path):
                         # For single file loading via eject, create a new playlist with just this file
                         self.playlist = [file_path]
                         self.current_track_index = 0
@@ -1525,16 +2038,6 @@ class MainWindow(QWidget):
                         # Update the playlist window display
                         self.update_playlist_display()
 
-                        # Update the current track title
-                        metadata = self.audio_engine.get_metadata()
-                        if metadata:
-                            # Format as "artist - song title" for display
-                            self.ui_state.current_track_title = f"{metadata.get('artist', 'Unknown')} - {metadata.get('title', 'Unknown')}"
-                        else:
-                            self.ui_state.current_track_title = os.path.basename(
-                                file_path
-                            )
-
                         # Start playback
                         self.audio_engine.play()
 
@@ -1543,123 +2046,37 @@ class MainWindow(QWidget):
 
                         # Refresh album art if the window is visible
                         if (
-                            hasattr(self, "album_art_window")
+                            self.album_art_window is not None
                             and self.album_art_window.isVisible()
                         ):
                             self.album_art_window.refresh_album_art(self.audio_engine)
 
                         # Update macOS media integration with new track info
-                        if (
-                            hasattr(self, "mac_media_integration")
-                            and self.mac_media_integration
-                        ):
+                        if self.mac_media_integration:
                             self.mac_media_integration.update_now_playing_info()
                             self.mac_media_integration.update_playback_state()
                     else:
                         self.ui_state.current_track_title = "Error loading track"
 
-                self.update()  # Repaint main window if button state changes visually
+                self._request_update()  # Repaint main window if button state changes visually
                 return
 
-            # Check for Clutterbar buttons interaction (O, A, I, D, V)
-            # The clutterbar is a clickable 8x43 rectangle at position (10, 22)
-            # Expand the clickable area to make it easier to click (add some horizontal buffer)
-            clutterbar_rect = QRect(
-                8, 22, 12, 43
-            )  # Expand from 8 to 12 pixels wide with 2px buffer on each side
-            if clutterbar_rect.contains(event.pos()):
-                # Calculate which button was pressed based on Y coordinate
-                y_pos = event.pos().y() - 22  # Relative to clutterbar top
-
-                # More precise calculation: divide 43 pixels into 5 equal sections
-                # Each button has height of 43/5 = 8.6 pixels
-                # Define exact boundaries to avoid floating point issues
-                button_height = 43 / 5  # 8.6 pixels per button
-
-                # Calculate which button was clicked based on precise boundaries
-                if 0 <= y_pos < button_height:  # Button 0 (Options)
-                    button_index = 0
-                elif (
-                    button_height <= y_pos < 2 * button_height
-                ):  # Button 1 (Always on Top)
-                    button_index = 1
-                elif (
-                    2 * button_height <= y_pos < 3 * button_height
-                ):  # Button 2 (File Info)
-                    button_index = 2
-                elif (
-                    3 * button_height <= y_pos < 4 * button_height
-                ):  # Button 3 (Double Size)
-                    button_index = 3
-                elif 4 * button_height <= y_pos < 43:  # Button 4 (Visualization)
-                    button_index = 4
-                else:
-                    button_index = -1  # Outside any button
-
-                if 0 <= button_index < 5:
-                    # Set the appropriate button pressed state
-                    if button_index == 0:  # 'O' - Options Menu
-                        self.ui_state.is_options_pressed = True
-                        self.show_skin_selection_dialog()
-                    elif button_index == 1:  # 'A' - Always on Top
-                        self.ui_state.is_always_on_top_pressed = True
-                    elif button_index == 2:  # 'I' - File Info / Album Art
-                        # Toggle album art window using centralized method
-                        if self.ui_state.album_art_visible:
-                            self.hide_album_art_window()
-                        else:
-                            self.show_album_art_window()
-
-                    elif button_index == 3:  # 'D' - Double Size
-                        self.ui_state.is_double_size_pressed = True
-                    elif button_index == 4:  # 'V' - Visualization Menu
-                        self.ui_state.is_visualization_menu_pressed = True
-                        # Cycle through visualization modes: SPECTRUM -> OSCILLOSCOPE -> OFF -> SPECTRUM
-                        vis_mode = self.renderer.get_visualization_mode()
-                        if vis_mode == "SPECTRUM":
-                            new_vis_mode = "OSCILLOSCOPE"
-                        elif vis_mode == "OSCILLOSCOPE":
-                            new_vis_mode = "OFF"
-                        else:  # OFF or any other state
-                            new_vis_mode = "SPECTRUM"
-
-                        # Update the renderer with the new visualization mode
-                        self.renderer.set_visualization_mode(new_vis_mode)
-                        # Also update the audio engine with the new visualization mode
-                        self.audio_engine.set_visualization_mode(new_vis_mode)
-                    self.update()
-                    return
-
         # Hot-about (Winamp info) clickable area
-        try:
-            spec = self.skin_data.spec_json
-            main_window_areas = spec["destinations"]["main_window"]["areas"]
-            hot_about_spec = main_window_areas.get("hot_about")
-            if hot_about_spec:
-                hot_about_rect = QRect(
-                    hot_about_spec["x"],
-                    hot_about_spec["y"],
-                    hot_about_spec["w"],
-                    hot_about_spec["h"],
-                )
-                if hot_about_rect.contains(event.pos()):
-                    # Use app-level handler if available, otherwise show QMessageBox directly
-                    try:
-                        app = QApplication.instance()
-                        if hasattr(app, "_show_about_dialog"):
-                            app._show_about_dialog()
-                        else:
-                            QMessageBox.about(
-                                self,
-                                "About WimPyAmp",
-                                "WimPyAmp\n\nVersion: 0.0.0\n\nA lightweight Winamp-style music player.\n\n© WimPyAmp Project",
-                            )
-                    except Exception:
-                        QMessageBox.about(self, "About WimPyAmp", "WimPyAmp")
-                    return
-        except Exception:
-            # If anything goes wrong while checking hot_about, fall back to default handling
-            pass
+        if area == "hot_about":
+            # Use app-level handler if available, otherwise show QMessageBox directly
+            try:
+                app = QApplication.instance()
+                if hasattr(app, "_show_about_dialog"):
+                    app._show_about_dialog()
+                else:
+                    QMessageBox.about(
+                        self,
+                        "About WimPyAmp",
+                        "WimPyAmp\n\nVersion: 0.0.0\n\nA lightweight Winamp-style music player.\n\n© WimPyAmp Project",
+                    )
+            except Exception:
+                QMessageBox.about(self, "About WimPyAmp", "WimPyAmp")
+            return
 
         super().mousePressEvent(event)
 
@@ -1692,80 +2109,31 @@ class MainWindow(QWidget):
                 return
             if self.ui_state.is_volume_dragged:
                 self.ui_state.is_volume_dragged = False
-                self.update()
+                self._maybe_update()
                 return
             if self.ui_state.is_balance_dragged:
                 self.ui_state.is_balance_dragged = False
-                self.update()
+                self._maybe_update()
                 return
             if self.ui_state.dragging_position:
                 self.ui_state.dragging_position = False
-                self.update()
+                self._maybe_update()
                 return
 
-            # Reset pressed states for control buttons, but keep play/pause/stop states reflecting actual playback
-            if self.ui_state.is_previous_pressed:
-                self.ui_state.is_previous_pressed = False
-                self.update()
-                return
-            # Don't automatically reset play/pause/stop - their state reflects actual playback status
-            # Update these states based on the actual audio engine state instead
-            if self.ui_state.is_next_pressed:
-                self.ui_state.is_next_pressed = False
-                self.update()
-                return
-            if self.ui_state.is_eject_pressed:
-                self.ui_state.is_eject_pressed = False
-                self.update()
-                return
-
-            # Reset pressed states for EQ and Playlist buttons
-            if self.ui_state.is_eq_pressed:
-                self.ui_state.is_eq_pressed = False
-                self.update()
-                return
-            if self.ui_state.is_playlist_pressed:
-                self.ui_state.is_playlist_pressed = False
-                self.update()
-                return
-
-            # Reset pressed states for Shuffle and Repeat buttons
-            if self.ui_state.is_shuffle_pressed:
-                self.ui_state.is_shuffle_pressed = False
-                self.update()
-                return
-            if self.ui_state.is_repeat_pressed:
-                self.ui_state.is_repeat_pressed = False
-                self.update()
-                return
-
-            # Reset pressed states for Clutterbar buttons
-            if self.ui_state.is_options_pressed:
-                self.ui_state.is_options_pressed = False
-                self.update()
-                return
-            if self.ui_state.is_always_on_top_pressed:
-                self.ui_state.is_always_on_top_pressed = False
-                self.update()
-                return
-            if self.ui_state.is_file_info_pressed:
-                self.ui_state.is_file_info_pressed = False
-                self.update()
-                return
-            if self.ui_state.is_double_size_pressed:
-                self.ui_state.is_double_size_pressed = False
-                self.update()
-                return
-            if self.ui_state.is_visualization_menu_pressed:
-                self.ui_state.is_visualization_menu_pressed = False
-                self.update()
+            # Reset pressed states for control, EQ/Playlist, Shuffle/Repeat and Clutterbar
+            # buttons, one per release in PRESS_* bit order. Play/pause/stop aren't in the
+            # mask - their state reflects actual playback status
+            pressed_mask = self.ui_state.pressed_mask
+            if pressed_mask:
+                # Clear the lowest set bit
+                self.ui_state.pressed_mask = pressed_mask & (pressed_mask - 1)
+                self._maybe_update()
                 return
 
         super().mouseReleaseEvent(event)
 
     def _update_volume_from_mouse(self, mouse_pos):
-        spec = self.skin_data.spec_json
-        volume_area_spec = spec["destinations"]["main_window"]["areas"]["volume_slider"]
+        volume_area_spec = self._volume_area_spec
 
         slider_width = volume_area_spec["w"]
         relative_x = mouse_pos.x() - volume_area_spec["x"]
@@ -1773,14 +2141,11 @@ class MainWindow(QWidget):
         relative_x = max(0, min(relative_x, slider_width))
 
         self.ui_state.volume = relative_x / slider_width
-        self.audio_engine.set_volume(self.ui_state.volume)
-        self.update()
+        self._pending_volume = self.ui_state.volume
+        self._schedule_slider_flush()
 
     def _update_balance_from_mouse(self, mouse_pos):
-        spec = self.skin_data.spec_json
-        balance_area_spec = spec["destinations"]["main_window"]["areas"][
-            "balance_slider"
-        ]  # Use balance_slider area per spec
+        balance_area_spec = self._balance_area_spec  # Use balance_slider area per spec
 
         slider_width = balance_area_spec["w"]
         relative_x = mouse_pos.x() - balance_area_spec["x"]
@@ -1793,14 +2158,11 @@ class MainWindow(QWidget):
         self.ui_state.balance = (
             normalized_position * 2
         ) - 1  # Convert to -1 to 1 range
-        self.audio_engine.set_balance(self.ui_state.balance)
-        self.update()
+        self._pending_balance = self.ui_state.balance
+        self._schedule_slider_flush()
 
     def _update_position_from_mouse(self, mouse_pos):
-        spec = self.skin_data.spec_json
-        position_area_spec = spec["destinations"]["main_window"]["areas"][
-            "position_track"
-        ]
+        position_area_spec = self._position_area_spec
 
         slider_width = position_area_spec["w"]
         relative_x = mouse_pos.x() - position_area_spec["x"]
@@ -1810,12 +2172,48 @@ class MainWindow(QWidget):
         # Calculate the position as a fraction (0.0 to 1.0) of the total duration
         position_fraction = relative_x / slider_width
         self.ui_state.position = position_fraction
-        self.audio_engine.seek(position_fraction)
+        self._pending_position = position_fraction
+        self._schedule_slider_flush()
+
+    def _schedule_slider_flush(self):
+        """Apply pending slider values once the queued mouse events have been handled.
+
+        Qt doesn't compress mouse move events, so a drag can deliver several moves per
+        event loop iteration; only the latest value of each slider reaches the engine.
+        """
+        if not self._slider_flush_scheduled:
+            self._slider_flush_scheduled = True
+            QTimer.singleShot(0, self, self._flush_slider_updates)
+
+    def _flush_slider_updates(self):
+        """Send the latest volume, balance and position values to the audio engine."""
+        self._slider_flush_scheduled = False
+        if self._pending_volume is not None:
+            self.audio_engine.set_volume(self._pending_volume)
+            self._pending_volume = None
+        if self._pending_balance is not None:
+            self.audio_engine.set_balance(self._pending_balance)
+            self._pending_balance = None
+        if self._pending_position is not None:
+            self.audio_engine.seek(self._pending_position)
+            self._pending_position = None
         self.update()
 
+    def resizeEvent(self, event):
+        """Invalidate cached geometry when the window is resized."""
+        self._cached_main_rect = None
+        self._invalidate_docked_union_rects()
+        # The titlebar spans the full window width
+        if self._hit_rects:
+            self._hit_rects["titlebar"] = QRect(0, 0, self.width(), 14)
+            self._build_hit_mask()
+        super().resizeEvent(event)
+
     def moveEvent(self, event):
         """Handle window movement to keep docked windows in the right position."""
         super().moveEvent(event)
+        self._cached_main_rect = None
+        self._invalidate_docked_union_rects()
 
         # Calculate the movement delta
         dx, dy = 0, 0
@@ -1826,18 +2224,20 @@ class MainWindow(QWidget):
         # Update the stored position for next time
         self._old_main_pos = self.pos()
 
-        # Save main window position to preferences
-        self.preferences.set_main_window_position(self.x(), self.y())
+        # Save the position and re-check docking states at most once per timer interval
+        # rather than on every pixel of a drag
+        if not self._dock_recheck_timer.isActive():
+            self._dock_recheck_timer.start()
 
         # Handle all docked child windows
         # Only move child windows after initialization is complete to avoid moving them before their positions are set from preferences
-        if getattr(self, "_initialization_complete", False):
+        if self._initialization_complete:
             child_windows = []
-            if hasattr(self, "playlist_window"):
+            if self.playlist_window is not None:
                 child_windows.append(self.playlist_window)
-            if hasattr(self, "equalizer_window"):
+            if self.equalizer_window is not None:
                 child_windows.append(self.equalizer_window)
-            if hasattr(self, "album_art_window"):
+            if self.album_art_window is not None:
                 child_windows.append(self.album_art_window)
 
             # Process each docked child window
@@ -1850,25 +2250,51 @@ class MainWindow(QWidget):
                         new_y = child_window.y() + dy
                         child_window.move(new_x, new_y)
 
-                    # Check if the child window is still near the main window or other docked windows to maintain docked state
-                    child_rect = QRect(
-                        child_window.x(),
-                        child_window.y(),
-                        child_window.width(),
-                        child_window.height(),
-                    )
-                    is_still_near = self.is_window_near_any_docked_window(
-                        child_rect, exclude_window=child_window
-                    )
-                    # Update docked state based on proximity to any docked window
-                    child_window.is_docked = is_still_near
+    def _recheck_dock_proximity(self):
+        """Save the main window position and refresh child docking states after moves."""
+        # Save main window position to preferences
+        self.preferences.set_main_window_position(self.x(), self.y())
+
+        # Check if the child windows are still near the main window or other docked
+        # windows to maintain docked state
+        if self._initialization_complete:
+            self._recalculate_docking_states()
+
+    def _parse_skin(self, skin_path):
+        """Return (parser, skin data) for a skin, reusing an earlier parse if possible.
+
+        A cached skin is reused while the skin file is unchanged and its extracted
+        files are still on disk, so switching back to a skin skips the unzip and the
+        spec/bitmap loading.
+        """
+        try:
+            mtime = os.path.getmtime(skin_path)
+        except OSError:
+            mtime = None
+
+        cached = self._skin_cache.get(skin_path)
+        if cached is not None:
+            cached_mtime, parser, skin_data = cached
+            if cached_mtime == mtime and os.path.isdir(skin_data.extracted_skin_dir):
+                return parser, skin_data
+            del self._skin_cache[skin_path]
+
+        parser = SkinParser(skin_path)
+        skin_data = parser.parse()
+        if skin_data.extracted_skin_dir:
+            # Skins with the same file name extract to the same directory, so this
+            # parse may have replaced the files of a cached skin
+            for path, (_, _, other) in list(self._skin_cache.items()):
+                if other.extracted_skin_dir == skin_data.extracted_skin_dir:
+                    del self._skin_cache[path]
+            self._skin_cache[skin_path] = (mtime, parser, skin_data)
+        return parser, skin_data
 
     def load_new_skin(self, skin_path):
         """Load a new skin from the specified path."""
         try:
-            # Create a new SkinParser instance for the new skin
-            new_skin_parser = SkinParser(skin_path)
-            new_skin_data = new_skin_parser.parse()
+            # Parse the new skin, or reuse it if it was loaded before
+            new_skin_parser, new_skin_data = self._parse_skin(skin_path)
 
             if not new_skin_data.extracted_skin_dir:
                 print(f"ERROR: Failed to load skin from {skin_path}")
@@ -1903,26 +2329,25 @@ class MainWindow(QWidget):
             )
 
             # Also update the playlist window with the new skin
-            if hasattr(self, "playlist_window") and self.playlist_window:
+            if self.playlist_window is not None:
                 self.playlist_window.update_skin(
                     self.skin_data, self.renderer.sprite_manager, self.text_renderer
                 )
 
             # Also update the equalizer window with the new skin
-            if hasattr(self, "equalizer_window") and self.equalizer_window:
+            if self.equalizer_window is not None:
                 self.equalizer_window.update_skin(
                     self.skin_data, self.renderer.sprite_manager
                 )
 
             # Update the window size based on the new skin (main.bmp size may be different)
-            if self.skin_data.main_bmp_path:
-                from PIL import Image
-
-                img = Image.open(self.skin_data.main_bmp_path)
+            if self.skin_data.main_bmp_size:
+                width, height = self.skin_data.main_bmp_size
                 current_pos = self.pos()  # Keep the current position
-                self.setGeometry(
-                    current_pos.x(), current_pos.y(), img.width, img.height
-                )
+                self.setGeometry(current_pos.x(), current_pos.y(), width, height)
+
+            # Rebuild the clickable areas for the new skin and window size
+            self._build_hit_rects()
 
             # Apply region mask if available
             self.apply_region_mask()
@@ -1944,7 +2369,8 @@ class MainWindow(QWidget):
                 self,
                 "Load Winamp Skin",
                 "",
-                "Winamp Skins (*.wsz *.zip);;Winamp Skins (*.wsz);;ZIP Files (*.zip);;All Files (*)",
+                _SKIN_FILE_FILTER,
+                options=_FILE_DIALOG_OPTIONS,
             )
 
             if skin_path:
@@ -1958,20 +2384,22 @@ class MainWindow(QWidget):
 
     def update_visualization(self):
         """Update visualization by getting data from audio engine and updating renderer."""
-        if hasattr(self, "audio_engine") and self.audio_engine:
-            # Get visualization data from the queue if available
-            try:
-                # Get all available visualization data (non-blocking)
-                while True:
-                    vis_data = self.audio_engine.vis_data_queue.get_nowait()
-                    # Update the renderer with the visualization data
-                    self.renderer.update_visualization_data(vis_data)
-            except Exception:
-                # Queue is empty, which is fine
-                pass
-
-            # Trigger a repaint to show the updated visualization
-            self.update()
+        if self.audio_engine is not None:
+            # Take all available visualization data in one step under the queue's lock,
+            # rather than calling get_nowait() until it raises queue.Empty
+            vis_data_queue = self.audio_engine.vis_data_queue
+            with vis_data_queue.mutex:
+                pending_vis_data = list(vis_data_queue.queue)
+                vis_data_queue.queue.clear()
+
+            for vis_data in pending_vis_data:
+                # Update the renderer with the visualization data
+                self.renderer.update_visualization_data(vis_data)
+
+            # Trigger a repaint to show the updated visualization; the scrolling title
+            # also relies on this timer to animate, so keep repainting while it scrolls
+            if pending_vis_data or self.renderer.scrolling_text_renderer.is_scrolling:
+                self.update()
 
     def setup_media_shortcuts(self):
         """Set up keyboard shortcuts for media controls."""
@@ -1981,26 +2409,27 @@ class MainWindow(QWidget):
         space_shortcut.activated.connect(self.toggle_play_pause)
 
         # Alternative media keys - may require system permissions on macOS
-        try:
-            # Play/Pause key
-            play_pause_shortcut = QShortcut(QKeySequence("Media Play"), self)
-            play_pause_shortcut.activated.connect(self.toggle_play_pause)
-
-            # Next track key
-            next_shortcut = QShortcut(QKeySequence("Media Next"), self)
-            next_shortcut.activated.connect(self.play_next_track)
-
-            # Previous track key
-            prev_shortcut = QShortcut(QKeySequence("Media Previous"), self)
-            prev_shortcut.activated.connect(self.play_previous_track)
-
-            # Stop key
-            stop_shortcut = QShortcut(QKeySequence("Media Stop"), self)
-            stop_shortcut.activated.connect(self._handle_stop_action)
-        except Exception:
+        media_key_handlers = (
+            ("Media Play", self.toggle_play_pause),  # Play/Pause key
+            ("Media Next", self.play_next_track),  # Next track key
+            ("Media Previous", self.play_previous_track),  # Previous track key
+            ("Media Stop", self._handle_stop_action),  # Stop key
+        )
+        unsupported_keys = []
+        for key_name, handler in media_key_handlers:
+            # Bind each key separately so one unsupported key doesn't prevent the
+            # others from being bound
+            try:
+                shortcut = QShortcut(QKeySequence(key_name), self)
+                shortcut.activated.connect(handler)
+            except Exception:
+                unsupported_keys.append(key_name)
+
+        if unsupported_keys:
             # If Media keys are not supported on this system, just use space bar as primary control
             print(
-                "Media keys not supported on this system, use Space bar for play/pause"
+                f"Media keys not supported on this system ({', '.join(unsupported_keys)}), "
+                "use Space bar for play/pause"
             )
 
         # Using only regular PyQt5 keyboard shortcuts for media keys
@@ -2008,6 +2437,7 @@ class MainWindow(QWidget):
 
     def toggle_play_pause(self):
         """Toggle between play and pause states."""
+        self._engine_dirty = True
         if self.audio_engine.is_paused:
             # If paused, resume playback
             self.audio_engine.play()
@@ -2035,7 +2465,7 @@ class MainWindow(QWidget):
                     self.play_track_at_index(selected_track_index)
 
         # Update macOS media integration with new playback state
-        if hasattr(self, "mac_media_integration") and self.mac_media_integration:
+        if self.mac_media_integration:
             self.mac_media_integration.update_playback_state()
 
     def load_and_play_file(self, file_path):
@@ -2065,7 +2495,7 @@ class MainWindow(QWidget):
         # If nothing is playing and playlist is empty, use original behavior
         if is_stopped and len(self.playlist) == 0:
             # Original behavior: add to playlist and play immediately
-            if self.audio_engine.load_track(file_path):
+            if self._load_engine_track(file_path):
                 # For single file loading, create a new playlist with just this file
                 self.playlist = [file_path]
                 self.current_track_index = 0
@@ -2073,33 +2503,22 @@ class MainWindow(QWidget):
                 # Update the playlist window display
                 self.update_playlist_display()
 
-                # Update the current track title
-                metadata = self.audio_engine.get_metadata()
-                if metadata:
-                    # Format as "artist - song title" for display
-                    self.ui_state.current_track_title = f"{metadata.get('artist', 'Unknown')} - {metadata.get('title', 'Unknown')}"
-                else:
-                    self.ui_state.current_track_title = os.path.basename(file_path)
-
                 # Start playback
                 self.audio_engine.play()
 
                 # Update playlist window to show currently playing track
-                if hasattr(self, "playlist_window"):
+                if self.playlist_window is not None:
                     self.playlist_window.set_current_track_index(0)
 
                 # Refresh album art if the window is visible
                 if (
-                    hasattr(self, "album_art_window")
+                    self.album_art_window is not None
                     and self.album_art_window.isVisible()
                 ):
                     self.album_art_window.refresh_album_art(self.audio_engine)
 
                 # Update macOS media integration with new track info
-                if (
-                    hasattr(self, "mac_media_integration")
-                    and self.mac_media_integration
-                ):
+                if self.mac_media_integration:
                     self.mac_media_integration.update_now_playing_info()
                     self.mac_media_integration.update_playback_state()
 
@@ -2109,17 +2528,26 @@ class MainWindow(QWidget):
                 return False
         else:
             # Add the file to the bottom of the playlist
-            if file_path not in self.playlist:  # Avoid duplicates
+            # Avoid duplicates; the path lookup avoids scanning the whole playlist
+            if file_path not in self._path_to_index:
                 self.playlist.append(file_path)
-                self.update_playlist_display()
+                self._path_to_index[file_path] = len(self.playlist) - 1
 
-                # If a track is playing, just add to playlist and return
+                # If a track is playing, just add to playlist and return. The tags are
+                # read on a worker thread and the playlist is refreshed once they arrive
                 if is_playing:
+                    if self.playlist_window is not None:
+                        self.playlist_window.expect_track_metadata(file_path)
+                    self._metadata_pool.start(
+                        partial(self._load_track_metadata, file_path)
+                    )
                     print(
                         f"Added {os.path.basename(file_path)} to playlist (not interrupting current track)"
                     )
                     return True
 
+                self.update_playlist_display()
+
                 # If no track is playing but playlist was not empty, play the newly added track
                 # Find the index of the newly added track (it's at the end)
                 new_index = len(self.playlist) - 1
@@ -2133,40 +2561,79 @@ class MainWindow(QWidget):
                 print(f"File {file_path} already exists in playlist, skipping")
                 return True
 
+    def load_and_play_files(self, file_paths):
+        """Load several files and directories, e.g. from a drop, in order.
+
+        Each path is handled like a single drop, but the playlist display is refreshed
+        once at the end rather than once per file.
+        """
+        self._suppress_playlist_display = True
+        try:
+            for file_path in file_paths:
+                path_kind = _path_kind(file_path)
+                if path_kind == "file":
+                    # If it's a file, load and play it
+                    self.load_and_play_file(file_path)
+                elif path_kind == "dir":
+                    # If it's a directory, load all audio files from it
+                    self.load_directory(file_path)
+        finally:
+            self._suppress_playlist_display = False
+
+        self.update_playlist_display()
+        # Refreshing resets the highlighted track, which the loads above may have set
+        if self.playlist_window is not None and self.current_track_index >= 0:
+            self.playlist_window.set_current_track_index(self.current_track_index)
+
     def load_directory(self, directory_path):
         """Load all media files from a directory and its subdirectories."""
         if not os.path.isdir(directory_path):
             print(f"Directory not found: {directory_path}")
             return False
 
-        # Define supported media file extensions
-        media_extensions = {
-            ".mp3",
-            ".wav",
-            ".ogg",
-            ".flac",
-            ".m4a",
-            ".aac",
-            ".wma",
-            ".mp4",
-            ".m3u",
-            ".pls",
-            ".opus",
-            ".aiff",
-            ".au",
-        }
-
-        # Collect files from the directory and its subdirectories
-        new_files_collected = []
-        for root, dirs, files in os.walk(directory_path):
-            for file in files:
-                file_ext = os.path.splitext(file)[1].lower()
-                if file_ext in media_extensions:
-                    full_path = os.path.join(root, file)
-                    new_files_collected.append(full_path)
+        # Collect files from the directory and its subdirectories. This walks the tree
+        # in the same order as os.walk, but uses the DirEntry objects directly: their
+        # paths and file types come from the directory listing itself, so no extra
+        # stat or path join is needed per entry
+        # (lowercase file name, path) pairs, so the sort key comes from the directory
+        # entry's name instead of being derived from each path again
+        named_files = []
+        # Looked up once rather than for every matching file
+        add_file = named_files.append
+        pending_dirs = [directory_path]
+        while pending_dirs:
+            subdirs = []
+            try:
+                with os.scandir(pending_dirs.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if is_dir:
+                            # Like os.walk, don't descend into symlinked directories
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        else:
+                            # Same extension as os.path.splitext would give: text after
+                            # the last dot, ignoring leading dots
+                            name = entry.name
+                            dot = name.rfind(".")
+                            if (
+                                dot > 0
+                                and name[dot + 1 :].lower() in _MEDIA_EXTENSIONS
+                                and (name[0] != "." or name[:dot].lstrip("."))
+                            ):
+                                add_file((name.lower(), entry.path))
+            except OSError:
+                # Unreadable directories are skipped, as os.walk does
+                continue
+            # Visit subdirectories depth first in listing order
+            pending_dirs.extend(reversed(subdirs))
 
         # Sort the new files by filename
-        new_files_collected.sort(key=lambda path: os.path.basename(path).lower())
+        named_files.sort(key=itemgetter(0))
+        new_files_collected = [path for _, path in named_files]
 
         # Add sorted new files to the playlist
         if new_files_collected:
@@ -2178,22 +2645,15 @@ class MainWindow(QWidget):
 
             # Update the current track title with the first track
             if self.playlist:
-                first_file = self.playlist[0]
-                # Try to load the first track metadata to display
-                if self.audio_engine.load_track(first_file):
-                    metadata = self.audio_engine.get_metadata()
-                    if metadata:
-                        # Format as "artist - song title" for display
-                        self.ui_state.current_track_title = f"{metadata.get('artist', 'Unknown')} - {metadata.get('title', 'Unknown')}"
-                    else:
-                        self.ui_state.current_track_title = os.path.basename(first_file)
+                # Load the first track; its title is filled in once the tags are read
+                self._load_engine_track(self.playlist[0])
 
             # Update playlist window to show currently playing track
-            if hasattr(self, "playlist_window"):
+            if self.playlist_window is not None:
                 self.playlist_window.set_current_track_index(0)
 
             # Refresh album art if the window is visible
-            if hasattr(self, "album_art_window") and self.album_art_window.isVisible():
+            if self.album_art_window is not None and self.album_art_window.isVisible():
                 self.album_art_window.refresh_album_art(self.audio_engine)
 
             return True
@@ -2212,84 +2672,55 @@ class MainWindow(QWidget):
 
         new_filepaths = []
         file_extension = os.path.splitext(playlist_file_path)[1].lower()
+        playlist_dir = os.path.dirname(playlist_file_path)
+        # Looked up once rather than through os.path for every entry
+        isabs = os.path.isabs
+        join = os.path.join
 
         try:
             if file_extension in [".m3u", ".m3u8"]:
-                # Parse M3U file format
-                with open(playlist_file_path, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
-
-                i = 0
-                while i < len(lines):
-                    line = lines[i].strip()
-                    if (
-                        line
-                        and not line.startswith("#EXTM3U")
-                        and not line.startswith("#EXTINF")
-                    ):
-                        # This is a file path
-                        # Resolve relative paths relative to the playlist file's directory
-                        if not os.path.isabs(line):
-                            line = os.path.join(
-                                os.path.dirname(playlist_file_path), line
-                            )
-                        new_filepaths.append(line)
-                    elif line.startswith("#EXTINF"):
-                        # This is metadata, skip to the next line which should be the file path
-                        i += 1
-                        if i < len(lines):
-                            path_line = lines[i].strip()
-                            if path_line:
-                                # Resolve relative paths relative to the playlist file's directory
-                                if not os.path.isabs(path_line):
-                                    path_line = os.path.join(
-                                        os.path.dirname(playlist_file_path), path_line
-                                    )
-                                new_filepaths.append(path_line)
-                    i += 1
+                # Parse M3U file format, one line at a time. #EXTINF metadata lines
+                # are skipped; the path that follows is picked up as a normal line.
+                # Lines are read as bytes and only the file paths are decoded, since
+                # large playlists are often half metadata
+                with open(playlist_file_path, "rb") as f:
+                    for chunk in f:
+                        # Binary lines only end at "\n"; also split at "\r" like text
+                        # mode's universal newlines
+                        for raw in chunk.splitlines():
+                            stripped = raw.strip()
+                            if not stripped or stripped.startswith(_M3U_SKIP_PREFIXES):
+                                continue
+                            # str.strip() also removes non-ASCII whitespace, so check
+                            # the decoded line again
+                            line = raw.decode("utf-8").strip()
+                            if not line or line.startswith(("#EXTM3U", "#EXTINF")):
+                                continue
+                            # This is a file path
+                            # Resolve relative paths relative to the playlist file's directory
+                            if not isabs(line):
+                                line = join(playlist_dir, line)
+                            new_filepaths.append(line)
             elif file_extension == ".pls":
                 # Parse PLS (Playlist) file format
                 # PLS format: [playlist], File1=/path/to/file, Title1=song title, Length1=duration, NumberOfEntries=total count
+                # Only the FileN entries are needed to build the playlist
+                pls_files = {}
                 with open(playlist_file_path, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
-
-                pls_entries = {}
-                for line in lines:
-                    line = line.strip()
-                    if line.lower().startswith("file") and "=" in line:
-                        # Parse FileN=filepath
-                        key, value = line.split("=", 1)
-                        # Extract the number from keys like File1, File2, etc.
-                        key_lower = key.lower()
-                        if key_lower.startswith("file") and len(key_lower) > 4:
-                            file_num = key_lower[4:]  # Get the number after "file"
-                            if file_num.isdigit():
-                                pls_entries[file_num] = pls_entries.get(file_num, {})
-                                # Resolve relative paths relative to the playlist file's directory
-                                resolved_path = (
-                                    value
-                                    if os.path.isabs(value)
-                                    else os.path.join(
-                                        os.path.dirname(playlist_file_path), value
-                                    )
-                                )
-                                pls_entries[file_num]["file"] = resolved_path
-                    elif line.lower().startswith("title") and "=" in line:
-                        # Parse TitleN=title
-                        key, value = line.split("=", 1)
-                        # Extract the number from keys like Title1, Title2, etc.
-                        key_lower = key.lower()
-                        if key_lower.startswith("title") and len(key_lower) > 5:
-                            title_num = key_lower[5:]  # Get the number after "title"
-                            if title_num.isdigit():
-                                pls_entries[title_num] = pls_entries.get(title_num, {})
-                                pls_entries[title_num]["title"] = value
+                    for line in f:
+                        # Match keys like File1, File2, etc. and capture the number
+                        match = _PLS_FILE_ENTRY.match(line.strip())
+                        if match is None:
+                            continue
+                        file_num, value = match.groups()
+                        # Resolve relative paths relative to the playlist file's directory
+                        pls_files[file_num] = (
+                            value if isabs(value) else join(playlist_dir, value)
+                        )
 
                 # Add entries in numerical order
-                for file_num in sorted(pls_entries.keys(), key=int):
-                    entry = pls_entries[file_num]
-                    if "file" in entry:
-                        new_filepaths.append(entry["file"])
+                for file_num in sorted(pls_files, key=int):
+                    new_filepaths.append(pls_files[file_num])
 
             else:
                 # Plain text file with one file path per line (just in case)
@@ -2298,10 +2729,8 @@ class MainWindow(QWidget):
                         line = line.strip()
                         if line and not line.startswith("#"):
                             # Resolve relative paths relative to the playlist file's directory
-                            if not os.path.isabs(line):
-                                line = os.path.join(
-                                    os.path.dirname(playlist_file_path), line
-                                )
+                            if not isabs(line):
+                                line = join(playlist_dir, line)
                             new_filepaths.append(line)
 
             # Update the main window's playlist
@@ -2356,15 +2785,8 @@ class MainWindow(QWidget):
         """Handle drop event to load files or directories."""
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
-            for url in urls:
-                # Get the local file path from the URL
-                file_path = url.toLocalFile()
-                if os.path.isfile(file_path):
-                    # If it's a file, load and play it
-                    self.load_and_play_file(file_path)
-                elif os.path.isdir(file_path):
-                    # If it's a directory, load all audio files from it
-                    self.load_directory(file_path)
+            # Get the local file paths from the URLs
+            self.load_and_play_files([url.toLocalFile() for url in urls])
 
             event.acceptProposedAction()
         else:
@@ -2377,7 +2799,7 @@ class MainWindow(QWidget):
         self._is_shutting_down = True
 
         # Close all tracked child windows first
-        for window in getattr(self, "_tracked_windows", []):
+        for window in self._tracked_windows:
             if window and window.isVisible():
                 window.close()
 
@@ -2390,15 +2812,15 @@ class MainWindow(QWidget):
         self.preferences.set_main_window_position(self.x(), self.y())
 
         # Stop audio engine
-        if hasattr(self, "audio_engine") and self.audio_engine:
+        if self.audio_engine is not None:
             self.audio_engine.stop()
 
         # Stop and clean up visualization timer
-        if hasattr(self, "visualization_timer"):
+        if self.visualization_timer:
             self.visualization_timer.stop()
 
         # Clean up macOS media integration
-        if hasattr(self, "mac_media_integration") and self.mac_media_integration:
+        if self.mac_media_integration:
             self.mac_media_integration.cleanup()
 
         event.accept()
@@ -2406,7 +2828,7 @@ class MainWindow(QWidget):
     def _initiate_shutdown(self):
         """Single point of entry for all quit operations."""
         # Prevent multiple shutdown attempts
-        if getattr(self, "_shutdown_in_progress", False):
+        if self._shutdown_in_progress:
             return
 
         self._shutdown_in_progress = True
@@ -2423,24 +2845,24 @@ class MainWindow(QWidget):
     def _perform_coordinated_shutdown(self):
         """Coordinate the shutdown sequence in a predictable order."""
         # 1. Close all tracked child windows first
-        for window in getattr(self, "_tracked_windows", []):
+        for window in self._tracked_windows:
             if window and window.isVisible():
                 window.close()
 
         # 2. Stop all timers
-        if hasattr(self, "playback_timer"):
+        if self.playback_timer:
             self.playback_timer.stop()
-        if hasattr(self, "track_completion_timer"):
+        if self.track_completion_timer:
             self.track_completion_timer.stop()
-        if hasattr(self, "visualization_timer"):
+        if self.visualization_timer:
             self.visualization_timer.stop()
 
         # 3. Stop audio engine
-        if hasattr(self, "audio_engine"):
+        if self.audio_engine is not None:
             self.audio_engine.stop()
 
         # 4. Clean up macOS media integration
-        if hasattr(self, "mac_media_integration") and self.mac_media_integration:
+        if self.mac_media_integration:
             self.mac_media_integration.cleanup()
 
         # 5. Save current window visibility states to preferences
@@ -2461,15 +2883,15 @@ class MainWindow(QWidget):
         )
 
         # Save all window positions (only for windows that were visible at shutdown)
-        if self.ui_state.eq_button_on and hasattr(self, "equalizer_window"):
+        if self.ui_state.eq_button_on and self.equalizer_window is not None:
             self.preferences.set_eq_window_position(
                 self.equalizer_window.x(), self.equalizer_window.y()
             )
-        if self.ui_state.playlist_button_on and hasattr(self, "playlist_window"):
+        if self.ui_state.playlist_button_on and self.playlist_window is not None:
             self.preferences.set_playlist_window_position(
                 self.playlist_window.x(), self.playlist_window.y()
             )
-        if self.ui_state.album_art_visible and hasattr(self, "album_art_window"):
+        if self.ui_state.album_art_visible and self.album_art_window is not None:
             self.preferences.set_album_art_window_position(
                 self.album_art_window.x(), self.album_art_window.y()
             )
@@ -2484,6 +2906,8 @@ def main():
     class WimPyAmpApp(QApplication):
         def __init__(self, sys_argv):
             super().__init__(sys_argv)
+            # Built on first use by _show_about_dialog, then reused
+            self._about_dlg = None
 
         def _setup_native_menus(self):
             """Setup native macOS application menu."""
@@ -2552,59 +2976,36 @@ def main():
                 self.main_window.show_skin_selection_dialog()
 
         def _show_about_dialog(self):
-            """Show an About dialog for the application.
-
-            Use embedded VERSION file when running frozen (PyInstaller bundles).
-            During development, read VERSION from the project root.
-            """
-            version = "0.0.0"
-            try:
-                if getattr(sys, "frozen", False):
-                    # When frozen by PyInstaller, VERSION can be included in sys._MEIPASS
-                    meipass = getattr(sys, "_MEIPASS", None)
-                    if meipass:
-                        version_path = os.path.join(meipass, "VERSION")
-                        if os.path.exists(version_path):
-                            with open(version_path, "r") as vf:
-                                version = vf.read().strip() or version
-                else:
-                    # Development: read VERSION from project root
-                    project_root = os.path.dirname(
-                        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-                    )
-                    version_path = os.path.join(project_root, "VERSION")
-                    if os.path.exists(version_path):
-                        with open(version_path, "r") as vf:
-                            version = vf.read().strip() or version
-            except Exception:
-                pass
-
-            about_html = (
-                f"<h2>WimPyAmp</h2>Version: {version}<br><br>"
-                '<a href="https://github.com/mikeypdev/wimpyamp">https://github.com/mikeypdev/wimpyamp</a><br><br>'
-                "©2025 Mike Perry"
-            )
+            """Show an About dialog for the application."""
+            if self._about_dlg is None:
+                about_html = (
+                    f"<h2>WimPyAmp</h2>Version: {_APP_VERSION}<br><br>"
+                    '<a href="https://github.com/mikeypdev/wimpyamp">https://github.com/mikeypdev/wimpyamp</a><br><br>'
+                    "©2025 Mike Perry"
+                )
 
-            # Use a custom QMessageBox to allow clickable link
-            dlg = QMessageBox()
-            dlg.setWindowTitle("About WimPyAmp")
-            dlg.setTextFormat(Qt.RichText)
-            dlg.setText(about_html)
-            dlg.setStandardButtons(QMessageBox.Ok)
-            dlg.setTextInteractionFlags(Qt.TextBrowserInteraction)
-            # Open links in system browser
-            for child in dlg.findChildren(QLabel):
-                child.setOpenExternalLinks(True)
-            dlg.exec_()
+                # Use a custom QMessageBox to allow clickable link
+                dlg = QMessageBox()
+                dlg.setWindowTitle("About WimPyAmp")
+                dlg.setTextFormat(Qt.RichText)
+                dlg.setText(about_html)
+                dlg.setStandardButtons(QMessageBox.Ok)
+                dlg.setTextInteractionFlags(Qt.TextBrowserInteraction)
+                # Open links in system browser
+                for child in dlg.findChildren(QLabel):
+                    child.setOpenExternalLinks(True)
+                self._about_dlg = dlg
+            self._about_dlg.exec_()
 
         def event(self, event):
             # On macOS, handle file opening events
             if isinstance(event, QFileOpenEvent):
                 if hasattr(self, "main_window"):
                     file_path = event.file()  # Get the file path from the event
-                    if os.path.isfile(file_path):
+                    path_kind = _path_kind(file_path)
+                    if path_kind == "file":
                         self.main_window.load_and_play_file(file_path)
-                    elif os.path.isdir(file_path):
+                    elif path_kind == "dir":
                         self.main_window.load_directory(file_path)
             return super().event(event)
 
@@ -2618,9 +3019,10 @@ def main():
         for arg in sys.argv[1:]:
             # Check if argument is a file or directory path (not an option flag)
             if not arg.startswith("-"):
-                if os.path.isfile(arg):
+                path_kind = _path_kind(arg)
+                if path_kind == "file":
                     file_paths.append(arg)
-                elif os.path.isdir(arg):
+                elif path_kind == "dir":
                     dir_paths.append(arg)
 
     window = MainWindow()
@@ -6,14 +6,38 @@ from PySide6.QtCore import QRect
 class ButtonBarManager:
     def __init__(self, window, playlist_spec):
         self.window = window
-        self.playlist_spec = playlist_spec
         self.pressed_buttons = {}  # Stores {button_id: True/False}
+        # Stores {(window width, window height, button_id): QRect}
+        self._rect_cache = {}
+        self.set_playlist_spec(playlist_spec)
+
+    def set_playlist_spec(self, playlist_spec):
+        """Use a new playlist spec, e.g. after a skin change."""
+        self.playlist_spec = playlist_spec
+        self._button_bar_x = playlist_spec["layout"]["controls"]["button_bar"][
+            "position"
+        ]["x"]
+        self.clear_rect_cache()
+
+    def clear_rect_cache(self):
+        """Forget cached button rectangles (sprites or window size changed)."""
+        self._rect_cache.clear()
 
     def get_button_rect(self, button_data):
         """Calculate the rectangle for a button."""
-        button_bar_spec = self.playlist_spec["layout"]["controls"]["button_bar"]
-        button_bar_x = button_bar_spec["position"]["x"]
-        button_bar_y = self.window.height() - 28  # Consistent with paintEvent
+        window_width = self.window.width()
+        window_height = self.window.height()
+        key = (window_width, window_height, button_data["id"])
+        rect = self._rect_cache.get(key)
+        if rect is None:
+            rect = self._compute_button_rect(button_data, window_width, window_height)
+            self._rect_cache[key] = rect
+        return rect
+
+    def _compute_button_rect(self, button_data, window_width, window_height):
+        """Calculate the rectangle for a button at the given window size."""
+        button_bar_x = self._button_bar_x
+        button_bar_y = window_height - 28  # Consistent with paintEvent
 
         button_pixmap = self.window._get_sprite_pixmap(button_data["sprite"])
         if not button_pixmap:
@@ -29,7 +53,7 @@ class ButtonBarManager:
             right_margin = 21  # Approximate right margin in original skin
 
             # Position button maintaining same margin to right edge
-            button_x = self.window.width() - button_pixmap.width() - right_margin
+            button_x = window_width - button_pixmap.width() - right_margin
         else:
             # Use fixed positioning for other buttons
             button_x = button_bar_x + button_data["x"]
@@ -1,6 +1,18 @@
 """Configuration manager for the playlist window."""
 
 
+def parse_window_offset(expr, dimension):
+    """Parse a spec position like "window.width - N[ - M...]" or a fixed value.
+
+    dimension is "width" or "height". Returns (from_window, offset): the position
+    is the window's size along that dimension (or 0 if not from_window) minus
+    offset, so it can be recomputed on resize without parsing the string again.
+    """
+    if isinstance(expr, str) and expr.startswith(f"window.{dimension}"):
+        return True, sum(int(part) for part in expr.split(" - ")[1:])
+    return False, -int(expr)
+
+
 class PlaylistConfig:
     def __init__(self, playlist_spec_json):
         self.spec = playlist_spec_json
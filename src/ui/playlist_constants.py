@@ -9,8 +9,11 @@ DEFAULT_ROW_HEIGHT = 13
 SCROLLBAR_GROOVE_HEIGHT = 29
 BOTTOM_FILLER_WIDTH = 25
 
+# Rendered track rows kept for repaints (least recently used are dropped first)
+TRACK_LINE_CACHE_SIZE = 512
+
 # UI States
-MENU_BUTTON_IDS = ["add", "remove", "select", "misc", "list"]
+MENU_BUTTON_IDS = frozenset({"add", "remove", "select", "misc", "list"})
 SUB_MENU_HEIGHTS = {
     "add": 3 * DEFAULT_BUTTON_HEIGHT,
     "remove": 4 * DEFAULT_BUTTON_HEIGHT,
@@ -19,6 +22,21 @@ SUB_MENU_HEIGHTS = {
     "list": 3 * DEFAULT_BUTTON_HEIGHT,
 }
 
+# Tag keys tried in order when reading track metadata (ID3, Vorbis, MP4, ...)
+TITLE_TAG_KEYS = ("TIT2", "title", "\xa9nam", "TITLE")
+ARTIST_TAG_KEYS = ("TPE1", "artist", "\xa9ART", "ARTIST")
+ALBUM_TAG_KEYS = ("TALB", "album", "\xa9alb", "ALBUM")
+ALBUM_ARTIST_TAG_KEYS = ("TPE2", "albumartist", "aART", "\xa9aAR")
+
+# Display options that add a metadata field to a track's text, in display order
+DISPLAY_OPTION_FIELDS = (
+    ("track_number", "tracknumber"),
+    ("song_name", "title"),
+    ("artist", "artist"),
+    ("album_artist", "album_artist"),
+    ("album_name", "album"),
+)
+
 # Default colors
 DEFAULT_NORMAL_BG_COLOR = "#000000"
 DEFAULT_SELECTED_BG_COLOR = "#0000C6"
@@ -1,29 +1,42 @@
 """Menu manager for the playlist window."""
 
 from PySide6.QtCore import QRect
-from .playlist_constants import DEFAULT_BUTTON_HEIGHT, SUB_MENU_HEIGHTS
+from .playlist_constants import (
+    DEFAULT_BUTTON_HEIGHT,
+    MENU_BUTTON_IDS,
+    SUB_MENU_HEIGHTS,
+)
 
 
 class MenuManager:
     def __init__(self, window, playlist_spec):
         self.window = window
-        self.playlist_spec = playlist_spec
+        # Stores {(window height, button_id): QRect}
+        self._rect_cache = {}
+        self.set_playlist_spec(playlist_spec)
 
-        # State for menus
-        self.add_menu_open = False
-        self.remove_menu_open = False
-        self.select_menu_open = False
-        self.misc_menu_open = False
-        self.list_menu_open = False
+        # State for menus: at most one menu is open at a time
+        self.open_menu_id = None
         self.hovered_sub_menu_button_id = None
 
+    def set_playlist_spec(self, playlist_spec):
+        """Use a new playlist spec, e.g. after a skin change."""
+        self.playlist_spec = playlist_spec
+        button_bar_spec = playlist_spec["layout"]["controls"]["button_bar"]
+        self._button_bar_x = button_bar_spec["position"]["x"]
+        # Stores {button_id: button_data} for the button bar's buttons
+        self._buttons_by_id = {
+            button_data["id"]: button_data for button_data in button_bar_spec["buttons"]
+        }
+        self.clear_rect_cache()
+
+    def clear_rect_cache(self):
+        """Forget cached menu rectangles (spec or window size changed)."""
+        self._rect_cache.clear()
+
     def close_all_menus(self):
         """Close all open sub-menus."""
-        self.add_menu_open = False
-        self.remove_menu_open = False
-        self.select_menu_open = False
-        self.misc_menu_open = False
-        self.list_menu_open = False
+        self.open_menu_id = None
         self.hovered_sub_menu_button_id = None
         self.window.update()
 
@@ -33,37 +46,29 @@ class MenuManager:
         self.close_all_menus()
 
         # Open the requested menu
-        if button_id == "add":
-            self.add_menu_open = True
-        elif button_id == "remove":
-            self.remove_menu_open = True
-        elif button_id == "select":
-            self.select_menu_open = True
-        elif button_id == "misc":
-            self.misc_menu_open = True
-        elif button_id == "list":
-            self.list_menu_open = True
+        if button_id in MENU_BUTTON_IDS:
+            self.open_menu_id = button_id
 
         self.window.update()
 
     def get_menu_rect(self, button_id):
         """Get the bounding rectangle for a menu."""
-        button_data = next(
-            (
-                b
-                for b in self.playlist_spec["layout"]["controls"]["button_bar"][
-                    "buttons"
-                ]
-                if b["id"] == button_id
-            ),
-            None,
-        )
+        window_height = self.window.height()
+        key = (window_height, button_id)
+        rect = self._rect_cache.get(key)
+        if rect is None:
+            rect = self._compute_menu_rect(button_id, window_height)
+            self._rect_cache[key] = rect
+        return rect
+
+    def _compute_menu_rect(self, button_id, window_height):
+        """Calculate the bounding rectangle for a menu at the given window height."""
+        button_data = self._buttons_by_id.get(button_id)
         if not button_data:
             return QRect()
 
-        button_bar_spec = self.playlist_spec["layout"]["controls"]["button_bar"]
-        button_bar_x = button_bar_spec["position"]["x"]
-        button_bar_y = self.window.height() - 28  # Consistent with paintEvent
+        button_bar_x = self._button_bar_x
+        button_bar_y = window_height - 28  # Consistent with paintEvent
 
         main_button_x = button_bar_x + button_data["x"]
         main_button_y = button_bar_y + button_data["y"]
@@ -77,28 +82,13 @@ class MenuManager:
 
     def is_menu_open(self, button_id):
         """Check if a specific menu is open."""
-        if button_id == "add":
-            return self.add_menu_open
-        elif button_id == "remove":
-            return self.remove_menu_open
-        elif button_id == "select":
-            return self.select_menu_open
-        elif button_id == "misc":
-            return self.misc_menu_open
-        elif button_id == "list":
-            return self.list_menu_open
-        return False
+        return self.open_menu_id is not None and button_id == self.open_menu_id
 
     def handle_outside_click(self, pos):
         """Handle clicks outside of open menus."""
-        menu_closed = False
-
-        for button_id in ["add", "remove", "select", "misc", "list"]:
-            if self.is_menu_open(button_id):
-                menu_rect = self.get_menu_rect(button_id)
-                if not menu_rect.contains(pos):
-                    self.close_all_menus()
-                    menu_closed = True
-                    break
-
-        return menu_closed
+        if self.open_menu_id is None:
+            return False
+        if self.get_menu_rect(self.open_menu_id).contains(pos):
+            return False
+        self.close_all_menus()
+        return True
@@ -1,96 +1,103 @@
 """Scrollbar manager for the playlist window."""
 
-import os
-from PySide6.QtCore import QRect
-from ..utils.color import MAGENTA_TRANSPARENCY_RGB
+from PySide6.QtCore import QRect, QTimer
+from .playlist_config import parse_window_offset
 
 
 class ScrollbarManager:
-    def __init__(self, window, playlist_spec, sprite_manager, skin_data):
+    def __init__(self, window, playlist_spec):
         self.window = window
-        self.playlist_spec = playlist_spec
-        self.sprite_manager = sprite_manager
-        self.skin_data = skin_data
+        # Stores {(element_id, window width, window height): QRect}
+        self._rect_cache = {}
+        # Scrolling metrics and the (window width, window height, playlist length)
+        # they were computed for; see _get_scroll_metrics
+        self._scroll_metrics_key = None
+        self._scroll_metrics = None
+        self.set_playlist_spec(playlist_spec)
 
         # State for scrollbar elements
         self.pressed_elements = {}  # Stores {element_id: True/False}
         self.dragging_thumb = False
         self.thumb_drag_start_y = 0
         self.thumb_start_scroll_offset = 0
+        # Latest thumb drag position not yet applied; see update_thumb_drag
+        self._pending_drag_pos = None
+        self._drag_flush_scheduled = False
+
+    def set_playlist_spec(self, playlist_spec):
+        """Use a new playlist spec, e.g. after a skin change.
+
+        The scrollbar's x position expression is parsed here, once, so that
+        get_element_rect only has to subtract an offset from the window width.
+        """
+        self.playlist_spec = playlist_spec
+        # Element sizes, and the scroll metrics derived from them, come from the
+        # new skin's sprites
+        self.clear_rect_cache()
+        scrollbar_spec = playlist_spec["layout"]["controls"]["scrollbar"]
+
+        # Scrollbar x is "window.width - N[ - M...]" or a fixed value
+        self._scrollbar_x_from_width, self._scrollbar_x_offset = parse_window_offset(
+            scrollbar_spec["position"]["x"], "width"
+        )
+
+        self._scrollbar_y = scrollbar_spec["position"]["y"]
+
+    def clear_rect_cache(self):
+        """Forget cached element rectangles (sprites or window size changed)."""
+        self._rect_cache.clear()
+        self._scroll_metrics_key = None
 
     def get_element_rect(self, element_id):
         """Calculate the rectangle for a scrollbar element."""
+        window_width = self.window.width()
+        window_height = self.window.height()
+        key = (element_id, window_width, window_height)
+        rect = self._rect_cache.get(key)
+        if rect is None:
+            if element_id == "track" or element_id == "thumb":
+                # Both come from the same geometry, so cache them together
+                track_rect, thumb_rect = self._compute_scrollbar_geometry(window_width)
+                self._rect_cache[("track", window_width, window_height)] = track_rect
+                self._rect_cache[("thumb", window_width, window_height)] = thumb_rect
+                rect = track_rect if element_id == "track" else thumb_rect
+            else:
+                # For up_button and down_button, return empty rectangles since we don't use them
+                rect = QRect()
+                self._rect_cache[key] = rect
+        return rect
+
+    def _compute_scrollbar_geometry(self, window_width):
+        """Calculate the (track, thumb) rectangles for the current window size."""
         scrollbar_spec = self.playlist_spec["layout"]["controls"]["scrollbar"]
 
-        x_expr = scrollbar_spec["position"]["x"]
-        if isinstance(x_expr, str) and "window.width" in x_expr:
-            parts = x_expr.split(" - ")
-            base = self.window.width() if parts[0] == "window.width" else 0
-            offset = sum(int(p) for p in parts[1:])
-            scrollbar_x = base - offset
-        else:
-            scrollbar_x = int(x_expr)
-
-        scrollbar_y = scrollbar_spec["position"]["y"]
+        scrollbar_x = (
+            window_width if self._scrollbar_x_from_width else 0
+        ) - self._scrollbar_x_offset
+        scrollbar_y = self._scrollbar_y
 
         # Calculate bottom bar position
-        bottom_bar_spec = self.playlist_spec["layout"]["regions"]["bottom_bar"]
-        bottom_bar_y_expr = bottom_bar_spec["position"]["y"]
-        if isinstance(bottom_bar_y_expr, str) and bottom_bar_y_expr.startswith(
-            "window.height - "
-        ):
-            offset = int(bottom_bar_y_expr.split(" - ")[1])
-            bottom_bar_y = self.window.height() - offset
-        else:
-            bottom_bar_y = bottom_bar_y_expr
-
-        if element_id == "track":
-            # Define the track area from scrollbar_y to bottom_bar_y (without buttons)
-            track_y = scrollbar_y
-            track_height = bottom_bar_y - scrollbar_y
-            # Get width from the track sprite
-            track_sprite_id = scrollbar_spec["elements"]["track"]
-            track_pixmap = self._get_sprite_pixmap(track_sprite_id)
-            track_width = track_pixmap.width() if track_pixmap else 8  # default width
-
-            return QRect(scrollbar_x, track_y, track_width, track_height)
-        elif element_id == "thumb":
-            # Placeholder for thumb position, will be dynamic
-            track_rect = self.get_element_rect("track")
-            # Get thumb dimensions
-            thumb_sprite_id = scrollbar_spec["elements"]["thumb"]
-            thumb_pixmap = self._get_sprite_pixmap(thumb_sprite_id)
-            thumb_width = thumb_pixmap.width() if thumb_pixmap else 8
-            thumb_height = thumb_pixmap.height() if thumb_pixmap else 18
-            return QRect(scrollbar_x, track_rect.y(), thumb_width, thumb_height)
-        else:
-            # For up_button and down_button, return empty rectangles since we don't use them
-            return QRect()
-
-    def _get_sprite_pixmap(self, sprite_id):
-        """Helper to get a QPixmap for a given sprite ID from the spec."""
-        if not self.sprite_manager or not self.skin_data or not self.playlist_spec:
-            return None
-
-        pledit_bmp_path = self.skin_data.get_path(
-            self.playlist_spec["spriteSheet"]["file"]
+        bottom_bar_y = self.window._get_bottom_bar_y()
+
+        # Define the track area from scrollbar_y to bottom_bar_y (without buttons)
+        track_y = scrollbar_y
+        track_height = bottom_bar_y - scrollbar_y
+        # Get width from the track sprite
+        track_sprite_id = scrollbar_spec["elements"]["track"]
+        track_pixmap = self.window._get_sprite_pixmap(track_sprite_id)
+        track_width = track_pixmap.width() if track_pixmap else 8  # default width
+
+        # Placeholder for thumb position, will be dynamic
+        # Get thumb dimensions
+        thumb_sprite_id = scrollbar_spec["elements"]["thumb"]
+        thumb_pixmap = self.window._get_sprite_pixmap(thumb_sprite_id)
+        thumb_width = thumb_pixmap.width() if thumb_pixmap else 8
+        thumb_height = thumb_pixmap.height() if thumb_pixmap else 18
+
+        return (
+            QRect(scrollbar_x, track_y, track_width, track_height),
+            QRect(scrollbar_x, track_y, thumb_width, thumb_height),
         )
-        if not pledit_bmp_path or not os.path.exists(pledit_bmp_path):
-            print(f"WARNING: {self.playlist_spec['spriteSheet']['file']} not found.")
-            return None
-
-        for sprite_data in self.playlist_spec["spriteSheet"]["sprites"]:
-            if sprite_data["id"] == sprite_id:
-                return self.sprite_manager.load_sprite(
-                    pledit_bmp_path,
-                    sprite_data["x"],
-                    sprite_data["y"],
-                    sprite_data["width"],
-                    sprite_data["height"],
-                    transparency_color=MAGENTA_TRANSPARENCY_RGB,
-                )
-        print(f"WARNING: Sprite ID '{sprite_id}' not found in spec.")
-        return None
 
     def handle_up_button_click(self):
         """Handle click on the up button - not used in this implementation."""
@@ -105,26 +112,13 @@ class ScrollbarManager:
     def handle_track_click(self, pos):
         """Handle click on the scrollbar track."""
         thumb_rect = self.get_element_rect("thumb")
-        track_area_spec = self.window.playlist_spec["layout"]["regions"]["track_area"]
-        row_height = track_area_spec["row_height"]
-        visible_height = (
-            self.window.height()
-            - track_area_spec["position"]["y"]
-            - (self.window.height() - self.window._get_bottom_bar_y())
-        )
-        num_visible_rows = visible_height // row_height
-        total_rows = len(self.window.playlist_items)
-
-        # Calculate max scroll offset based on current window size
-        max_scroll_offset = max(0, total_rows - num_visible_rows)
+        num_visible_rows, max_scroll_offset, _, scroll_area = self._get_scroll_metrics()
 
         # Calculate the thumb's current position to determine where the click happened relative to it
         # Re-calculate thumb position based on current scroll offset
         track_rect = self.get_element_rect("track")
-        if total_rows > num_visible_rows:
-            thumb_proportion = self.window.scroll_offset / (
-                total_rows - num_visible_rows
-            )
+        if max_scroll_offset > 0:
+            thumb_proportion = self.window.scroll_offset / max_scroll_offset
             current_thumb_y = track_rect.y() + int(
                 thumb_proportion * (track_rect.height() - thumb_rect.height())
             )
@@ -133,16 +127,17 @@ class ScrollbarManager:
 
         if pos.y() < current_thumb_y:
             # Clicked above the thumb, scroll up by one page
-            self.window.scroll_offset = max(
-                0, self.window.scroll_offset - num_visible_rows
-            )
+            new_scroll_offset = max(0, self.window.scroll_offset - num_visible_rows)
         else:
             # Clicked below the thumb, scroll down by one page
-            self.window.scroll_offset = min(
+            new_scroll_offset = min(
                 max_scroll_offset, self.window.scroll_offset + num_visible_rows
             )
 
-        self.window.update()
+        # Nothing to repaint when already at the top or bottom
+        if new_scroll_offset != self.window.scroll_offset:
+            self.window.scroll_offset = new_scroll_offset
+            self.window.update(scroll_area)
 
     def start_thumb_drag(self, pos):
         """Start dragging the scrollbar thumb."""
@@ -151,15 +146,67 @@ class ScrollbarManager:
         self.thumb_start_scroll_offset = self.window.scroll_offset
 
     def update_thumb_drag(self, pos):
-        """Update the scrollbar thumb drag position."""
+        """Update the scrollbar thumb drag position.
+
+        Qt doesn't compress mouse move events, so a drag can deliver several moves per
+        event loop iteration; only the latest position is applied.
+        """
         if not self.dragging_thumb:
             return
 
+        self._pending_drag_pos = pos
+        if not self._drag_flush_scheduled:
+            self._drag_flush_scheduled = True
+            QTimer.singleShot(0, self.window, self._flush_thumb_drag)
+
+    def _flush_thumb_drag(self):
+        """Scroll to the latest pending thumb drag position."""
+        self._drag_flush_scheduled = False
+        pos = self._pending_drag_pos
+        self._pending_drag_pos = None
+        if pos is None or not self.dragging_thumb:
+            return
+
+        _, max_scroll_offset, items_per_pixel, scroll_area = self._get_scroll_metrics()
+        if items_per_pixel is None:  # No need to scroll
+            return
+
         delta_y = pos.y() - self.thumb_drag_start_y
 
-        # Recalculate values based on current window state (in case of resize)
+        # Calculate new scroll offset based on initial offset and pixel movement
+        new_scroll_offset = self.thumb_start_scroll_offset + int(
+            delta_y * items_per_pixel
+        )
+
+        # Clamp scroll offset to valid range
+        new_scroll_offset = max(0, min(new_scroll_offset, max_scroll_offset))
+        if new_scroll_offset != self.window.scroll_offset:
+            self.window.scroll_offset = new_scroll_offset
+            self.window.update(scroll_area)
+
+    def _get_scroll_metrics(self):
+        """Return (num_visible_rows, max_scroll_offset, items_per_pixel, scroll_area).
+
+        items_per_pixel is how many items one pixel of thumb movement scrolls, or
+        None when the thumb cannot move. scroll_area is the band of the window
+        holding the track rows and the scrollbar, the only part that changes when
+        scrolling. The result only depends on the window size and the playlist
+        length, so it is recomputed only when those change.
+        """
+        key = (
+            self.window.width(),
+            self.window.height(),
+            len(self.window.playlist_items),
+        )
+        if key != self._scroll_metrics_key:
+            self._scroll_metrics = self._compute_scroll_metrics(key[2])
+            self._scroll_metrics_key = key
+        return self._scroll_metrics
+
+    def _compute_scroll_metrics(self, total_rows):
+        """Calculate the scrolling metrics for the given playlist length."""
         track_rect = self.get_element_rect("track")
-        thumb_pixmap = self._get_sprite_pixmap(
+        thumb_pixmap = self.window._get_sprite_pixmap(
             self.playlist_spec["layout"]["controls"]["scrollbar"]["elements"]["thumb"]
         )
         thumb_height = (
@@ -175,33 +222,25 @@ class ScrollbarManager:
             - (self.window.height() - self.window._get_bottom_bar_y())
         )
         num_visible_rows = visible_height // row_height
-        total_rows = len(self.window.playlist_items)
+        scroll_area = QRect(
+            0,
+            track_area_spec["position"]["y"],
+            self.window.width(),
+            self.window._get_bottom_bar_y() - track_area_spec["position"]["y"],
+        ).united(track_rect)
 
-        if total_rows <= num_visible_rows:  # No need to scroll
-            return
+        # Calculate max scroll offset based on current window size
+        max_scroll_offset = max(0, total_rows - num_visible_rows)
 
         scroll_range_pixels = track_rect.height() - thumb_height
-        scroll_range_items = total_rows - num_visible_rows
-
-        if scroll_range_pixels > 0:
-            # Calculate how many items to scroll per pixel of thumb movement
-            items_per_pixel = scroll_range_items / scroll_range_pixels
-
-            # Calculate new scroll offset based on initial offset and pixel movement
-            new_scroll_offset = self.thumb_start_scroll_offset + int(
-                delta_y * items_per_pixel
-            )
-
-            # Clamp scroll offset to valid range
-            self.window.scroll_offset = max(
-                0, min(new_scroll_offset, scroll_range_items)
-            )
-            self.window.update()
+        if max_scroll_offset > 0 and scroll_range_pixels > 0:
+            items_per_pixel = max_scroll_offset / scroll_range_pixels
+        else:
+            items_per_pixel = None
+        return num_visible_rows, max_scroll_offset, items_per_pixel, scroll_area
 
     def end_thumb_drag(self):
         """End dragging the scrollbar thumb."""
+        # Apply a move that arrived just before the release
+        self._flush_thumb_drag()
         self.dragging_thumb = False
-
-    def update_sprite_manager(self, new_sprite_manager):
-        """Update the sprite manager with a new instance."""
-        self.sprite_manager = new_sprite_manager
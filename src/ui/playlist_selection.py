@@ -0,0 +1,59 @@
+"""Selected rows of the playlist window."""
+
+
+class PlaylistSelection:
+    """A set of selected playlist indices, stored as the bits of an int.
+
+    Supports the set operations the playlist window uses (in, add, remove, clear,
+    iteration in ascending order), plus range selection and inversion, which are
+    single int operations instead of a Python loop per row.
+    """
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask=0):
+        self.mask = mask  # Bit i is set when item i is selected
+
+    def __contains__(self, index):
+        return index >= 0 and bool(self.mask >> index & 1)
+
+    def __bool__(self):
+        return self.mask != 0
+
+    def __len__(self):
+        return self.mask.bit_count()
+
+    def __iter__(self):
+        mask = self.mask
+        while mask:
+            lowest = mask & -mask
+            yield lowest.bit_length() - 1
+            mask ^= lowest
+
+    def copy(self):
+        return PlaylistSelection(self.mask)
+
+    def add(self, index):
+        self.mask |= 1 << index
+
+    def remove(self, index):
+        self.mask &= ~(1 << index)
+
+    def toggle(self, index):
+        self.mask ^= 1 << index
+
+    def clear(self):
+        self.mask = 0
+
+    def add_range(self, start, stop):
+        """Select items start to stop - 1, like range(start, stop)."""
+        if stop > start:
+            self.mask |= ((1 << (stop - start)) - 1) << start
+
+    def invert(self, count):
+        """Select exactly the items 0 to count - 1 that are not selected now."""
+        self.mask = ~self.mask & ((1 << count) - 1)
+
+    def first(self):
+        """Return the lowest selected index, or -1 if nothing is selected."""
+        return (self.mask & -self.mask).bit_length() - 1
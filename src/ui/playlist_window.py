@@ -1,7 +1,9 @@
 from PySide6.QtWidgets import QWidget, QMessageBox, QFileDialog
-from PySide6.QtGui import QPainter, QColor, QFont  # Added QFont and QFontMetrics
-from PySide6.QtCore import Qt, QRect, QPoint
+from PySide6.QtGui import QPainter, QColor, QFont, QPixmap
+from PySide6.QtCore import Qt, QRect, QPoint, QTimer
 import os
+from collections import OrderedDict, defaultdict
+from functools import partial
 
 from ..utils.color import MAGENTA_TRANSPARENCY_RGB
 from ..utils.region_utils import apply_region_mask_to_widget
@@ -14,11 +16,63 @@ from .playlist_constants import (
     DEFAULT_SELECTED_BG_COLOR,
     SCROLLBAR_GROOVE_HEIGHT,
     BOTTOM_FILLER_WIDTH,
+    TRACK_LINE_CACHE_SIZE,
+    TITLE_TAG_KEYS,
+    ARTIST_TAG_KEYS,
+    ALBUM_TAG_KEYS,
+    ALBUM_ARTIST_TAG_KEYS,
+    DISPLAY_OPTION_FIELDS,
 )
-from .playlist_config import PlaylistConfig
+from .playlist_config import PlaylistConfig, parse_window_offset
 from .playlist_scrollbar import ScrollbarManager
 from .playlist_menu import MenuManager
 from .playlist_buttonbar import ButtonBarManager
+from .playlist_selection import PlaylistSelection
+
+
+def _safe_extract_metadata(audio_file, keys):
+    """Return the first usable value among the given tag keys, or "Unknown"."""
+    result = "Unknown"
+    for key in keys:
+        try:
+            if key in audio_file:
+                tag_value = audio_file[key]
+                if isinstance(tag_value, list) and len(tag_value) > 0:
+                    try:
+                        raw_value = tag_value[0]
+                        # Only convert to string if it's not None
+                        if raw_value is not None:
+                            result = str(raw_value).strip()
+                        else:
+                            result = "Unknown"
+                    except (
+                        UnicodeDecodeError,
+                        TypeError,
+                        AttributeError,
+                    ):
+                        # Handle cases where value can't be converted to string
+                        result = "Unknown"
+                elif isinstance(tag_value, list) and len(tag_value) == 0:
+                    continue
+                else:
+                    try:
+                        # Handle single values
+                        if tag_value is not None:
+                            result = str(tag_value).strip()
+                        else:
+                            result = "Unknown"
+                    except (
+                        UnicodeDecodeError,
+                        TypeError,
+                        AttributeError,
+                    ):
+                        # Handle cases where value can't be converted to string
+                        result = "Unknown"
+                break
+        except Exception:
+            # If any key access fails, continue to next key
+            continue
+    return result if result else "Unknown"
 
 
 class PlaylistWindow(QWidget):
@@ -55,6 +109,9 @@ class PlaylistWindow(QWidget):
                 self, "Error", "Failed to load playlist window specification."
             )
             return
+        self._parse_bottom_bar_y()
+        self._index_sprites()
+        self._parse_close_button_position()
 
         # Get user preferences
         self.preferences = get_preferences()
@@ -74,9 +131,7 @@ class PlaylistWindow(QWidget):
         )
 
         # Initialize UI component managers
-        self.scrollbar_manager = ScrollbarManager(
-            self, self.playlist_spec, self.sprite_manager, self.skin_data
-        )
+        self.scrollbar_manager = ScrollbarManager(self, self.playlist_spec)
         self.menu_manager = MenuManager(self, self.playlist_spec)
         self.buttonbar_manager = ButtonBarManager(self, self.playlist_spec)
 
@@ -93,6 +148,7 @@ class PlaylistWindow(QWidget):
             DEFAULT_CURRENT_TEXT_COLOR
         )  # Default to white
 
+        self._pledit_values = self._read_pledit_txt()
         self._load_playlist_font_settings()  # Load font settings from pledit.txt
         self.playlist_font = QFont(self.playlist_font_name, self.playlist_font_size)
 
@@ -111,7 +167,7 @@ class PlaylistWindow(QWidget):
         self.playlist_items = []
         self.playlist_filepaths = []  # Store actual file paths
         self.current_track_index = -1  # Index of currently playing track
-        self.selected_items = set()  # Stores indices of selected items
+        self.selected_items = PlaylistSelection()  # Indices of selected items
         self.last_selected_item_index = -1  # For Shift+click functionality
         self.scroll_offset = 0  # Index of the first visible item
 
@@ -138,6 +194,11 @@ class PlaylistWindow(QWidget):
         # Window dragging state
         self._dragging_window = False
         self._drag_start_position = QPoint()
+        self._pending_drag_pos = None
+        self._drag_snap_timer = QTimer(self)
+        self._drag_snap_timer.setSingleShot(True)
+        self._drag_snap_timer.setInterval(0)
+        self._drag_snap_timer.timeout.connect(self._apply_pending_drag)
 
         # State for scrollbar thumb dragging is now managed by scrollbar_manager
 
@@ -146,12 +207,12 @@ class PlaylistWindow(QWidget):
 
         self.setMouseTracking(True)  # Enable mouse tracking
 
-        # Initialize timer for updating time display
-        from PySide6.QtCore import QTimer
-
+        # Initialize timer for updating time display; it runs only while shown
         self.time_display_timer = QTimer()
-        self.time_display_timer.timeout.connect(self.update)
-        self.time_display_timer.start(1000)  # Update every second
+        self.time_display_timer.setInterval(1000)  # Update every second
+        self.time_display_timer.timeout.connect(self._update_time_display)
+        # Playback second last shown by the time display
+        self._time_display_seconds = None
 
         # Apply stepped resize constraints to ensure initial size follows proper dimensions
         self._apply_stepped_resize_constraints()
@@ -167,6 +228,19 @@ class PlaylistWindow(QWidget):
 
         # Cache for track durations to avoid repeated file loads
         self._track_durations_cache = {}
+        # Rendered track rows, keyed by text, colors, size and pixel ratio (LRU)
+        self._track_line_cache = OrderedDict()
+        # Cache of track metadata read from files, keyed by file path
+        self._track_metadata_cache = {}
+        # Tracks whose metadata is being read on a worker; shown by file name until
+        # it arrives instead of being read on the UI thread
+        self._pending_metadata_paths = set()
+
+        # Display items are built in batches so large playlists don't stall the UI.
+        # The generation counter invalidates batches left over from an earlier rebuild
+        self._playlist_display_batch_size = 100
+        self._playlist_display_cursor = 0
+        self._playlist_display_generation = 0
 
         # Apply region mask if available
         self.apply_region_mask()
@@ -191,6 +265,7 @@ class PlaylistWindow(QWidget):
 
     def set_playlist_items(self, display_items):
         """Set the playlist items to display."""
+        self._playlist_display_generation += 1
         self.playlist_items = display_items
         # Reset selection and scroll when loading new playlist
         self.selected_items.clear()
@@ -207,81 +282,136 @@ class PlaylistWindow(QWidget):
         self.update()
 
     def _regenerate_playlist_display_items(self):
-        """Regenerate playlist display items based on current display options."""
+        """Regenerate playlist display items based on current display options.
+
+        The first batch (at least everything up to the current scroll position) is
+        built right away; the rest is appended from the event loop.
+        """
         if not self.playlist_filepaths:
             return
 
+        self._playlist_display_generation += 1
         self.playlist_items = []
-        for i, filepath in enumerate(self.playlist_filepaths):
-            # Load metadata for the track to get all possible display data
-            track_metadata = self._get_track_metadata(filepath)
+        self._playlist_display_cursor = 0
+        self._append_playlist_display_batch(
+            self._playlist_display_batch_size + self.scroll_offset
+        )
 
-            # Build display string based on selected options
-            display_parts = []
+    def _finish_playlist_display_items(self):
+        """Build the display items still waiting to be appended from the event loop.
+
+        Needed before anything that reads playlist_items as the whole playlist.
+        """
+        remaining = len(self.playlist_filepaths) - self._playlist_display_cursor
+        if remaining > 0:
+            # Drops the batch already scheduled for the old generation
+            self._playlist_display_generation += 1
+            self._append_playlist_display_batch(remaining)
+
+    def _append_next_playlist_batch(self, generation):
+        """Append the next batch of display items unless the playlist was rebuilt."""
+        if generation == self._playlist_display_generation:
+            self._append_playlist_display_batch(self._playlist_display_batch_size)
+
+    def _append_playlist_display_batch(self, count):
+        """Build up to count display items and schedule the next batch if any remain."""
+        filepaths = self.playlist_filepaths
+        end = min(self._playlist_display_cursor + count, len(filepaths))
+
+        # Read the display options once per batch rather than once per track
+        fields, show_filename, shows_title = self._display_text_options()
+        add_item = self.playlist_items.append
+        for i in range(self._playlist_display_cursor, end):
+            add_item(
+                self._build_display_text(
+                    i, filepaths[i], fields, show_filename, shows_title
+                )
+            )
+        self._playlist_display_cursor = end
 
-            # Add track number from metadata if option is selected and available
-            if (
-                self.display_options["track_number"]
-                and track_metadata.get("tracknumber")
-                and track_metadata["tracknumber"] != "Unknown"
-            ):
-                display_parts.append(track_metadata["tracknumber"])
+        if end < len(filepaths):
+            QTimer.singleShot(
+                0,
+                self,
+                partial(
+                    self._append_next_playlist_batch,
+                    self._playlist_display_generation,
+                ),
+            )
+        self.update()
 
-            # Add song name if option is selected and available
-            if (
-                self.display_options["song_name"]
-                and track_metadata.get("title")
-                and track_metadata["title"] != "Unknown"
-            ):
-                display_parts.append(track_metadata["title"])
+    def refresh_track_rows(self, refreshed_paths):
+        """Rebuild the display text of the rows showing any of refreshed_paths.
 
-            # Add artist if option is selected and available
-            if (
-                self.display_options["artist"]
-                and track_metadata.get("artist")
-                and track_metadata["artist"] != "Unknown"
-            ):
-                display_parts.append(track_metadata["artist"])
+        Also adds rows for tracks appended to the playlist since its display was
+        built. Unlike set_playlist_filepaths, this keeps the selection, scroll
+        position and playing track. Rows not built yet pick up the new metadata when
+        they are.
+        """
+        fields, show_filename, shows_title = self._display_text_options()
+        filepaths = self.playlist_filepaths
+        for i in range(len(self.playlist_items)):
+            if filepaths[i] in refreshed_paths:
+                self.playlist_items[i] = self._build_display_text(
+                    i, filepaths[i], fields, show_filename, shows_title
+                )
 
-            # Add album artist if option is selected and available
-            if (
-                self.display_options["album_artist"]
-                and track_metadata.get("album_artist")
-                and track_metadata["album_artist"] != "Unknown"
-            ):
-                display_parts.append(track_metadata["album_artist"])
+        if self._playlist_display_cursor < len(filepaths):
+            # Restart the batches so only one chain of them is ever scheduled
+            self._playlist_display_generation += 1
+            self._append_playlist_display_batch(self._playlist_display_batch_size)
+        else:
+            self.update()
 
-            # Add album name if option is selected and available
-            if (
-                self.display_options["album_name"]
-                and track_metadata.get("album")
-                and track_metadata["album"] != "Unknown"
+    def _display_text_options(self):
+        """Return the (fields, show_filename, shows_title) for _build_display_text."""
+        options = self.display_options
+        fields = tuple(
+            field for option, field in DISPLAY_OPTION_FIELDS if options[option]
+        )
+        return fields, options["track_filename"], options["song_name"]
+
+    def _build_display_text(self, i, filepath, fields, show_filename, shows_title):
+        """Build the display string for the track at index i.
+
+        fields are the metadata keys selected by the display options, in order;
+        shows_title is whether the song name option is on.
+        """
+        # Metadata is read from the file only the first time; later rebuilds (e.g.
+        # after toggling a display option) reuse the cached values
+        track_metadata = self._get_track_metadata(filepath)
+
+        # Add the selected metadata fields that are available
+        display_parts = []
+        for field in fields:
+            value = track_metadata.get(field)
+            if value and value != "Unknown":
+                display_parts.append(value)
+
+        # Add filename if option is selected or if no other metadata is available/selected
+        if show_filename or not display_parts:
+            filename = os.path.basename(filepath)
+            # Avoid adding filename if it's the same as the title
+            if not (
+                shows_title
+                and track_metadata.get("title", "Unknown").lower() == filename.lower()
             ):
-                display_parts.append(track_metadata["album"])
-
-            # Add filename if option is selected or if no other metadata is available/selected
-            if self.display_options["track_filename"] or not display_parts:
-                filename = os.path.basename(filepath)
-                # Avoid adding filename if it's the same as the title
-                if not (
-                    self.display_options["song_name"]
-                    and track_metadata.get("title", "Unknown").lower()
-                    == filename.lower()
-                ):
-                    display_parts.append(filename)
-
-            # Join the selected parts with " - " separator
-            display_text = " - ".join(part for part in display_parts if part)
+                display_parts.append(filename)
 
-            # Always add the playlist number as a prefix
-            display_text = f"{i+1}. {display_text}"
+        # Join the selected parts with " - " separator
+        display_text = " - ".join(part for part in display_parts if part)
 
-            self.playlist_items.append(display_text)
-
-        self.update()
+        # Always add the playlist number as a prefix
+        return f"{i+1}. {display_text}"
 
     def _get_track_metadata(self, filepath):
         """Get metadata for a track using the main window's audio engine or mutagen."""
+        # Metadata read earlier (possibly off the UI thread) has every playlist field,
+        # including the track number the audio engine doesn't read
+        metadata = self._track_metadata_cache.get(filepath)
+        if metadata is not None:
+            return metadata
+
         # Try to get metadata from main window's audio engine if it's the currently loaded track
         if (
             self.main_window
@@ -290,12 +420,38 @@ class PlaylistWindow(QWidget):
             and self.main_window.audio_engine.file_path == filepath
         ):
             try:
-                return self.main_window.audio_engine.get_metadata()
+                metadata = self.main_window.audio_engine.get_metadata()
+                # Empty while the engine's tags are still being read on a worker
+                if metadata:
+                    return metadata
             except Exception:
                 # If getting metadata from audio engine fails, fall through to mutagen approach
                 pass
 
-        # Otherwise, try to load metadata directly using mutagen
+        # Show the file name while a worker is still reading the tags
+        if filepath in self._pending_metadata_paths:
+            return {}
+
+        # Otherwise read it now
+        metadata = self.read_track_metadata(filepath)
+        self._track_metadata_cache[filepath] = metadata
+        return metadata
+
+    def expect_track_metadata(self, filepath):
+        """Show filepath by its file name until cache_track_metadata() is called for it."""
+        self._pending_metadata_paths.add(filepath)
+
+    def cache_track_metadata(self, filepath, metadata):
+        """Store metadata read elsewhere (e.g. by read_track_metadata on a worker thread)."""
+        self._track_metadata_cache[filepath] = metadata
+        self._pending_metadata_paths.discard(filepath)
+
+    @staticmethod
+    def read_track_metadata(filepath):
+        """Load metadata for a track directly using mutagen.
+
+        Doesn't touch any widget state, so it can be called from worker threads.
+        """
         try:
             from mutagen import File as MutagenFile
 
@@ -303,68 +459,12 @@ class PlaylistWindow(QWidget):
             if audio_file is not None:
                 metadata = {}
 
-                # Helper function to safely extract metadata
-                def safe_extract_metadata(audio_file, keys):
-                    result = "Unknown"
-                    for key in keys:
-                        try:
-                            if key in audio_file:
-                                tag_value = audio_file[key]
-                                if isinstance(tag_value, list) and len(tag_value) > 0:
-                                    try:
-                                        raw_value = tag_value[0]
-                                        # Only convert to string if it's not None
-                                        if raw_value is not None:
-                                            result = str(raw_value).strip()
-                                        else:
-                                            result = "Unknown"
-                                    except (
-                                        UnicodeDecodeError,
-                                        TypeError,
-                                        AttributeError,
-                                    ):
-                                        # Handle cases where value can't be converted to string
-                                        result = "Unknown"
-                                elif (
-                                    isinstance(tag_value, list) and len(tag_value) == 0
-                                ):
-                                    continue
-                                else:
-                                    try:
-                                        # Handle single values
-                                        if tag_value is not None:
-                                            result = str(tag_value).strip()
-                                        else:
-                                            result = "Unknown"
-                                    except (
-                                        UnicodeDecodeError,
-                                        TypeError,
-                                        AttributeError,
-                                    ):
-                                        # Handle cases where value can't be converted to string
-                                        result = "Unknown"
-                                break
-                        except Exception:
-                            # If any key access fails, continue to next key
-                            continue
-                    return result if result else "Unknown"
-
-                # Title
-                title_keys = ["TIT2", "title", "\xa9nam", "TITLE", "©nam"]
-                metadata["title"] = safe_extract_metadata(audio_file, title_keys)
-
-                # Artist
-                artist_keys = ["TPE1", "artist", "\xa9ART", "ARTIST", "©ART"]
-                metadata["artist"] = safe_extract_metadata(audio_file, artist_keys)
-
-                # Album
-                album_keys = ["TALB", "album", "\xa9alb", "ALBUM", "©alb"]
-                metadata["album"] = safe_extract_metadata(audio_file, album_keys)
-
+                metadata["title"] = _safe_extract_metadata(audio_file, TITLE_TAG_KEYS)
+                metadata["artist"] = _safe_extract_metadata(audio_file, ARTIST_TAG_KEYS)
+                metadata["album"] = _safe_extract_metadata(audio_file, ALBUM_TAG_KEYS)
                 # Album artist (if available)
-                album_artist_keys = ["TPE2", "albumartist", "aART", "©aAR"]
-                metadata["album_artist"] = safe_extract_metadata(
-                    audio_file, album_artist_keys
+                metadata["album_artist"] = _safe_extract_metadata(
+                    audio_file, ALBUM_ARTIST_TAG_KEYS
                 )
 
                 # Track number - handle different formats
@@ -395,27 +495,10 @@ class PlaylistWindow(QWidget):
                 else:
                     metadata["tracknumber"] = "Unknown"
 
-                # Duration from audio data
+                # Duration from the already opened file; no decoding just for a length
                 try:
-                    audio_file_for_duration = MutagenFile(filepath)
-                    if hasattr(audio_file_for_duration, "info") and hasattr(
-                        audio_file_for_duration.info, "length"
-                    ):
-                        duration = audio_file_for_duration.info.length
-                    else:
-                        # Fallback: load with librosa
-                        import librosa
-
-                        try:
-                            audio_data, sample_rate = librosa.load(
-                                filepath, sr=None, mono=False
-                            )
-                            duration = librosa.get_duration(
-                                y=audio_data, sr=sample_rate
-                            )
-                        except Exception:
-                            duration = 0.0
-                except Exception:
+                    duration = audio_file.info.length
+                except AttributeError:
                     duration = 0.0
                 metadata["duration"] = duration
 
@@ -446,9 +529,7 @@ class PlaylistWindow(QWidget):
 
     def get_selected_track_index(self):
         """Get the index of the first selected track, or -1 if none selected."""
-        if self.selected_items:
-            return min(self.selected_items)  # Return first selected item index
-        return -1  # No selected item
+        return self.selected_items.first()  # -1 if no item is selected
 
     def set_playlist_filepaths(self, filepaths):
         """Set the list of file paths for the playlist."""
@@ -467,96 +548,127 @@ class PlaylistWindow(QWidget):
         """Get the rectangle for a scrollbar element."""
         return self.scrollbar_manager.get_element_rect(element_id)
 
-    def _load_pledit_colors(self):
+    def _read_pledit_txt(self):
+        """Read pledit.txt once into a {key: value} dict, or None if it is unusable."""
         pledit_txt_path = self.skin_data.get_path("pledit.txt")
         if not pledit_txt_path or not os.path.exists(pledit_txt_path):
-            print("WARNING: pledit.txt not found. Using default colors.")
-            return
+            print("WARNING: pledit.txt not found. Using default font and colors.")
+            return None
 
         try:
             with open(pledit_txt_path, "r") as f:
+                values = {}
                 for line in f:
-                    line = line.strip()
-                    if line.startswith("NormalBG="):
-                        hex_color = line.split("=")[1]
-                        self.normal_bg_color = QColor(hex_color)
-                    elif line.startswith("SelectedBG="):
-                        hex_color = line.split("=")[1]
-                        self.selected_bg_color = QColor(hex_color)
-                    elif line.startswith("Normal="):
-                        hex_color = line.split("=")[1]
-                        self.playlist_normal_text_color = QColor(hex_color)
-                    elif line.startswith("Current="):
-                        hex_color = line.split("=")[1]
-                        self.playlist_current_text_color = QColor(hex_color)
+                    key, sep, value = line.strip().partition("=")
+                    if sep:
+                        values[key] = value
+                return values
         except Exception as e:
-            print(f"Error loading pledit.txt colors: {e}. Using default colors.")
+            print(f"Error reading pledit.txt: {e}. Using default font and colors.")
+            return None
 
-    def _load_playlist_font_settings(self):
-        pledit_txt_path = self.skin_data.get_path("pledit.txt")
+    def _load_pledit_colors(self):
+        if self._pledit_values is None:
+            return
 
-        # Check if pledit.txt exists
-        if not pledit_txt_path or not os.path.exists(pledit_txt_path):
-            print("WARNING: pledit.txt not found. Using default font settings.")
+        if "NormalBG" in self._pledit_values:
+            self.normal_bg_color = QColor(self._pledit_values["NormalBG"])
+        if "SelectedBG" in self._pledit_values:
+            self.selected_bg_color = QColor(self._pledit_values["SelectedBG"])
+        if "Normal" in self._pledit_values:
+            self.playlist_normal_text_color = QColor(self._pledit_values["Normal"])
+        if "Current" in self._pledit_values:
+            self.playlist_current_text_color = QColor(self._pledit_values["Current"])
+
+    def _load_playlist_font_settings(self):
+        if self._pledit_values is None:
             return
 
-        try:
-            with open(pledit_txt_path, "r") as f:
-                lines = f.readlines()
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith("Font="):
-                        self.playlist_font_name = line.split("=")[1]
-                    elif line.startswith("Normal="):
-                        self.playlist_normal_text_color = QColor(line.split("=")[1])
-                    elif line.startswith("Current="):
-                        self.playlist_current_text_color = QColor(line.split("=")[1])
-        except Exception as e:
-            print(
-                f"Error parsing pledit.txt content for font settings: {e}. Using default font settings."
-            )
+        # Text colors are set by _load_pledit_colors
+        self.playlist_font_name = self._pledit_values.get(
+            "Font", self.playlist_font_name
+        )
 
-    def _get_bottom_bar_y(self):
+    def _parse_bottom_bar_y(self):
+        """Parse the bottom bar's y position from the spec, once per spec.
+
+        It is either "window.height - N" or a fixed value; _get_bottom_bar_y only
+        has to subtract the parsed offset from the window height.
+        """
         bottom_bar_spec = self.playlist_spec["layout"]["regions"]["bottom_bar"]
-        bottom_bar_y_expr = bottom_bar_spec["position"]["y"]
-        if isinstance(bottom_bar_y_expr, str) and bottom_bar_y_expr.startswith(
-            "window.height - "
-        ):
-            offset = int(bottom_bar_y_expr.split(" - ")[1])
-            return self.height() - offset
-        return bottom_bar_y_expr
+        self._bottom_bar_y_from_height, self._bottom_bar_y_offset = parse_window_offset(
+            bottom_bar_spec["position"]["y"], "height"
+        )
+
+    def _get_bottom_bar_y(self):
+        return (
+            self.height() if self._bottom_bar_y_from_height else 0
+        ) - self._bottom_bar_y_offset
 
     def _get_close_button_rect(self):
-        """Get the rectangle for the close button based on spec."""
-        if not self.playlist_spec:
-            return QRect(0, 0, 0, 0)  # Return empty rectangle if no spec
+        """Get the rectangle for the close button, cached until the next resize."""
+        if self._close_button_rect is None:
+            self._close_button_rect = self._compute_close_button_rect()
+        return self._close_button_rect
 
+    def _parse_close_button_position(self):
+        """Parse the close button's position from the spec, once per spec.
+
+        Its x is "window.width - N[ - M...]" or a fixed value, so computing the rect
+        after a resize only has to subtract the parsed offset from the window width.
+        """
         close_button_spec = self.playlist_spec["layout"]["controls"]["close_button"]
         x_expr = close_button_spec["position"]["x"]
         y_expr = close_button_spec["position"]["y"]
 
-        # Evaluate expressions like "window.width - 11"
-        if isinstance(x_expr, str) and "window.width" in x_expr:
-            parts = x_expr.split(" - ")
-            base = self.width()
-            offset = sum(int(p) for p in parts[1:])
-            x = base - offset
-        else:
-            x = int(x_expr)
+        self._close_button_x_from_width, self._close_button_x_offset = (
+            parse_window_offset(x_expr, "width")
+        )
 
-        y = int(y_expr) if isinstance(y_expr, int) else int(y_expr.split(" - ")[1])
+        self._close_button_y = (
+            int(y_expr) if isinstance(y_expr, int) else int(y_expr.split(" - ")[1])
+        )
+        self._close_button_width = close_button_spec["width"]
+        self._close_button_height = close_button_spec["height"]
+        self._close_button_rect = None
 
-        width = close_button_spec["width"]
-        height = close_button_spec["height"]
+    def _compute_close_button_rect(self):
+        """Compute the rectangle for the close button based on spec."""
+        if not self.playlist_spec:
+            return QRect(0, 0, 0, 0)  # Return empty rectangle if no spec
 
-        return QRect(x, y, width, height)
+        x = (
+            self.width() if self._close_button_x_from_width else 0
+        ) - self._close_button_x_offset
+        return QRect(
+            x,
+            self._close_button_y,
+            self._close_button_width,
+            self._close_button_height,
+        )
 
     def _load_playlist_spec(self):
         """Load the playlist specification - now handled by config manager."""
         return self.playlist_spec
 
+    def _index_sprites(self):
+        """Index the spec's sprites by id and drop pixmaps cached for the old skin."""
+        # Stores {sprite_id: sprite_data} from the spec's sprite sheet
+        self._sprites_by_id = {
+            sprite_data["id"]: sprite_data
+            for sprite_data in self.playlist_spec["spriteSheet"]["sprites"]
+        }
+        self._sprite_cache = {}
+        self._missing_sprite_ids = set()
+        self._pledit_bmp_path = None
+        self._pledit_bmp_path_checked = False
+
     def _get_sprite_pixmap(self, sprite_id):
         """Helper to get a QPixmap for a given sprite ID from the spec."""
+        pixmap = self._sprite_cache.get(sprite_id)
+        if pixmap is not None:
+            return pixmap
+
         if (
             not self.sprite_manager
             or not self.extracted_skin_dir
@@ -564,25 +676,40 @@ class PlaylistWindow(QWidget):
         ):
             return None
 
-        pledit_bmp_path = self.skin_data.get_path(
-            self.playlist_spec["spriteSheet"]["file"]
-        )
-        if not pledit_bmp_path or not os.path.exists(pledit_bmp_path):
-            print(f"WARNING: {self.playlist_spec['spriteSheet']['file']} not found.")
+        # Resolve and stat the sprite sheet once per skin, not on every lookup
+        if not self._pledit_bmp_path_checked:
+            pledit_bmp_path = self.skin_data.get_path(
+                self.playlist_spec["spriteSheet"]["file"]
+            )
+            if not pledit_bmp_path or not os.path.exists(pledit_bmp_path):
+                print(
+                    f"WARNING: {self.playlist_spec['spriteSheet']['file']} not found."
+                )
+                pledit_bmp_path = None
+            self._pledit_bmp_path = pledit_bmp_path
+            self._pledit_bmp_path_checked = True
+        pledit_bmp_path = self._pledit_bmp_path
+        if pledit_bmp_path is None:
             return None
 
-        for sprite_data in self.playlist_spec["spriteSheet"]["sprites"]:
-            if sprite_data["id"] == sprite_id:
-                return self.sprite_manager.load_sprite(
-                    pledit_bmp_path,
-                    sprite_data["x"],
-                    sprite_data["y"],
-                    sprite_data["width"],
-                    sprite_data["height"],
-                    transparency_color=MAGENTA_TRANSPARENCY_RGB,
-                )
-        print(f"WARNING: Sprite ID '{sprite_id}' not found in spec.")
-        return None
+        sprite_data = self._sprites_by_id.get(sprite_id)
+        if sprite_data is None:
+            if sprite_id not in self._missing_sprite_ids:
+                self._missing_sprite_ids.add(sprite_id)
+                print(f"WARNING: Sprite ID '{sprite_id}' not found in spec.")
+            return None
+
+        pixmap = self.sprite_manager.load_sprite(
+            pledit_bmp_path,
+            sprite_data["x"],
+            sprite_data["y"],
+            sprite_data["width"],
+            sprite_data["height"],
+            transparency_color=MAGENTA_TRANSPARENCY_RGB,
+        )
+        if pixmap is not None:
+            self._sprite_cache[sprite_id] = pixmap
+        return pixmap
 
     def _close_all_sub_menus(self):
         """Close all open sub-menus."""
@@ -642,10 +769,19 @@ class PlaylistWindow(QWidget):
                                     except ValueError:
                                         pass
 
-                current_x = start_x
-                while current_x < end_x:
-                    painter.drawPixmap(current_x, target_rect.y(), fill_sprite_pixmap)
-                    current_x += fill_sprite_pixmap.width()
+                # One tiled blit of whole tiles, overhanging end_x like per-tile draws
+                tile_width = fill_sprite_pixmap.width()
+                if end_x > start_x and tile_width > 0:
+                    tiles = -(-(end_x - start_x) // tile_width)
+                    painter.drawTiledPixmap(
+                        QRect(
+                            start_x,
+                            target_rect.y(),
+                            tiles * tile_width,
+                            fill_sprite_pixmap.height(),
+                        ),
+                        fill_sprite_pixmap,
+                    )
 
         # Draw left corner on top
         if left_sprite_pixmap:
@@ -662,10 +798,18 @@ class PlaylistWindow(QWidget):
         if "fill_y" in tiling:
             fill_sprite_pixmap = self._get_sprite_pixmap(tiling["fill_y"])
             if fill_sprite_pixmap:
-                current_y = target_rect.y()
-                while current_y < target_rect.y() + target_rect.height():
-                    painter.drawPixmap(target_rect.x(), current_y, fill_sprite_pixmap)
-                    current_y += fill_sprite_pixmap.height()
+                tile_height = fill_sprite_pixmap.height()
+                if target_rect.height() > 0 and tile_height > 0:
+                    tiles = -(-target_rect.height() // tile_height)
+                    painter.drawTiledPixmap(
+                        QRect(
+                            target_rect.x(),
+                            target_rect.y(),
+                            fill_sprite_pixmap.width(),
+                            tiles * tile_height,
+                        ),
+                        fill_sprite_pixmap,
+                    )
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -688,7 +832,8 @@ class PlaylistWindow(QWidget):
             if layer == "background fill/tiling":
                 self._draw_background_regions(painter)
             elif layer == "track text lines":
-                self._draw_track_text_lines(painter)
+                # Only rows inside the repainted area, e.g. none on time display ticks
+                self._draw_track_text_lines(painter, event.rect())
             elif layer == "borders and edges":
                 self._draw_borders_and_edges(painter)
             elif layer == "buttons and scrollbar":
@@ -936,8 +1081,11 @@ class PlaylistWindow(QWidget):
         )
         painter.fillRect(track_area_rect, self.normal_bg_color)
 
-    def _draw_track_text_lines(self, painter):
-        """Draw the playlist item text lines in the track area."""
+    def _draw_track_text_lines(self, painter, dirty_rect=None):
+        """Draw the playlist item text lines in the track area.
+
+        With dirty_rect, only the rows overlapping it are drawn.
+        """
         regions_map = {
             "top_bar": self.playlist_spec["layout"]["regions"]["top_bar"],
             "left_edge": self.playlist_spec["layout"]["regions"]["left_edge"],
@@ -980,62 +1128,100 @@ class PlaylistWindow(QWidget):
             track_area_x, track_area_y, track_area_width, track_area_height
         )
 
-        for i in range(num_visible_rows):
+        first_row = 0
+        last_row = num_visible_rows
+        if dirty_rect is not None:
+            first_row = max(0, (dirty_rect.top() - track_area_y) // row_height)
+            last_row = min(
+                last_row, (dirty_rect.bottom() - track_area_y) // row_height + 1
+            )
+
+        for i in range(first_row, last_row):
             item_index = self.scroll_offset + i
             if item_index < len(self.playlist_items):
                 text_to_draw = self.playlist_items[item_index]
 
-                # Set font and color for native text rendering
-                painter.setFont(self.playlist_font)
-
                 # Set color based on selection and current track status
+                outlined = False
                 if item_index == self.current_track_index:
-                    # Currently playing track - use special color
-                    painter.setPen(self.playlist_current_text_color)
+                    # Currently playing track - use special color and background
+                    text_color = self.playlist_current_text_color
+                    bg_color = self.current_playing_bg_color
+                    # If also selected, draw a selection border
+                    if item_index in self.selected_items:
+                        # Yellow border (and text) for selected + current track
+                        text_color = QColor(255, 255, 0)
+                        outlined = True
                 elif item_index in self.selected_items:
-                    # Selected track - use current color
-                    painter.setPen(self.playlist_current_text_color)
+                    # Selected track - use current color and selection highlight
+                    text_color = self.playlist_current_text_color
+                    bg_color = self.selected_bg_color
                 else:
-                    # Normal track - use normal color
-                    painter.setPen(self.playlist_normal_text_color)
-
-                # Calculate vertical centering offset using QFontMetrics
-                font_metrics = painter.fontMetrics()
-                text_height = font_metrics.height()
-                vertical_offset = (row_height - text_height) // 2
-                text_y = (
-                    track_area_y
-                    + (i * row_height)
-                    + vertical_offset
-                    + font_metrics.ascent()
-                )  # Adjust for baseline
-
-                # Draw background highlight for this row
-                row_rect = QRect(
+                    # Normal track - use normal color and background
+                    text_color = self.playlist_normal_text_color
+                    bg_color = self.normal_bg_color
+
+                painter.drawPixmap(
                     track_area_x,
                     track_area_y + (i * row_height),
-                    track_area_rect.width(),
-                    row_height,
+                    self._get_track_line_pixmap(
+                        text_to_draw,
+                        text_color,
+                        bg_color,
+                        outlined,
+                        track_area_rect.width(),
+                        row_height,
+                    ),
                 )
 
-                # Highlight current playing track differently from selected items
-                if item_index == self.current_track_index:
-                    # Draw currently playing track background
-                    painter.fillRect(row_rect, self.current_playing_bg_color)
-                    # If also selected, draw a selection border
-                    if item_index in self.selected_items:
-                        painter.setPen(
-                            QColor(255, 255, 0)
-                        )  # Yellow border for selected + current track
-                        painter.drawRect(row_rect.adjusted(0, 0, -1, -1))
-                elif item_index in self.selected_items:
-                    # Draw selection highlight
-                    painter.fillRect(row_rect, self.selected_bg_color)
-                else:
-                    # Draw normal background if not selected or current
-                    painter.fillRect(row_rect, self.normal_bg_color)
+    def _get_track_line_pixmap(
+        self, text, text_color, bg_color, outlined, width, row_height
+    ):
+        """Return a track row (background, optional border and text) as a pixmap.
+
+        Rows are rendered once and reused, so repaints don't lay out the text again.
+        """
+        pixel_ratio = self.devicePixelRatioF()
+        key = (
+            text,
+            text_color.rgba(),
+            bg_color.rgba(),
+            outlined,
+            width,
+            row_height,
+            pixel_ratio,
+        )
+        pixmap = self._track_line_cache.get(key)
+        if pixmap is not None:
+            self._track_line_cache.move_to_end(key)
+            return pixmap
 
-                painter.drawText(track_area_x, text_y, text_to_draw)
+        pixmap = QPixmap(
+            max(1, round(width * pixel_ratio)), max(1, round(row_height * pixel_ratio))
+        )
+        pixmap.setDevicePixelRatio(pixel_ratio)
+        pixmap.fill(Qt.transparent)
+
+        row_rect = QRect(0, 0, width, row_height)
+        painter = QPainter(pixmap)
+        painter.fillRect(row_rect, bg_color)
+        painter.setFont(self.playlist_font)
+        painter.setPen(text_color)
+        if outlined:
+            painter.drawRect(row_rect.adjusted(0, 0, -1, -1))
+
+        # Calculate vertical centering offset using QFontMetrics
+        font_metrics = painter.fontMetrics()
+        vertical_offset = (row_height - font_metrics.height()) // 2
+        painter.drawText(
+            0, vertical_offset + font_metrics.ascent(), text
+        )  # Adjust for baseline
+        painter.end()
+
+        self._track_line_cache[key] = pixmap
+        if len(self._track_line_cache) > TRACK_LINE_CACHE_SIZE:
+            self._track_line_cache.popitem(last=False)
+        return pixmap
 
     def _draw_borders_and_edges(self, painter):
         """Draw borders and edges including left and right edges."""
@@ -1654,48 +1840,56 @@ class PlaylistWindow(QWidget):
             # Call the main window's play_selected_track method
             self.main_window.play_selected_track(index)
 
-    def mouseMoveEvent(self, event):
-        if self._dragging_window:
-            # Calculate the new position
-            new_pos = event.globalPos() - self._drag_start_position
+    def _apply_pending_drag(self):
+        """Move the window to the latest pending drag position, snapping to other windows."""
+        new_pos = self._pending_drag_pos
+        if new_pos is None:
+            return
+        self._pending_drag_pos = None
 
-            # Check for snapping with main window and other windows if main window exists
-            if self.main_window:
-                # Get the potential new rectangle for this window
-                new_rect = QRect(new_pos, self.size())
+        # Check for snapping with main window and other windows if main window exists
+        if self.main_window:
+            # Get the potential new rectangle for this window
+            new_rect = QRect(new_pos, self.size())
 
-                # Use the main window's window-to-window snapping algorithm
-                snap_x, snap_y, should_snap = (
-                    self.main_window.get_window_snap_alignment(
-                        new_rect, exclude_window=self
-                    )
-                )
+            # Use the main window's window-to-window snapping algorithm
+            snap_x, snap_y, should_snap = self.main_window.get_window_snap_alignment(
+                new_rect, exclude_window=self
+            )
 
-                if should_snap:
-                    # Snap to the calculated position
-                    self.is_docked = True
-                    self.move(snap_x, snap_y)
-                    # Store the offset from the snapped position in case the window is un-snapped later
-                    self.docking_offset = new_pos - QPoint(snap_x, snap_y)
-                else:
-                    # Check if we're significantly far from any snapped position to un-snap
-                    # If we were previously snapped and now we're moving away from snapped position
-                    if self.is_docked:
-                        # Determine if we've moved far enough to un-snap (more than 25 pixels)
-                        current_pos = QPoint(self.x(), self.y())
-                        distance_moved = (
-                            (new_pos.x() - current_pos.x()) ** 2
-                            + (new_pos.y() - current_pos.y()) ** 2
-                        ) ** 0.5
-                        # If moved more than 25 pixels from snapped position, un-snap
-                        if distance_moved > 25:
-                            self.is_docked = False
-
-                    # If not snapping, move to the calculated position
-                    self.move(new_pos)
+            if should_snap:
+                # Snap to the calculated position
+                self.is_docked = True
+                self.move(snap_x, snap_y)
+                # Store the offset from the snapped position in case the window is un-snapped later
+                self.docking_offset = new_pos - QPoint(snap_x, snap_y)
             else:
-                # No main window reference, move normally
-                self.move(event.globalPos() - self._drag_start_position)
+                # Check if we're significantly far from any snapped position to un-snap
+                # If we were previously snapped and now we're moving away from snapped position
+                if self.is_docked:
+                    # Determine if we've moved far enough to un-snap (more than 25 pixels)
+                    current_pos = QPoint(self.x(), self.y())
+                    distance_moved = (
+                        (new_pos.x() - current_pos.x()) ** 2
+                        + (new_pos.y() - current_pos.y()) ** 2
+                    ) ** 0.5
+                    # If moved more than 25 pixels from snapped position, un-snap
+                    if distance_moved > 25:
+                        self.is_docked = False
+
+                # If not snapping, move to the calculated position
+                self.move(new_pos)
+        else:
+            # No main window reference, move normally
+            self.move(new_pos)
+
+    def mouseMoveEvent(self, event):
+        if self._dragging_window:
+            # Snapping is applied from a zero-interval timer so a burst of move events
+            # results in a single snap computation for the latest position
+            self._pending_drag_pos = event.globalPos() - self._drag_start_position
+            if not self._drag_snap_timer.isActive():
+                self._drag_snap_timer.start()
             return
         if self._resizing:
             self._handle_resize_move(event)
@@ -1716,6 +1910,9 @@ class PlaylistWindow(QWidget):
         if event.button() == Qt.LeftButton:
             if self._dragging_window:
                 self._dragging_window = False
+                # Apply the final drag position without waiting for the timer
+                self._drag_snap_timer.stop()
+                self._apply_pending_drag()
                 return
             if self._resizing:
                 self._resizing = False
@@ -1931,13 +2128,7 @@ class PlaylistWindow(QWidget):
 
             # Handle main button clicks (only toggle menus, no direct actions)
             # Only check main buttons if NO submenu is currently open
-            if not (
-                self.menu_manager.is_menu_open("add")
-                or self.menu_manager.is_menu_open("remove")
-                or self.menu_manager.is_menu_open("select")
-                or self.menu_manager.is_menu_open("misc")
-                or self.menu_manager.is_menu_open("list")
-            ):
+            if self.menu_manager.open_menu_id is None:
                 for button_data in button_bar_spec["buttons"]:
                     button_id = button_data["id"]
                     button_pixmap = self._get_sprite_pixmap(button_data["sprite"])
@@ -2095,6 +2286,11 @@ class PlaylistWindow(QWidget):
                 duration = self.main_window.audio_engine.duration
                 self._track_durations_cache[filepath] = duration
                 total_time += duration
+            # Metadata read for the display text already has the duration
+            elif filepath in self._track_metadata_cache:
+                duration = self._track_metadata_cache[filepath].get("duration", 0.0)
+                self._track_durations_cache[filepath] = duration
+                total_time += duration
             else:
                 # For files not currently loaded, use mutagen to get the duration efficiently
                 try:
@@ -2116,6 +2312,32 @@ class PlaylistWindow(QWidget):
 
         return total_time
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._time_display_seconds = None
+        self.time_display_timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # Nothing to repaint while hidden or minimized
+        self.time_display_timer.stop()
+
+    def _update_time_display(self):
+        """Repaint the bottom bar, which holds the time displays, once a second.
+
+        Skipped while the playback second is unchanged, e.g. when stopped or paused.
+        """
+        if not self.main_window:
+            return
+        state = self.main_window.audio_engine.get_playback_state()
+        seconds = int(state.get("position", 0.0))
+        if seconds == self._time_display_seconds:
+            return
+        self._time_display_seconds = seconds
+
+        bottom_bar_y = self._get_bottom_bar_y()
+        self.update(0, bottom_bar_y, self.width(), self.height() - bottom_bar_y)
+
     def _draw_time_display(self, painter):
         """Draw the current time display (minutes and seconds) using text renderer."""
         if not self.main_window or not self.text_renderer:
@@ -2217,6 +2439,12 @@ class PlaylistWindow(QWidget):
         # Apply stepped resize constraints to ensure the window maintains proper proportions
         self._apply_stepped_resize_constraints()
 
+        # Close button, button, menu and scrollbar positions depend on the window size
+        self._close_button_rect = None
+        self.buttonbar_manager.clear_rect_cache()
+        self.menu_manager.clear_rect_cache()
+        self.scrollbar_manager.clear_rect_cache()
+
         # Cancel any active thumb dragging when window is resized
         if self.scrollbar_manager.dragging_thumb:
             self.scrollbar_manager.end_thumb_drag()
@@ -2319,6 +2547,11 @@ class PlaylistWindow(QWidget):
         self._regenerate_playlist_display_items()
         self.selected_items.clear()
         self.last_selected_item_index = -1
+
+        # Update main window's playlist so its path lookup includes the new entry
+        if self.main_window:
+            self.main_window.set_playlist(self.playlist_filepaths)
+
         self.update()
 
     def remove_playlist_item(self):
@@ -2329,7 +2562,7 @@ class PlaylistWindow(QWidget):
             return
 
         # Sort in descending order to avoid index issues when deleting
-        sorted_selected_indices = sorted(list(self.selected_items), reverse=True)
+        sorted_selected_indices = sorted(self.selected_items, reverse=True)
 
         # Remove from filepaths in reverse order to avoid index issues
         for index in sorted_selected_indices:
@@ -2402,6 +2635,9 @@ class PlaylistWindow(QWidget):
         """Remove all tracks from the playlist."""
         self.playlist_items.clear()
         self.playlist_filepaths.clear()  # Clear the file paths as well
+        # The main window shares this list; reassign it so its path lookup is rebuilt
+        if self.main_window:
+            self.main_window.playlist = self.playlist_filepaths
         self.selected_items.clear()
         self.last_selected_item_index = -1
         self.scroll_offset = 0
@@ -2418,16 +2654,13 @@ class PlaylistWindow(QWidget):
             )
             return
 
-        # Get the currently selected items in descending order to avoid index issues
-        # Create new playlist with only selected items
-        new_playlist_items = []
-        new_playlist_filepaths = []
-        for i, item in enumerate(self.playlist_items):
-            if i in self.selected_items:
-                new_playlist_items.append(item)
-                # Also add the corresponding filepath if the index is valid
-                if i < len(self.playlist_filepaths):
-                    new_playlist_filepaths.append(self.playlist_filepaths[i])
+        # Create new playlist with only the selected tracks, in playlist order. This
+        # goes by the file paths, since display items may still be being built
+        new_playlist_filepaths = [
+            self.playlist_filepaths[i]
+            for i in self.selected_items
+            if i < len(self.playlist_filepaths)
+        ]
 
         # Update the file paths only
         self.playlist_filepaths = new_playlist_filepaths
@@ -2459,6 +2692,8 @@ class PlaylistWindow(QWidget):
 
     def _remove_duplicate_tracks(self):
         """Scan the playlist and remove duplicate entries."""
+        # Duplicates are found by display text, so every item has to be built
+        self._finish_playlist_display_items()
         seen_items = set()
         unique_items = []
         unique_indices = []
@@ -2512,26 +2747,9 @@ class PlaylistWindow(QWidget):
 
     def _invert_selection(self):
         """Invert the current selection - deselect selected items and select unselected items."""
-        current_selected = (
-            self.selected_items.copy()
-        )  # Make a copy to avoid modification during iteration
-        new_selected_items = set()
-
-        for i in range(len(self.playlist_items)):
-            # Invert: if it was selected, don't select it; if it wasn't selected, select it
-            if i in current_selected:
-                # Item was selected, so don't select it (invert)
-                continue
-            else:
-                # Item wasn't selected, so select it (invert)
-                new_selected_items.add(i)
-
-        self.selected_items = new_selected_items
-        if self.selected_items:
-            # Set the last selected item to the first one in the new selection
-            self.last_selected_item_index = min(self.selected_items)
-        else:
-            self.last_selected_item_index = -1
+        self.selected_items.invert(len(self.playlist_filepaths))
+        # Set the last selected item to the first one in the new selection (or -1)
+        self.last_selected_item_index = self.selected_items.first()
         self.update()
 
     def _select_none(self):
@@ -2543,11 +2761,8 @@ class PlaylistWindow(QWidget):
     def _select_all(self):
         """Select all tracks in the playlist."""
         self.selected_items.clear()
-        for i in range(len(self.playlist_items)):
-            self.selected_items.add(i)
-        self.last_selected_item_index = (
-            len(self.playlist_items) - 1 if self.playlist_items else -1
-        )
+        self.selected_items.add_range(0, len(self.playlist_filepaths))
+        self.last_selected_item_index = len(self.playlist_filepaths) - 1
         self.update()
 
     def _show_sort_dialog(self):
@@ -2590,6 +2805,8 @@ class PlaylistWindow(QWidget):
         """Sort playlist by track title."""
         if not self.playlist_items:
             return
+        # Titles are taken from the display text, so every item has to be built
+        self._finish_playlist_display_items()
 
         # Extract titles from playlist items for sorting
         def extract_title(item):
@@ -2627,6 +2844,8 @@ class PlaylistWindow(QWidget):
         """Sort playlist by filename."""
         if not self.playlist_items:
             return
+        # File names are taken from the display text, so every item has to be built
+        self._finish_playlist_display_items()
 
         def extract_filename(item):
             # Extract filename from the item text (after the number prefix)
@@ -2666,7 +2885,7 @@ class PlaylistWindow(QWidget):
             return
 
         # Create copies and shuffle them in the same order
-        indices = list(range(len(self.playlist_items)))
+        indices = list(range(len(self.playlist_filepaths)))
         random.shuffle(indices)  # Shuffle the indices
 
         # Create shuffled versions based on shuffled indices
@@ -2714,7 +2933,7 @@ class PlaylistWindow(QWidget):
             return
 
         # Get the first selected item (or if multiple, just show the first one)
-        selected_index = min(self.selected_items)
+        selected_index = self.selected_items.first()
 
         # Get the actual file path from playlist_filepaths
         if selected_index >= len(self.playlist_filepaths):
@@ -3044,7 +3263,7 @@ class PlaylistWindow(QWidget):
         if self.main_window:
             self.main_window.set_playlist([])
             # Reset main window's current track info
-            self.main_window.current_track_title = "Not Playing"
+            self.main_window.ui_state.current_track_title = "Not Playing"
             self.main_window.current_track_index = -1
 
         # Update the display
@@ -3238,11 +3457,7 @@ class PlaylistWindow(QWidget):
                 item_number = 1
                 while i < len(lines):
                     line = lines[i].strip()
-                    if (
-                        line
-                        and not line.startswith("#EXTM3U")
-                        and not line.startswith("#EXTINF")
-                    ):
+                    if line and not line.startswith(("#EXTM3U", "#EXTINF")):
                         # This is a file path - convert relative path to absolute if needed
                         abs_path = line
                         if not os.path.isabs(line):
@@ -3277,29 +3492,22 @@ class PlaylistWindow(QWidget):
                 with open(file_path, "r") as f:
                     lines = f.readlines()
 
-                pls_entries = {}
+                # Entry number -> {"file": ..., "title": ...}
+                pls_entries = defaultdict(dict)
                 for line in lines:
                     line = line.strip()
-                    if line.lower().startswith("file") and "=" in line:
-                        # Parse FileN=filepath
-                        key, value = line.split("=", 1)
-                        # Extract the number from keys like File1, File2, etc.
-                        key_lower = key.lower()
-                        if key_lower.startswith("file") and len(key_lower) > 4:
-                            file_num = key_lower[4:]  # Get the number after "file"
-                            if file_num.isdigit():
-                                pls_entries[file_num] = pls_entries.get(file_num, {})
-                                pls_entries[file_num]["file"] = value
-                    elif line.lower().startswith("title") and "=" in line:
-                        # Parse TitleN=title
-                        key, value = line.split("=", 1)
-                        # Extract the number from keys like Title1, Title2, etc.
-                        key_lower = key.lower()
-                        if key_lower.startswith("title") and len(key_lower) > 5:
-                            title_num = key_lower[5:]  # Get the number after "title"
-                            if title_num.isdigit():
-                                pls_entries[title_num] = pls_entries.get(title_num, {})
-                                pls_entries[title_num]["title"] = value
+                    # Only FileN=filepath and TitleN=title entries are used
+                    if "=" not in line or not line.lower().startswith(
+                        ("file", "title")
+                    ):
+                        continue
+                    key, value = line.split("=", 1)
+                    key_lower = key.lower()
+                    # Extract the number from keys like File1, Title1, etc.
+                    field = "file" if key_lower.startswith("file") else "title"
+                    entry_num = key_lower[len(field) :]
+                    if entry_num.isdigit():
+                        pls_entries[entry_num][field] = value
 
                 # Add entries in numerical order
                 item_number = 1
@@ -3558,7 +3766,8 @@ class PlaylistWindow(QWidget):
 
             if file_path:
                 # Add to main window's playlist and play immediately
-                if self.main_window.audio_engine.load_track(file_path):
+                # The title shows the file name until the tags are read on a worker
+                if self.main_window._load_engine_track(file_path):
                     # For single file loading via open, create a new playlist with just this file
                     self.main_window.playlist = [file_path]
                     self.main_window.current_track_index = 0
@@ -3566,16 +3775,6 @@ class PlaylistWindow(QWidget):
                     # Update the playlist window display
                     self.main_window.update_playlist_display()
 
-                    # Update the current track title
-                    metadata = self.main_window.audio_engine.get_metadata()
-                    if metadata:
-                        # Format as "artist - song title" for display
-                        self.main_window.current_track_title = f"{metadata.get('artist', 'Unknown')} - {metadata.get('title', 'Unknown')}"
-                    else:
-                        self.main_window.current_track_title = os.path.basename(
-                            file_path
-                        )
-
                     # Start playback
                     self.main_window.audio_engine.play()
 
@@ -3590,7 +3789,9 @@ class PlaylistWindow(QWidget):
                         self.main_window.mac_media_integration.update_now_playing_info()
                         self.main_window.mac_media_integration.update_playback_state()
                 else:
-                    self.main_window.current_track_title = "Error loading track"
+                    self.main_window.ui_state.current_track_title = (
+                        "Error loading track"
+                    )
             # Update the visual state after action
             if self.main_window:
                 state = self.main_window.audio_engine.get_playback_state()
@@ -3671,10 +3872,7 @@ class PlaylistWindow(QWidget):
                 if clicked_item_index == self.current_track_index:
                     if event.modifiers() & (Qt.ControlModifier | Qt.MetaModifier):
                         # Ctrl/Command+click: Toggle selection
-                        if clicked_item_index in self.selected_items:
-                            self.selected_items.remove(clicked_item_index)
-                        else:
-                            self.selected_items.add(clicked_item_index)
+                        self.selected_items.toggle(clicked_item_index)
                     else:
                         # Single click: Clear previous selection and select current
                         self.selected_items.clear()
@@ -3684,10 +3882,7 @@ class PlaylistWindow(QWidget):
                     # Different track was clicked - handle selection and playback
                     if event.modifiers() & (Qt.ControlModifier | Qt.MetaModifier):
                         # Ctrl/Command+click: Toggle selection
-                        if clicked_item_index in self.selected_items:
-                            self.selected_items.remove(clicked_item_index)
-                        else:
-                            self.selected_items.add(clicked_item_index)
+                        self.selected_items.toggle(clicked_item_index)
                         self.last_selected_item_index = clicked_item_index
                     elif event.modifiers() & Qt.ShiftModifier:
                         # Shift+click: Select range
@@ -3696,12 +3891,10 @@ class PlaylistWindow(QWidget):
                                 self.last_selected_item_index, clicked_item_index
                             )
                             end = max(self.last_selected_item_index, clicked_item_index)
-                            for i in range(start, end + 1):
-                                self.selected_items.add(i)
+                            self.selected_items.add_range(start, end + 1)
                         else:
                             # If no previous selection, select from beginning to current
-                            for i in range(clicked_item_index + 1):
-                                self.selected_items.add(i)
+                            self.selected_items.add_range(0, clicked_item_index + 1)
                         self.last_selected_item_index = clicked_item_index
                     else:
                         # Single click: Clear previous selection and select current
@@ -3715,125 +3908,115 @@ class PlaylistWindow(QWidget):
 
     def _is_submenu_button_click(self, pos):
         """Check if a click position is within any open submenu button area."""
+        # Only one menu can be open at a time
+        menu_id = self.menu_manager.open_menu_id
+        if menu_id is None:
+            return False
+
         button_bar_spec = self.playlist_spec["layout"]["controls"]["button_bar"]
         button_bar_x = button_bar_spec["position"]["x"]
         button_bar_y = self.height() - 30  # Consistent with paintEvent
 
-        # Check each open menu for submenu button clicks
-        for menu_id in ["add", "remove", "select", "misc", "list"]:
-            if self.menu_manager.is_menu_open(menu_id):
-                menu_button_data = next(
-                    (b for b in button_bar_spec["buttons"] if b["id"] == menu_id), None
-                )
-                if not menu_button_data:
-                    continue
-
-                main_button_x = button_bar_x + menu_button_data["x"]
-                main_button_y = button_bar_y + menu_button_data["y"]
-                main_button_height = 18
+        menu_button_data = next(
+            (b for b in button_bar_spec["buttons"] if b["id"] == menu_id), None
+        )
+        if not menu_button_data:
+            return False
+
+        main_button_x = button_bar_x + menu_button_data["x"]
+        main_button_y = button_bar_y + menu_button_data["y"]
+        main_button_height = 18
+
+        # Calculate submenu position based on menu type
+        if menu_id == "add":
+            sub_menu_start_y = (main_button_y + main_button_height) - (
+                3 * 18
+            )  # 3 buttons
+            # Check Add URL button area
+            add_url_rect = QRect(main_button_x, sub_menu_start_y + 0, 22, 18)
+            # Check Add DIR button area
+            add_dir_rect = QRect(main_button_x, sub_menu_start_y + 18, 22, 18)
+            # Check Add FILE button area
+            add_file_rect = QRect(main_button_x, sub_menu_start_y + 36, 22, 18)
 
-                # Calculate submenu position based on menu type
-                if menu_id == "add":
-                    sub_menu_start_y = (main_button_y + main_button_height) - (
-                        3 * 18
-                    )  # 3 buttons
-                    # Check Add URL button area
-                    add_url_rect = QRect(main_button_x, sub_menu_start_y + 0, 22, 18)
-                    # Check Add DIR button area
-                    add_dir_rect = QRect(main_button_x, sub_menu_start_y + 18, 22, 18)
-                    # Check Add FILE button area
-                    add_file_rect = QRect(main_button_x, sub_menu_start_y + 36, 22, 18)
+            if (
+                add_url_rect.contains(pos)
+                or add_dir_rect.contains(pos)
+                or add_file_rect.contains(pos)
+            ):
+                return True
 
-                    if (
-                        add_url_rect.contains(pos)
-                        or add_dir_rect.contains(pos)
-                        or add_file_rect.contains(pos)
-                    ):
-                        return True
-
-                elif menu_id == "remove":
-                    sub_menu_start_y = (main_button_y + main_button_height) - (
-                        4 * 18
-                    )  # 4 buttons
-                    # Check submenu button areas
-                    remove_all_rect = QRect(main_button_x, sub_menu_start_y + 0, 22, 18)
-                    crop_rect = QRect(main_button_x, sub_menu_start_y + 18, 22, 18)
-                    remove_selected_rect = QRect(
-                        main_button_x, sub_menu_start_y + 36, 22, 18
-                    )
-                    remove_duplicates_rect = QRect(
-                        main_button_x, sub_menu_start_y + 54, 22, 18
-                    )
+        elif menu_id == "remove":
+            sub_menu_start_y = (main_button_y + main_button_height) - (
+                4 * 18
+            )  # 4 buttons
+            # Check submenu button areas
+            remove_all_rect = QRect(main_button_x, sub_menu_start_y + 0, 22, 18)
+            crop_rect = QRect(main_button_x, sub_menu_start_y + 18, 22, 18)
+            remove_selected_rect = QRect(main_button_x, sub_menu_start_y + 36, 22, 18)
+            remove_duplicates_rect = QRect(main_button_x, sub_menu_start_y + 54, 22, 18)
 
-                    if (
-                        remove_all_rect.contains(pos)
-                        or crop_rect.contains(pos)
-                        or remove_selected_rect.contains(pos)
-                        or remove_duplicates_rect.contains(pos)
-                    ):
-                        return True
+            if (
+                remove_all_rect.contains(pos)
+                or crop_rect.contains(pos)
+                or remove_selected_rect.contains(pos)
+                or remove_duplicates_rect.contains(pos)
+            ):
+                return True
 
-                elif menu_id == "select":
-                    sub_menu_start_y = (main_button_y + main_button_height) - (
-                        3 * 18
-                    )  # 3 buttons
-                    # Check Invert Selection button area
-                    invert_selection_rect = QRect(
-                        main_button_x, sub_menu_start_y + 0, 22, 18
-                    )
-                    # Check Select None button area
-                    select_none_rect = QRect(
-                        main_button_x, sub_menu_start_y + 18, 22, 18
-                    )
-                    # Check Select All button area
-                    select_all_rect = QRect(
-                        main_button_x, sub_menu_start_y + 36, 22, 18
-                    )
+        elif menu_id == "select":
+            sub_menu_start_y = (main_button_y + main_button_height) - (
+                3 * 18
+            )  # 3 buttons
+            # Check Invert Selection button area
+            invert_selection_rect = QRect(main_button_x, sub_menu_start_y + 0, 22, 18)
+            # Check Select None button area
+            select_none_rect = QRect(main_button_x, sub_menu_start_y + 18, 22, 18)
+            # Check Select All button area
+            select_all_rect = QRect(main_button_x, sub_menu_start_y + 36, 22, 18)
 
-                    if (
-                        invert_selection_rect.contains(pos)
-                        or select_none_rect.contains(pos)
-                        or select_all_rect.contains(pos)
-                    ):
-                        return True
+            if (
+                invert_selection_rect.contains(pos)
+                or select_none_rect.contains(pos)
+                or select_all_rect.contains(pos)
+            ):
+                return True
 
-                elif menu_id == "misc":
-                    sub_menu_start_y = (main_button_y + main_button_height) - (
-                        3 * 18
-                    )  # 3 buttons
-                    # Check Sort List button area
-                    sort_list_rect = QRect(main_button_x, sub_menu_start_y + 0, 22, 18)
-                    # Check File Info button area
-                    file_info_rect = QRect(main_button_x, sub_menu_start_y + 18, 22, 18)
-                    # Check Misc Options button area
-                    misc_options_rect = QRect(
-                        main_button_x, sub_menu_start_y + 36, 22, 18
-                    )
+        elif menu_id == "misc":
+            sub_menu_start_y = (main_button_y + main_button_height) - (
+                3 * 18
+            )  # 3 buttons
+            # Check Sort List button area
+            sort_list_rect = QRect(main_button_x, sub_menu_start_y + 0, 22, 18)
+            # Check File Info button area
+            file_info_rect = QRect(main_button_x, sub_menu_start_y + 18, 22, 18)
+            # Check Misc Options button area
+            misc_options_rect = QRect(main_button_x, sub_menu_start_y + 36, 22, 18)
 
-                    if (
-                        sort_list_rect.contains(pos)
-                        or file_info_rect.contains(pos)
-                        or misc_options_rect.contains(pos)
-                    ):
-                        return True
+            if (
+                sort_list_rect.contains(pos)
+                or file_info_rect.contains(pos)
+                or misc_options_rect.contains(pos)
+            ):
+                return True
 
-                elif menu_id == "list":
-                    sub_menu_start_y = (main_button_y + main_button_height) - (
-                        3 * 18
-                    )  # 3 buttons
-                    # Check New List button area
-                    new_list_rect = QRect(main_button_x, sub_menu_start_y + 0, 22, 18)
-                    # Check Save List button area
-                    save_list_rect = QRect(main_button_x, sub_menu_start_y + 18, 22, 18)
-                    # Check Load List button area
-                    load_list_rect = QRect(main_button_x, sub_menu_start_y + 36, 22, 18)
+        elif menu_id == "list":
+            sub_menu_start_y = (main_button_y + main_button_height) - (
+                3 * 18
+            )  # 3 buttons
+            # Check New List button area
+            new_list_rect = QRect(main_button_x, sub_menu_start_y + 0, 22, 18)
+            # Check Save List button area
+            save_list_rect = QRect(main_button_x, sub_menu_start_y + 18, 22, 18)
+            # Check Load List button area
+            load_list_rect = QRect(main_button_x, sub_menu_start_y + 36, 22, 18)
 
-                    if (
-                        new_list_rect.contains(pos)
-                        or save_list_rect.contains(pos)
-                        or load_list_rect.contains(pos)
-                    ):
-                        return True
+            if (
+                new_list_rect.contains(pos)
+                or save_list_rect.contains(pos)
+                or load_list_rect.contains(pos)
+            ):
+                return True
 
         return False
 
@@ -4142,20 +4325,27 @@ class PlaylistWindow(QWidget):
                 "Failed to load playlist window specification after skin change.",
             )
             return
+        self._parse_bottom_bar_y()
+        self._index_sprites()
+        self._parse_close_button_position()
 
-        # Update the scrollbar manager with the new sprite manager
-        self.scrollbar_manager.update_sprite_manager(sprite_manager)
-        self.scrollbar_manager.extracted_skin_dir = self.extracted_skin_dir
+        # Update the scrollbar manager with the new spec; it draws its sprites
+        # through _get_sprite_pixmap, whose cache _index_sprites just reset
+        self.scrollbar_manager.set_playlist_spec(self.playlist_spec)
 
         # Update the menu manager and buttonbar manager if needed
+        self.menu_manager.set_playlist_spec(self.playlist_spec)
+        self.buttonbar_manager.set_playlist_spec(self.playlist_spec)
         # Update any other necessary components
 
         # Reload font settings and colors from pledit.txt
+        self._pledit_values = self._read_pledit_txt()
         self._load_playlist_font_settings()  # Load font settings from pledit.txt
         self._load_pledit_colors()  # Reload the color settings
 
         # Recalculate the font with new settings
         self.playlist_font = QFont(self.playlist_font_name, self.playlist_font_size)
+        self._track_line_cache.clear()
 
         # Apply region mask if available
         self.apply_region_mask()
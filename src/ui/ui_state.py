@@ -1,26 +1,54 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+# Bits of UIState.pressed_mask for buttons that stay pressed only until the mouse is
+# released. Lower bits are released first when several are set.
+PRESS_PREVIOUS = 1 << 0
+PRESS_NEXT = 1 << 1
+PRESS_EJECT = 1 << 2
+PRESS_EQ = 1 << 3
+PRESS_PLAYLIST = 1 << 4
+PRESS_SHUFFLE = 1 << 5
+PRESS_REPEAT = 1 << 6
+PRESS_OPTIONS = 1 << 7
+PRESS_ALWAYS_ON_TOP = 1 << 8
+PRESS_FILE_INFO = 1 << 9
+PRESS_DOUBLE_SIZE = 1 << 10
+PRESS_VISUALIZATION_MENU = 1 << 11
 
-@dataclass
+_MISSING = object()
+
+
+def _pressed_flag(bit: int) -> property:
+    """Expose one bit of pressed_mask as a boolean attribute."""
+
+    def getter(self) -> bool:
+        return bool(self.pressed_mask & bit)
+
+    def setter(self, value: bool):
+        if value:
+            self.pressed_mask |= bit
+        else:
+            self.pressed_mask &= ~bit
+
+    return property(getter, setter)
+
+
+@dataclass(slots=True)
 class UIState:
-    """A dataclass to hold the UI state of the main window."""
+    """A dataclass to hold the UI state of the main window.
+
+    Slotted, since the renderer and mouse handlers read these attributes constantly.
+    """
 
     volume: float = 0.5
     balance: float = 0.0
     position: float = 0.0
     playlist_button_on: bool = False
     eq_button_on: bool = False
-    is_previous_pressed: bool = False
     is_play_pressed: bool = False
     is_pause_pressed: bool = False
     is_stop_pressed: bool = False
-    is_next_pressed: bool = False
-    is_eject_pressed: bool = False
-    is_eq_pressed: bool = False
-    is_playlist_pressed: bool = False
-    is_shuffle_pressed: bool = False
-    is_repeat_pressed: bool = False
     is_volume_dragged: bool = False
     is_balance_dragged: bool = False
     shuffle_on: bool = False
@@ -33,10 +61,33 @@ class UIState:
     is_vbr: bool = False
     is_playing: bool = False
     is_paused: bool = False
-    is_options_pressed: bool = False
-    is_always_on_top_pressed: bool = False
-    is_file_info_pressed: bool = False
-    is_double_size_pressed: bool = False
-    is_visualization_menu_pressed: bool = False
     dragging_position: bool = False
     album_art_visible: bool = False
+    # Momentary button presses, one PRESS_* bit per button
+    pressed_mask: int = 0
+    # Set whenever an attribute changes value; cleared by consume_dirty()
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
+
+    is_previous_pressed = _pressed_flag(PRESS_PREVIOUS)
+    is_next_pressed = _pressed_flag(PRESS_NEXT)
+    is_eject_pressed = _pressed_flag(PRESS_EJECT)
+    is_eq_pressed = _pressed_flag(PRESS_EQ)
+    is_playlist_pressed = _pressed_flag(PRESS_PLAYLIST)
+    is_shuffle_pressed = _pressed_flag(PRESS_SHUFFLE)
+    is_repeat_pressed = _pressed_flag(PRESS_REPEAT)
+    is_options_pressed = _pressed_flag(PRESS_OPTIONS)
+    is_always_on_top_pressed = _pressed_flag(PRESS_ALWAYS_ON_TOP)
+    is_file_info_pressed = _pressed_flag(PRESS_FILE_INFO)
+    is_double_size_pressed = _pressed_flag(PRESS_DOUBLE_SIZE)
+    is_visualization_menu_pressed = _pressed_flag(PRESS_VISUALIZATION_MENU)
+
+    def __setattr__(self, name, value):
+        if getattr(self, name, _MISSING) != value:
+            object.__setattr__(self, "_dirty", True)
+        object.__setattr__(self, name, value)
+
+    def consume_dirty(self) -> bool:
+        """Return whether any attribute changed since the last call, and reset the flag."""
+        dirty = self._dirty
+        object.__setattr__(self, "_dirty", False)
+        return dirty
@@ -24,6 +24,10 @@ class ScrollingTextRenderer:
         self.is_scrolling = False
         self.current_text = ""
         self.formatted_text = ""
+        # (track_title, playlist_index, duration) the formatted text was built from,
+        # so it is only rebuilt when the track changes rather than on every paint
+        self._formatted_key = None
+        self._safe_main_text = ""
 
     def _format_track_title(self, track_title, playlist_index, duration):
         """
@@ -64,14 +68,18 @@ class ScrollingTextRenderer:
         """
         Render the track title with scrolling functionality when it exceeds max_width.
         """
-        # Format the track title according to specification
-        self.formatted_text = self._format_track_title(
-            track_title, playlist_index, duration
-        )
-
-        # Check if all characters in the formatted text are available in the text renderer
-        # If any character is not available, we'll render a simplified version
-        safe_main_text = self._ensure_safe_text(self.formatted_text)
+        formatted_key = (track_title, playlist_index, duration)
+        if formatted_key != self._formatted_key:
+            # Format the track title according to specification
+            self.formatted_text = self._format_track_title(
+                track_title, playlist_index, duration
+            )
+
+            # Check if all characters in the formatted text are available in the text renderer
+            # If any character is not available, we'll render a simplified version
+            self._safe_main_text = self._ensure_safe_text(self.formatted_text)
+            self._formatted_key = formatted_key
+        safe_main_text = self._safe_main_text
 
         # The "***" and space should always be safe since they're standard ASCII characters
         # but we'll make sure they're included in the extended text
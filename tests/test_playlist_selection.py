@@ -0,0 +1,85 @@
+import os
+import sys
+
+# Add src to the path so we can import the modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.ui.playlist_selection import PlaylistSelection
+
+
+def test_empty_selection():
+    selection = PlaylistSelection()
+    assert not selection
+    assert len(selection) == 0
+    assert list(selection) == []
+    assert selection.first() == -1
+    assert 0 not in selection
+    assert -1 not in selection
+
+
+def test_add_and_remove():
+    selection = PlaylistSelection()
+    selection.add(3)
+    selection.add(70)
+    assert 3 in selection
+    assert 70 in selection
+    assert 4 not in selection
+    assert len(selection) == 2
+
+    selection.remove(3)
+    assert 3 not in selection
+    # Removing an unselected index is a no-op
+    selection.remove(5)
+    assert list(selection) == [70]
+
+
+def test_toggle():
+    selection = PlaylistSelection()
+    selection.toggle(2)
+    assert 2 in selection
+    selection.toggle(2)
+    assert 2 not in selection
+
+
+def test_add_range_is_half_open():
+    selection = PlaylistSelection()
+    selection.add(0)
+    selection.add_range(5, 9)
+    assert list(selection) == [0, 5, 6, 7, 8]
+
+    # Empty and reversed ranges select nothing
+    selection.add_range(12, 12)
+    selection.add_range(20, 15)
+    assert list(selection) == [0, 5, 6, 7, 8]
+
+
+def test_invert():
+    selection = PlaylistSelection()
+    selection.add_range(1, 3)
+    # Indices at or beyond count are dropped, like rebuilding from range(count)
+    selection.add(10)
+    selection.invert(5)
+    assert list(selection) == [0, 3, 4]
+
+    selection.invert(5)
+    assert list(selection) == [1, 2]
+
+
+def test_first_and_iteration_order():
+    selection = PlaylistSelection()
+    for index in (42, 7, 300, 8):
+        selection.add(index)
+    assert selection.first() == 7
+    assert list(selection) == [7, 8, 42, 300]
+    assert sorted(selection, reverse=True) == [300, 42, 8, 7]
+
+
+def test_clear_and_copy():
+    selection = PlaylistSelection()
+    selection.add_range(0, 4)
+    copy = selection.copy()
+    selection.clear()
+    assert not selection
+    assert selection.first() == -1
+    # The copy is independent of the original
+    assert list(copy) == [0, 1, 2, 3]